@@ -0,0 +1,236 @@
+"""
+Benchmark suite of the client against a local stand-in of the FMD API.
+
+Starts `benchmarks.server` in a subprocess, so its CPU time isn't counted, then calls
+every endpoint of `Stock`, `ETF` and `Index` in turn through the public API,
+sequentially, from a pool of threads and from concurrent tasks of `AsyncFmdApi`.
+Reports requests/sec, p50/p99 latency, CPU time per decoded row and the peak memory
+traced while running, and stores them as JSON so runs of different versions can be
+compared with `--compare`.
+
+Usage:
+    python -m benchmarks.bench_client --requests 1000 --workers 16 --latency 0.005
+    python -m benchmarks.bench_client --compare benchmarks/results/0.5.0.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any, Callable
+
+from fmd import AsyncFmdApi, FmdApi, __version__
+from fmd.retry import RetryPolicy
+
+# NOTE: Calls as (manager, symbol, method), `None` calls the method of the manager
+CALLS: list[tuple[str, str | None, str]] = [
+    ('stock', None, 'get_available_list'),
+    *(
+        ('stock', symbol, method)
+        for symbol in ('2330', '2317')
+        for method in (
+            'get_price',
+            'get_vm',
+            'get_dividend',
+            'get_company',
+            'get_revenue',
+            'get_financial_ratio',
+            'get_balance_sheet',
+            'get_income_statement',
+            'get_margin_balance',
+            'get_institution_trade_summary',
+            'get_cash_flow_statement',
+        )
+    ),
+    ('etf', None, 'get_available_list'),
+    *(
+        ('etf', '0050', method)
+        for method in (
+            'get_price',
+            'get_dividend',
+            'get_profile',
+            'get_margin_balance',
+            'get_institution_trade_summary',
+        )
+    ),
+    ('index', None, 'get_available_list'),
+    ('index', 'IX0001', 'get_price'),
+    ('index', 'IX0001', 'get_profile'),
+]
+
+
+def start_server(args: argparse.Namespace) -> tuple[subprocess.Popen, str]:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            '-m',
+            'benchmarks.server',
+            '--port=0',
+            f'--latency={args.latency}',
+            f'--rows={args.rows}',
+            f'--error-rate={args.error_rate}',
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    return process, process.stdout.readline().strip()
+
+
+def make_client(cls: type[FmdApi], url: str) -> FmdApi:
+    fa = cls(retry=RetryPolicy(backoff_base=0.01, deadline=None))
+    fa._url = url
+    return fa
+
+
+def get_target(fa: FmdApi, call: tuple[str, str | None, str]) -> Callable[[], Any]:
+    manager, symbol, method = call
+    obj = getattr(fa, manager)
+    if symbol is not None:
+        obj = obj.get(symbol)
+    return getattr(obj, method)
+
+
+def count_rows(data: Any) -> int:
+    return len(data) if isinstance(data, list) else 1
+
+
+def run_sync(fa: FmdApi, calls: list, workers: int) -> tuple[list[float], int]:
+    def send(call: tuple[str, str | None, str]) -> tuple[float, int]:
+        started = time.perf_counter()
+        rows = count_rows(get_target(fa, call)())
+        return time.perf_counter() - started, rows
+
+    if workers == 1:
+        results = [send(call) for call in calls]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(send, calls))
+    return [latency for latency, _ in results], sum(rows for _, rows in results)
+
+
+def run_async(fa: AsyncFmdApi, calls: list, workers: int) -> tuple[list[float], int]:
+    async def main() -> list[tuple[float, int]]:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def send(call: tuple[str, str | None, str]) -> tuple[float, int]:
+            async with semaphore:
+                started = time.perf_counter()
+                rows = count_rows(await get_target(fa, call)())
+                return time.perf_counter() - started, rows
+
+        try:
+            return await asyncio.gather(*(send(call) for call in calls))
+        finally:
+            await fa._client.aclose()
+
+    results = asyncio.run(main())
+    return [latency for latency, _ in results], sum(rows for _, rows in results)
+
+
+def measure(mode: str, url: str, calls: list, workers: int) -> dict[str, Any]:
+    def run() -> tuple[FmdApi, float, float, list[float], int]:
+        is_async = mode == 'async'
+        fa = make_client(AsyncFmdApi if is_async else FmdApi, url)
+        runner = run_async if is_async else run_sync
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        latencies, rows = runner(fa, calls, 1 if mode == 'sequential' else workers)
+        return fa, time.perf_counter() - wall, time.process_time() - cpu, latencies, rows
+
+    fa, wall, cpu, latencies, rows = run()
+    # NOTE: Tracing slows allocations down, so the peak is measured in a second run
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'requests': len(calls),
+        'rows': rows,
+        'requests_per_sec': len(calls) / wall,
+        'p50_ms': quantiles[49] * 1000,
+        'p99_ms': quantiles[98] * 1000,
+        'cpu_per_row_us': cpu / rows * 1e6,
+        'peak_memory_mib': peak / 1024**2,
+        'retries': sum(fa.metrics.retries.values()),
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    print(f'\nChange against {baseline["fmd"]} ({baseline["created_at"]}):')
+    for mode, result in results['results'].items():
+        before = baseline['results'].get(mode)
+        if before is None:
+            continue
+        changes = '  '.join(
+            f'{name} {(result[name] / before[name] - 1) * 100:+6.1f}%'
+            for name in ('requests_per_sec', 'p99_ms', 'cpu_per_row_us', 'peak_memory_mib')
+            if before[name]
+        )
+        print(f'{mode:<12} {changes}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--rows', type=int, default=250)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--modes', nargs='+', default=['sequential', 'threaded', 'async'])
+    parser.add_argument(
+        '--output', type=Path, default=Path(f'benchmarks/results/{__version__}.json')
+    )
+    parser.add_argument('--compare', type=Path, help='Results of a previous run.')
+    args = parser.parse_args()
+
+    calls = list(islice(cycle(CALLS), args.requests))
+    process, url = start_server(args)
+    try:
+        print(
+            f'{args.requests} requests, {args.workers} workers, {args.rows} rows, '
+            f'{args.latency * 1000:.0f} ms server latency, {args.error_rate:.1%} errors'
+        )
+        results: dict[str, Any] = {}
+        for mode in args.modes:
+            result = results[mode] = measure(mode, url, calls, args.workers)
+            print(
+                f'{mode:<12} {result["requests_per_sec"]:>8.0f} req/s  '
+                f'p50 {result["p50_ms"]:>6.1f} ms  p99 {result["p99_ms"]:>6.1f} ms  '
+                f'{result["cpu_per_row_us"]:>5.2f} us CPU/row  '
+                f'{result["peak_memory_mib"]:>6.1f} MiB peak  {result["retries"]} retries'
+            )
+    finally:
+        process.terminate()
+        process.wait()
+
+    report = {
+        'fmd': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'config': {
+            name: getattr(args, name)
+            for name in ('requests', 'workers', 'latency', 'rows', 'error_rate')
+        },
+        'results': results,
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f'Results written to {args.output}')
+    if args.compare is not None:
+        compare(report, json.loads(args.compare.read_text()))
+
+
+if __name__ == '__main__':
+    main()
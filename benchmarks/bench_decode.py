@@ -0,0 +1,68 @@
+"""
+Benchmark of the JSON decoders available to `FmdApi`.
+
+Decodes a synthetic response of daily prices, comparing `requests.Response.json()`,
+which decodes the bytes to text before parsing, with decoding `Response.content`
+directly through every installed decoder.
+
+Usage:
+    python -m benchmarks.bench_decode --rows 100000 --repeat 20
+"""
+
+import argparse
+import json
+import timeit
+from datetime import date, timedelta
+
+import requests
+
+from fmd.decoders import DECODERS, get_decoder
+
+
+def make_content(rows: int) -> bytes:
+    start = date(2004, 1, 1)
+    data = [
+        {
+            'date': (start + timedelta(days=i)).isoformat(),
+            'symbol': '2330',
+            'open': f'{500 + i % 100:.2f}',
+            'high': f'{505 + i % 100:.2f}',
+            'low': f'{495 + i % 100:.2f}',
+            'close': f'{502 + i % 100:.2f}',
+            'volume': f'{20000000 + i:.2f}',
+            'values': f'{10000000000 + i:.2f}',
+        }
+        for i in range(rows)
+    ]
+    return json.dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    content = make_content(args.rows)
+    res = requests.Response()
+    res._content = content
+    res.encoding = None
+
+    candidates = {'requests.Response.json': res.json}
+    for name in DECODERS:
+        try:
+            decode = get_decoder(name)
+        except ImportError:
+            continue
+        candidates[name] = lambda decode=decode: decode(content)
+
+    print(f'{args.rows} rows, {len(content) / 1024**2:.1f} MiB')
+    baseline = None
+    for name, func in candidates.items():
+        secs = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        baseline = baseline or secs
+        print(f'{name:<24}{secs * 1000:>10.1f} ms{baseline / secs:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
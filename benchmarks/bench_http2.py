@@ -0,0 +1,201 @@
+"""
+Benchmark of `HttpxBackend` over HTTP/2 against `RequestsBackend` over HTTP/1.1.
+
+Starts two local stand-in servers returning the same JSON payload after a fixed
+latency, one speaking HTTP/1.1 with keep-alive and one speaking cleartext HTTP/2
+(`h2c`), then sends the same number of small requests through `FmdApi` from a pool
+of threads, reporting throughput, p50/p99 latency and the connections opened.
+TLS is not used, so the handshakes saved by HTTP/2 in production are not measured.
+
+Usage:
+    python -m benchmarks.bench_http2 --requests 2000 --workers 32 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fmd import FmdApi
+from fmd.backend import HttpxBackend, RequestsBackend
+
+
+def make_body(rows: int) -> bytes:
+    data = [
+        {'date': f'2024-01-{i % 28 + 1:02}', 'symbol': '2330', 'close': f'{590 + i:.2f}'}
+        for i in range(rows)
+    ]
+    return json.dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode()
+
+
+class Http1Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, body: bytes, latency: float) -> None:
+        self.body = body
+        self.latency = latency
+        self.connections = 0
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(handler) -> None:
+                time.sleep(self.latency)
+                handler.send_response(200)
+                handler.send_header('Content-Type', 'application/json')
+                handler.send_header('Content-Length', str(len(self.body)))
+                handler.end_headers()
+                handler.wfile.write(self.body)
+
+            def log_message(handler, *args) -> None:
+                pass
+
+        super().__init__(('127.0.0.1', 0), Handler)
+
+    def process_request(self, request, client_address) -> None:
+        self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/stock/2330/price'
+
+
+class H2Protocol(asyncio.Protocol):
+    def __init__(self, server: 'Http2Server') -> None:
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+
+        self.server = server
+        self.conn = H2Connection(H2Configuration(client_side=False, header_encoding='utf-8'))
+        self.pending: dict[int, bytes] = {}
+
+    def connection_made(self, transport) -> None:
+        self.server.connections += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        from h2 import events
+
+        for event in self.conn.receive_data(data):
+            if isinstance(event, events.RequestReceived):
+                loop = asyncio.get_running_loop()
+                loop.call_later(self.server.latency, self.respond, event.stream_id)
+            elif isinstance(event, events.WindowUpdated):
+                for stream_id in list(self.pending):
+                    self.flush(stream_id)
+            elif isinstance(event, events.ConnectionTerminated):
+                self.transport.close()
+        self.transport.write(self.conn.data_to_send())
+
+    def respond(self, stream_id: int) -> None:
+        body = self.server.body
+        headers = [
+            (':status', '200'),
+            ('content-type', 'application/json'),
+            ('content-length', str(len(body))),
+        ]
+        self.conn.send_headers(stream_id, headers)
+        self.pending[stream_id] = body
+        self.flush(stream_id)
+        self.transport.write(self.conn.data_to_send())
+
+    def flush(self, stream_id: int) -> None:
+        data = self.pending[stream_id]
+        while data:
+            size = min(
+                self.conn.local_flow_control_window(stream_id),
+                self.conn.max_outbound_frame_size,
+                len(data),
+            )
+            if size <= 0:
+                break
+            self.conn.send_data(stream_id, data[:size])
+            data = data[size:]
+        if data:
+            self.pending[stream_id] = data
+        else:
+            del self.pending[stream_id]
+            self.conn.end_stream(stream_id)
+
+
+class Http2Server:
+    def __init__(self, body: bytes, latency: float) -> None:
+        self.body = body
+        self.latency = latency
+        self.connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            self._loop.create_server(lambda: H2Protocol(self), '127.0.0.1', 0)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def serve_forever(self) -> None:
+        self._loop.run_forever()
+
+    def shutdown(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.port}/stock/2330/price'
+
+
+def run(fa: FmdApi, url: str, requests: int, workers: int) -> tuple[float, list[float]]:
+    def send(_: int) -> float:
+        started = time.perf_counter()
+        fa.send_request('get', url)
+        return time.perf_counter() - started
+
+    send(0)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = list(executor.map(send, range(requests)))
+    return time.perf_counter() - started, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=32)
+    parser.add_argument('--latency', type=float, default=0.01)
+    parser.add_argument('--rows', type=int, default=20)
+    args = parser.parse_args()
+
+    body = make_body(args.rows)
+    cases = {
+        'requests HTTP/1.1': (
+            Http1Server(body, args.latency),
+            lambda: RequestsBackend(pool_maxsize=args.workers, sessions='shared'),
+        ),
+        'httpx HTTP/2': (
+            Http2Server(body, args.latency),
+            lambda: HttpxBackend(http1=False, max_connections=args.workers),
+        ),
+    }
+    print(
+        f'{args.requests} requests, {args.workers} threads, {len(body)} B body, '
+        f'{args.latency * 1000:.0f} ms server latency'
+    )
+    for name, (server, make_backend) in cases.items():
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        fa = FmdApi(backend=make_backend())
+        elapsed, latencies = run(fa, server.url, args.requests, args.workers)
+        server.shutdown()
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f'{name:<20} {args.requests / elapsed:>8.0f} req/s  '
+            f'p50 {quantiles[49] * 1000:>6.1f} ms  p99 {quantiles[98] * 1000:>6.1f} ms  '
+            f'{server.connections:>3} connections'
+        )
+
+
+if __name__ == '__main__':
+    main()
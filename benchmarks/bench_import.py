@@ -0,0 +1,90 @@
+"""
+Benchmark of the startup cost of `fmd`.
+
+Times each scenario in fresh interpreters, from importing the package to creating a
+client, touching a resource and sending the first request, which loads the HTTP stack,
+and lists the slowest modules imported by using a resource, according to `-X importtime`.
+With `--max-ms` it exits with an error when `import fmd` gets slower, so it can guard
+against regressions in CI.
+
+Usage:
+    python -m benchmarks.bench_import --runs 20 --max-ms 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    'import fmd': 'import fmd',
+    'FmdApi()': 'from fmd import FmdApi; FmdApi()',
+    'fa.stock.get()': 'from fmd import FmdApi; FmdApi().stock.get("2330")',
+    'first request': (
+        'from unittest.mock import patch, MagicMock\n'
+        'from fmd import FmdApi\n'
+        'res = MagicMock(status_code=200, content=b\'{"status": "success", "data": []}\')\n'
+        'with patch("requests.Session.request", return_value=res):\n'
+        '    FmdApi().stock.get("2330").get_company()'
+    ),
+}
+
+
+def time_scenario(code: str) -> float:
+    """Returns the seconds `code` takes in a new interpreter."""
+    # NOTE: `unittest.mock` is imported before the timer, so only fmd and its imports count
+    script = (
+        'import time, unittest.mock\n'
+        'started = time.perf_counter()\n'
+        f'{code}\n'
+        'print(time.perf_counter() - started)'
+    )
+    out = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def get_imports(code: str) -> dict[str, float]:
+    """Returns the cumulative milliseconds of every top-level import of `code`."""
+    out = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True
+    )
+    imports = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # NOTE: Nested imports are indented, their time is part of their parent's
+        if name.startswith(' ') and not name.startswith('  '):
+            imports[name.strip()] = int(cumulative) / 1000
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, help='Fail when `import fmd` is slower.')
+    args = parser.parse_args()
+
+    print(f'Median and min of {args.runs} fresh interpreters')
+    medians = {}
+    for name, code in SCENARIOS.items():
+        times = [time_scenario(code) * 1000 for _ in range(args.runs)]
+        medians[name] = statistics.median(times)
+        print(f'{name:<16} {medians[name]:>7.1f} ms  min {min(times):>7.1f} ms')
+
+    print(f'\nSlowest imports of `{SCENARIOS["fa.stock.get()"]}`:')
+    startup = get_imports('pass')
+    imports = get_imports(SCENARIOS['fa.stock.get()'])
+    slowest = sorted(
+        ((ms, name) for name, ms in imports.items() if name not in startup), reverse=True
+    )
+    for ms, name in slowest[: args.top]:
+        print(f'{ms:>7.1f} ms  {name}')
+
+    if args.max_ms is not None and medians['import fmd'] > args.max_ms:
+        sys.exit(f'`import fmd` took {medians["import fmd"]:.1f} ms, over {args.max_ms} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Memory benchmark of compact records against the default row dicts.
+
+Decodes a synthetic response of daily margin balances, like a 10-year pull of many
+stocks, and compares the memory retained by the decoded `dict` rows with the memory
+retained by the records of `as_='records'`.
+
+Usage:
+    python -m benchmarks.bench_records --symbols 100 --days 2500
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from datetime import date, timedelta
+
+from fmd.formats import get_schema, to_records
+from fmd.resources.stock.types import StockMarginBalance
+
+
+def make_content(symbols: int, days: int) -> bytes:
+    start = date(2014, 1, 1)
+    fields = [name for name in get_schema(StockMarginBalance) if name not in ('date', 'symbol')]
+    data = [
+        {
+            'date': (start + timedelta(days=i)).isoformat(),
+            'symbol': str(1000 + s),
+            **{name: 1000 * j + i for j, name in enumerate(fields)},
+        }
+        for s in range(symbols)
+        for i in range(days)
+    ]
+    return json.dumps(data).encode()
+
+
+def measure(content: bytes, as_records: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(content)
+    if as_records:
+        rows = to_records(rows, StockMarginBalance)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--symbols', type=int, default=100)
+    parser.add_argument('--days', type=int, default=2500)
+    args = parser.parse_args()
+
+    content = make_content(args.symbols, args.days)
+    rows = args.symbols * args.days
+    print(f'{rows} rows of StockMarginBalance')
+    baseline = measure(content, as_records=False)
+    for name, size in (('dict', baseline), ('records', measure(content, as_records=True))):
+        print(
+            f'{name:<10} {size / 1024**2:>8.1f} MiB  {size / rows:>6.0f} B/row  '
+            f'{size / baseline:>5.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
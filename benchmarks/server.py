@@ -0,0 +1,207 @@
+"""
+Local stand-in of the FMD API for benchmarks.
+
+Serves every endpoint of `Stock`, `ETF` and `Index` with JSON payloads shaped like the
+real responses, generated from the fields of the resource types. Every response is
+delayed by `latency` seconds, list endpoints return `rows` rows, and a share of the
+requests given by `error_rate` fails with `503`, so retries are exercised too.
+
+Usage:
+    python -m benchmarks.server --port 8000 --latency 0.01 --rows 250 --error-rate 0.01
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+from fmd.formats import get_schema
+from fmd.hooks import get_endpoint_template
+from fmd.resources.etf.types import (
+    ETFDividend,
+    ETFInstitutionTradeSummary,
+    ETFMarginBalance,
+    ETFPrice,
+    ETFProfile,
+)
+from fmd.resources.index.types import IndexPrice, IndexProfile
+from fmd.resources.stock.types import (
+    BalanceSheet,
+    CashFlowStatement,
+    FinancialRatio,
+    IncomeStatement,
+    Revenue,
+    StockCompany,
+    StockDividend,
+    StockInstitutionTradeSummary,
+    StockMarginBalance,
+    StockPrice,
+    StockProfile,
+    ValuationMeasurement,
+)
+
+# NOTE: Endpoint templates with the data type of their rows, and whether they return a list
+ENDPOINTS: dict[str, tuple[type, bool]] = {
+    '/stock': (StockProfile, True),
+    '/stock/{symbol}/price': (StockPrice, True),
+    '/stock/{symbol}/vm': (ValuationMeasurement, True),
+    '/stock/{symbol}/dividend': (StockDividend, True),
+    '/stock/{symbol}/company': (StockCompany, False),
+    '/stock/{symbol}/revenue': (Revenue, True),
+    '/stock/{symbol}/financial-ratio': (FinancialRatio, True),
+    '/stock/{symbol}/balance-sheet': (BalanceSheet, True),
+    '/stock/{symbol}/income-statement': (IncomeStatement, True),
+    '/stock/{symbol}/margin-balance': (StockMarginBalance, True),
+    '/stock/{symbol}/institution-trade-summary': (StockInstitutionTradeSummary, True),
+    '/stock/{symbol}/cash-flow-statement': (CashFlowStatement, True),
+    '/etf': (ETFProfile, True),
+    '/etf/{symbol}/price': (ETFPrice, True),
+    '/etf/{symbol}/dividend': (ETFDividend, True),
+    '/etf/{symbol}/profile': (ETFProfile, False),
+    '/etf/{symbol}/margin-balance': (ETFMarginBalance, True),
+    '/etf/{symbol}/institution-trade-summary': (ETFInstitutionTradeSummary, True),
+    '/index': (IndexProfile, True),
+    '/index/{symbol}/price': (IndexPrice, True),
+    '/index/{symbol}/profile': (IndexProfile, False),
+}
+
+
+def make_row(data_type: type, symbol: str, i: int) -> dict[str, Any]:
+    row: dict[str, Any] = {}
+    for name, kind in get_schema(data_type).items():
+        if name == 'symbol':
+            row[name] = symbol
+        elif kind == 'date':
+            row[name] = (date(2024, 12, 31) - timedelta(days=i)).isoformat()
+        elif kind == 'int':
+            row[name] = 2024 - i // 12 if name == 'year' else i % 12 + 1
+        elif kind == 'text':
+            row[name] = f'{name}-{symbol}'
+        else:
+            row[name] = f'{1000 + (i * 7919 + len(name) * 104729) % 100000 / 100:.2f}'
+    return row
+
+
+@lru_cache(maxsize=1024)
+def make_body(path: str, rows: int) -> bytes | None:
+    """Returns the JSON body of a path, `None` for unknown paths."""
+    endpoint = get_endpoint_template(path)
+    if endpoint not in ENDPOINTS:
+        return None
+    data_type, many = ENDPOINTS[endpoint]
+    parts = path.split('/')
+    symbol = parts[2] if len(parts) > 2 else '2330'
+    if many:
+        data: Any = [
+            make_row(data_type, symbol if len(parts) > 2 else str(1000 + i), i) for i in range(rows)
+        ]
+    else:
+        data = make_row(data_type, symbol, 0)
+    return json.dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode()
+
+
+class FakeFmdServer(ThreadingHTTPServer):
+    """
+    HTTP/1.1 server answering like the FMD API, see the module docstring.
+
+    Parameters:
+        port (int): The port to listen on, `0` picks a free one.
+        latency (float): Seconds every response is delayed.
+        rows (int): The number of rows of list responses.
+        error_rate (float): The share of requests failing with `503`.
+        seed (int | None): The seed of the failures, for repeatable runs.
+
+    Attributes:
+        requests (int): Number of requests received.
+        errors (int): Number of requests failed on purpose.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        rows: int = 250,
+        error_rate: float = 0.0,
+        seed: int | None = 0,
+    ) -> None:
+        self.latency = latency
+        self.rows = rows
+        self.error_rate = error_rate
+        self.requests = 0
+        self.errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        super().__init__(('127.0.0.1', port), Handler)
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/api/v1'
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            self.errors += failed
+            return failed
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # NOTE: Headers and body are written separately, don't wait for delayed ACKs
+    disable_nagle_algorithm = True
+    server: FakeFmdServer
+
+    def do_GET(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        path = re.sub(r'^/api/v\d+', '', urlsplit(self.path).path)
+        if self.server.should_fail():
+            self.send_body(503, {'status': 'error', 'msg': 'Service Unavailable'})
+            return
+        body = make_body(path, self.server.rows)
+        if body is None:
+            self.send_body(404, {'status': 'error', 'msg': 'Not Found'})
+            return
+        self.send_body(200, body)
+
+    def send_body(self, status_code: int, body: bytes | dict[str, Any]) -> None:
+        if isinstance(body, dict):
+            body = json.dumps(body).encode()
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--rows', type=int, default=250)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeFmdServer(args.port, args.latency, args.rows, args.error_rate)
+    # NOTE: The first line tells a parent process where to connect
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,25 @@
-from fmd.client import FmdApi
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fmd.client import AsyncFmdApi, FmdApi
 
 package_name = 'fmd'
 __version__ = '0.5.0'
-__all__ = ['FmdApi']
+__all__ = ['FmdApi', 'AsyncFmdApi']
+
+# NOTE: Loaded on first access (PEP 562), so `import fmd` doesn't import the HTTP stack
+_LAZY_ATTRS = {'FmdApi': 'fmd.client', 'AsyncFmdApi': 'fmd.client'}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,5 @@
+import sys
+
+from fmd.cli import main
+
+sys.exit(main())
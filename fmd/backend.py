@@ -1,13 +1,93 @@
-from enum import Enum
-from typing import Any, TypedDict, TypeVar
+import os
+import queue
+import socket
+import threading
+import time
+import weakref
+from datetime import timedelta
+from typing import Any, Literal
 
 import requests
-from typing_extensions import Literal
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+# NOTE: Defined in `fmd.types`, so resources don't import `requests`, kept here for compatibility
+from fmd.types import (  # noqa: F401
+    FailResponse,
+    JsonDict,
+    Response,
+    ResponseStatus,
+    ResponseType,
+    SuccessResponse,
+)
 
 
 class RequestsBackend:
-    def __init__(self) -> None:
-        self._client: requests.Session = requests.Session()
+    """
+    Backend built on `requests`.
+
+    Sessions are not guaranteed to be thread-safe, so by default every request checks
+    out an idle session from a pool and returns it afterwards. Threads of every
+    executor, including the short-lived ones of `get_many()` and chunked ranges, reuse
+    the same warm sessions and their connections, and the pool only grows to the peak
+    number of concurrent requests. Up to `pool_maxsize` idle sessions are kept, and with
+    `pool_block` requests wait for one of them instead of opening a new session.
+
+    `sessions='thread'` gives every thread its own session instead, and
+    `sessions='shared'` shares one session, so `pool_maxsize` caps the connections of
+    the whole process and `pool_block` makes threads wait for a free connection.
+
+    Sessions are recreated after a fork, so child processes never reuse the sockets
+    inherited from their parent.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.backend import RequestsBackend
+
+        fa = FmdApi(backend=RequestsBackend(pool_maxsize=64, pool_block=True))
+        ```
+
+    Parameters:
+        pool_connections (int): Number of hosts whose connection pools are cached.
+        pool_maxsize (int): Maximum number of idle sessions kept, and of connections kept
+            per host in the pool of a session.
+        pool_block (bool): Whether to wait for a free session, or a free connection of the
+            shared session, when the pool is exhausted.
+        keep_alive (bool): Whether to reuse connections, `False` closes them after every request.
+        tcp_keepalive (float | None): Idle seconds before TCP keep-alive probes are sent on
+            pooled connections, `None` leaves the system default.
+        sessions (str): How sessions are shared between threads, `pooled`, `thread` or `shared`.
+        accept_encoding (str | None): The `Accept-Encoding` header, `None` offers every encoding
+            urllib3 can decode, i.e. gzip and deflate, plus br and zstd when `brotli` and
+            `zstandard` are installed. Responses are decoded chunk by chunk as they arrive.
+    """
+
+    retryable_exceptions = (requests.ConnectionError, requests.Timeout)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        tcp_keepalive: float | None = None,
+        sessions: Literal['pooled', 'thread', 'shared'] = 'pooled',
+        accept_encoding: str | None = None,
+    ) -> None:
+        if sessions not in ('pooled', 'thread', 'shared'):
+            raise ValueError(f'Unknown sessions: {sessions}, expected pooled, thread or shared')
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.tcp_keepalive = tcp_keepalive
+        self.sessions = sessions
+        self.accept_encoding = accept_encoding or ACCEPT_ENCODING
+        self._lock = threading.Lock()
+        self._reset()
 
     def send_request(
         self,
@@ -17,40 +97,380 @@ class RequestsBackend:
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
     ) -> requests.Response:
-        res = self._client.request(
+        session = self._get_session()
+        try:
+            connect_timer.seconds = 0.0
+            started = time.perf_counter()
+            res = session.request(
+                method=method,
+                url=url,
+                params=params,
+                timeout=timeout,
+                json=json,
+            )
+            total = time.perf_counter() - started
+        finally:
+            if self.sessions == 'pooled':
+                self._put_session(session)
+        # NOTE: `elapsed` covers connecting and waiting for the headers, not the body
+        elapsed = getattr(res, 'elapsed', None)
+        if isinstance(elapsed, timedelta):
+            elapsed = elapsed.total_seconds()
+            res.timings = {
+                'connect': connect_timer.seconds,
+                'wait': max(elapsed - connect_timer.seconds, 0.0),
+                'download': max(total - elapsed, 0.0),
+            }
+        return res
+
+    def close(self) -> None:
+        """Closes the connections of every session."""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._reset()
+        for session in sessions:
+            session.close()
+
+    def _get_session(self) -> requests.Session:
+        """Returns the session of the request, to be put back with `_put_session()` when pooled."""
+        # NOTE: A forked child must not share the parent's sockets, so drop them
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+        if self.sessions == 'pooled':
+            return self._checkout()
+        if self.sessions == 'shared':
+            if self._shared is None:
+                with self._lock:
+                    if self._shared is None:
+                        self._shared = self._make_session()
+            return self._shared
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._make_session()
+        return session
+
+    def _checkout(self) -> requests.Session:
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            # NOTE: Last in first out, so the most recently used connections stay warm
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._make_session()
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+
+    def _put_session(self, session: requests.Session) -> None:
+        # NOTE: Sessions checked out before a fork or `close()` don't belong to the pool anymore
+        if session not in self._sessions:
+            session.close()
+            return
+        try:
+            self._idle.put_nowait(session)
+        except queue.Full:
+            self._sessions.discard(session)
+            session.close()
+        if self._slots is not None:
+            self._slots.release()
+
+    def _make_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = PoolAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            socket_options=get_socket_options(self.tcp_keepalive),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Accept-Encoding'] = self.accept_encoding
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        self._sessions.add(session)
+        return session
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._local = threading.local()
+        self._shared: requests.Session | None = None
+        self._idle: queue.LifoQueue[requests.Session] = queue.LifoQueue(self.pool_maxsize)
+        # NOTE: Caps the sessions checked out at once, when requests wait for a free one
+        self._slots = threading.BoundedSemaphore(self.pool_maxsize) if self.pool_block else None
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+
+
+connect_timer = threading.local()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Connection adding the seconds spent connecting to `connect_timer` of the thread."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds = (
+                getattr(connect_timer, 'seconds', 0.0) + time.perf_counter() - started
+            )
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """Connection adding the seconds spent connecting, including TLS, to `connect_timer`."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            connect_timer.seconds = (
+                getattr(connect_timer, 'seconds', 0.0) + time.perf_counter() - started
+            )
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` whose pooled connections are created with the given socket options,
+    and time how long connecting takes.
+    """
+
+    def __init__(self, socket_options: list[tuple[int, int, int]] | None = None, **kwargs: Any):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        socket_options = getattr(self, 'socket_options', None)
+        if socket_options is not None:
+            kwargs['socket_options'] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+def get_socket_options(tcp_keepalive: float | None) -> list[tuple[int, int, int]] | None:
+    """Returns the default socket options with TCP keep-alive enabled after `tcp_keepalive` seconds."""
+    if tcp_keepalive is None:
+        return None
+    options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    idle = int(max(tcp_keepalive, 1))
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):  # pragma: no cover
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    return options
+
+
+class HttpxBackend:
+    """
+    Backend built on `httpx.Client`, speaking HTTP/2 by default.
+
+    HTTP/2 multiplexes the concurrent requests of every thread as streams over a few
+    connections, which avoids a TLS handshake per connection and head-of-line blocking
+    between requests. HTTP/2 is negotiated during the TLS handshake, falling back to
+    HTTP/1.1 when the server doesn't support it. The client is thread-safe and is
+    recreated after a fork. Requires the optional `httpx` and `h2` dependencies.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.backend import HttpxBackend
+
+        fa = FmdApi(backend=HttpxBackend())
+        ```
+
+    Parameters:
+        http2 (bool): Whether to use HTTP/2.
+        http1 (bool): Whether to allow HTTP/1.1, `False` with `http2=True` speaks HTTP/2
+            without TLS negotiation, e.g. to a local `h2c` server.
+        max_connections (int): Maximum number of concurrent connections in the pool.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        accept_encoding (str | None): The `Accept-Encoding` header, `None` offers every encoding
+            httpx can decode, i.e. gzip and deflate, plus br and zstd when `brotli` and
+            `zstandard` are installed.
+    """
+
+    def __init__(
+        self,
+        http2: bool = True,
+        http1: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        accept_encoding: str | None = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                'httpx is required for HttpxBackend, install it with `pip install fmd[http2]`'
+            ) from e
+
+        self._httpx = httpx
+        self.http2 = http2
+        self.http1 = http1
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self.headers = get_encoding_headers(accept_encoding)
+        self.retryable_exceptions = (httpx.TransportError,)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._client = self._make_client()
+
+    def send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ):
+        timer = TraceTimer()
+        res = self._get_client().request(
             method=method,
             url=url,
-            params=params,
+            params=drop_none(params),
             timeout=timeout,
             json=json,
+            extensions={'trace': timer},
         )
+        res.timings = timer.timings
         return res
 
+    def close(self) -> None:
+        """Closes the connection pool."""
+        self._client.close()
 
-class JsonDict(TypedDict):
-    pass
+    def _get_client(self):
+        # NOTE: A forked child must not share the parent's sockets, so open new connections
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._client = self._make_client()
+                    self._pid = os.getpid()
+        return self._client
 
+    def _make_client(self):
+        return self._httpx.Client(
+            http1=self.http1, http2=self.http2, limits=self.limits, headers=self.headers
+        )
+
+
+class TraceTimer:
+    """Sums the durations of the httpcore trace events into `connect`, `wait` and `download`."""
 
-T = TypeVar('T', bound=JsonDict)
+    phases = {
+        'connect_tcp': 'connect',
+        'connect_unix_socket': 'connect',
+        'start_tls': 'connect',
+        'send_connection_init': 'connect',
+        'send_request_headers': 'wait',
+        'send_request_body': 'wait',
+        'receive_response_headers': 'wait',
+        'receive_response_body': 'download',
+    }
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self._started: dict[str, float] = {}
 
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        step, _, state = name.rpartition('.')
+        phase = self.phases.get(step.rpartition('.')[2])
+        if phase is None:
+            return
+        if state == 'started':
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            duration = time.perf_counter() - self._started.pop(step)
+            self.timings[phase] = self.timings.get(phase, 0.0) + duration
 
-class ResponseStatus(str, Enum):
-    SUCCESS = 'success'
-    FAIL = 'fail'
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self(name, info)
 
 
-class Response(TypedDict):
-    status: Literal[ResponseStatus.SUCCESS, ResponseStatus.FAIL]
-    msg: str
+def get_encoding_headers(accept_encoding: str | None) -> dict[str, str]:
+    return {} if accept_encoding is None else {'Accept-Encoding': accept_encoding}
 
 
-class SuccessResponse(Response):
-    status: Literal[ResponseStatus.SUCCESS]
-    data: list[T] | T | None
+def drop_none(params: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Drops `None` params, which `requests` skips while httpx sends them as empty values."""
+    if params is None:
+        return None
+    return {k: v for k, v in params.items() if v is not None}
 
 
-class FailResponse(Response):
-    status: Literal[ResponseStatus.FAIL]
+class HttpxAsyncBackend:
+    """
+    Asynchronous backend built on `httpx.AsyncClient`.
 
+    A single client is shared by every request, so concurrent coroutines reuse
+    connections from one pool. Requires the optional `httpx` dependency.
+
+    Parameters:
+        max_connections (int): Maximum number of concurrent connections in the pool.
+        max_keepalive_connections (int): Maximum number of idle connections kept alive.
+        accept_encoding (str | None): The `Accept-Encoding` header, `None` offers every encoding
+            httpx can decode.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        accept_encoding: str | None = None,
+    ) -> None:
+        try:
+            import httpx
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                'httpx is required for asynchronous requests, install it with `pip install fmd[async]`'
+            ) from e
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._client: httpx.AsyncClient = httpx.AsyncClient(
+            limits=limits, headers=get_encoding_headers(accept_encoding)
+        )
+        self.retryable_exceptions = (httpx.TransportError,)
+
+    async def send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ):
+        timer = TraceTimer()
+        res = await self._client.request(
+            method=method,
+            url=url,
+            params=drop_none(params),
+            timeout=timeout,
+            json=json,
+            extensions={'trace': timer.atrace},
+        )
+        res.timings = timer.timings
+        return res
 
-ResponseType = SuccessResponse | FailResponse
+    async def aclose(self) -> None:
+        await self._client.aclose()
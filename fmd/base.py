@@ -1,6 +1,13 @@
-from typing import Any
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
 
-from fmd.client import FmdApi
+from fmd.chunking import ChunkPolicy, Window
+from fmd.client import AsyncFmdApi, FmdApi
+from fmd.store import to_date
 
 
 class ManagerBase:
@@ -12,8 +19,224 @@ class ManagerBase:
     def get(self, **kwargs: Any) -> 'ObjectBase':
         return self._obj(self, **kwargs)
 
+    def get_many(self, symbols: Iterable[str], max_workers: int = 8) -> 'ObjectGroup':
+        """
+        Retrieves a group of objects based on the provided symbols.
+
+        Methods called on the group run for every symbol concurrently, using at most
+        `max_workers` threads, or concurrent tasks when the manager belongs to `AsyncFmdApi`.
+
+        Example:
+            ```python
+            from fmd import FmdApi
+
+            fa = FmdApi()
+            prices = fa.stock.get_many(['2330', '2317']).get_price(start_date='2024-01-01')
+            prices['2330']  # Price data of 2330
+            prices.errors  # Exceptions raised by failed symbols
+            ```
+
+        Parameters:
+            symbols (Iterable[str]): The symbols of the objects to retrieve.
+            max_workers (int): The maximum number of requests running at the same time.
+
+        Returns:
+            An `ObjectGroup` containing an object for each symbol.
+        """
+        return ObjectGroup(self, [self.get(symbol=symbol) for symbol in symbols], max_workers)
+
+    def iter_many(
+        self,
+        symbols: Iterable[str],
+        method: str,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 4,
+        **kwargs: Any,
+    ):
+        """
+        Iterates over the data of many symbols window by window, e.g. year by year.
+
+        Symbols are processed in order and at most `prefetch` windows are fetched ahead
+        of the consumer, so memory stays flat regardless of the number of symbols or the
+        length of the range. When the manager belongs to `AsyncFmdApi`, an async iterator
+        is returned instead.
+
+        Parameters:
+            symbols (Iterable[str]): The symbols to iterate over, consumed lazily.
+            method (str): The daily method called for every window, e.g. `get_price`.
+            start_date (str | date): The start date of the data.
+            end_date (str | date | None): The end date of the data, defaults to today.
+            window (str | int): The size of a window, see `ChunkPolicy`.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `method`, e.g. `as_`.
+
+        Returns:
+            An iterator of `(symbol, chunk)` tuples, a chunk being the data of one window.
+        """
+        windows = split_range(start_date, end_date, window)
+
+        def calls():
+            for symbol in symbols:
+                func = getattr(self.get(symbol=symbol), method)
+                for start, end in windows:
+                    yield symbol, functools.partial(func, start_date=start, end_date=end, **kwargs)
+
+        return iter_prefetched(self.fa, calls(), prefetch)
+
 
 class ObjectBase:
     def __init__(self, manager: ManagerBase, **kwargs: Any) -> None:
         self.manger = manager
         self.__dict__.update(kwargs)
+
+    def _iter_range(
+        self,
+        method: str,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ):
+        func = getattr(self, method)
+        calls = (
+            (None, functools.partial(func, start_date=start, end_date=end, **kwargs))
+            for start, end in split_range(start_date, end_date, window)
+        )
+        chunks = iter_prefetched(self.manger.fa, calls, prefetch)
+        if isinstance(self.manger.fa, AsyncFmdApi):
+            return (chunk async for _, chunk in chunks)
+        return (chunk for _, chunk in chunks)
+
+
+def split_range(
+    start_date: str | date, end_date: str | date | None, window: Window
+) -> list[tuple[date, date]]:
+    end = datetime.today().date() if end_date is None else to_date(end_date)
+    return ChunkPolicy(window).split(to_date(start_date), end)
+
+
+def iter_prefetched(fa: FmdApi, calls: Iterable[tuple[Any, Callable[[], Any]]], prefetch: int):
+    """
+    Runs `(key, call)` pairs concurrently and yields `(key, result)` in the order of `calls`.
+
+    At most `prefetch` calls run ahead of the consumer, and `calls` is only consumed
+    when a result is taken, which bounds the memory held by pending results.
+    """
+    if prefetch < 1:
+        raise ValueError('prefetch must be at least 1')
+    if isinstance(fa, AsyncFmdApi):
+        return _aiter_prefetched(iter(calls), prefetch)
+    return _iter_prefetched(iter(calls), prefetch)
+
+
+def _iter_prefetched(calls: Iterator[tuple[Any, Callable[[], Any]]], prefetch: int):
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque((key, executor.submit(call)) for key, call in islice(calls, prefetch))
+        try:
+            while pending:
+                key, future = pending.popleft()
+                result = future.result()
+                pending.extend((k, executor.submit(call)) for k, call in islice(calls, 1))
+                yield key, result
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+async def _aiter_prefetched(
+    calls: Iterator[tuple[Any, Callable[[], Any]]], prefetch: int
+) -> AsyncIterator[tuple[Any, Any]]:
+    import asyncio
+
+    pending = deque((key, asyncio.ensure_future(call())) for key, call in islice(calls, prefetch))
+    try:
+        while pending:
+            key, task = pending.popleft()
+            result = await task
+            pending.extend((k, asyncio.ensure_future(call())) for k, call in islice(calls, 1))
+            yield key, result
+    finally:
+        for _, task in pending:
+            task.cancel()
+
+
+class BulkResult(dict):
+    """
+    Results of a group call keyed by symbol.
+
+    Attributes:
+        errors (dict[str, Exception]): Exceptions raised by the symbols that failed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: dict[str, Exception] = {}
+
+
+class ObjectGroup:
+    """
+    A group of objects sharing the same manager.
+
+    Calling any method of the underlying objects on the group calls it for every
+    object concurrently and returns a `BulkResult`. A failed symbol does not abort
+    the batch, its exception is collected in `BulkResult.errors` instead. An empty
+    group returns an empty `BulkResult`.
+
+    Parameters:
+        manager (ManagerBase): The manager of the objects.
+        objs (list[ObjectBase]): The objects of the group.
+        max_workers (int): The maximum number of calls running at the same time.
+    """
+
+    def __init__(self, manager: ManagerBase, objs: list[ObjectBase], max_workers: int = 8) -> None:
+        self.manager = manager
+        self.objs = objs
+        self.max_workers = max_workers
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or not callable(getattr(self.manager._obj, name, None)):
+            raise AttributeError(name)
+
+        def method(*args: Any, **kwargs: Any):
+            if isinstance(self.manager.fa, AsyncFmdApi):
+                return self._gather(name, *args, **kwargs)
+            return self._map(name, *args, **kwargs)
+
+        return method
+
+    def _map(self, name: str, *args: Any, **kwargs: Any) -> BulkResult:
+        result = BulkResult()
+        if not self.objs:
+            return result
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.objs))) as executor:
+            futures = {
+                obj.symbol: executor.submit(getattr(obj, name), *args, **kwargs)
+                for obj in self.objs
+            }
+            for symbol, future in futures.items():
+                try:
+                    result[symbol] = future.result()
+                except Exception as e:
+                    result.errors[symbol] = e
+        return result
+
+    async def _gather(self, name: str, *args: Any, **kwargs: Any) -> BulkResult:
+        import asyncio
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(obj: ObjectBase):
+            async with semaphore:
+                return await getattr(obj, name)(*args, **kwargs)
+
+        outcomes = await asyncio.gather(*(call(obj) for obj in self.objs), return_exceptions=True)
+        result = BulkResult()
+        for obj, outcome in zip(self.objs, outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[obj.symbol] = outcome
+            else:
+                result[obj.symbol] = outcome
+        return result
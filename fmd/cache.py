@@ -0,0 +1,303 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any
+from urllib.parse import urlencode
+
+MISSING = object()
+
+
+def make_key(method: str, path: str, params: dict[str, Any] | None = None) -> str:
+    """
+    Builds a cache key from the method, path and canonicalized params.
+
+    Params are sorted, `None` values are dropped and dates are written in ISO format,
+    so `date(2024, 1, 1)` and `'2024-01-01'` produce the same key.
+    """
+    items = sorted((k, canonicalize(v)) for k, v in (params or {}).items() if v is not None)
+    query = urlencode(items)
+    return f'{method.upper()} {path}?{query}' if query else f'{method.upper()} {path}'
+
+
+def canonicalize(value: Any) -> str:
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def get_endpoint(path: str) -> str:
+    """Returns the endpoint name of a path, e.g. `price` for `/stock/2330/price`."""
+    return path.rstrip('/').rsplit('/', 1)[-1]
+
+
+class CacheBase:
+    """
+    Base class of response caches used by `FmdApi`.
+
+    Entries expire after a TTL picked per request: `ttls` overrides it per endpoint,
+    requests whose range reaches the current day or year use `recent_ttl`, and every
+    other request uses `ttl`.
+
+    Parameters:
+        ttl (float): Seconds to keep responses of closed periods and static endpoints.
+        recent_ttl (float): Seconds to keep responses whose range reaches the current period.
+        ttls (dict[str, float] | None): Seconds to keep responses per endpoint name, e.g.
+            `{'company': 86400, 'price': 300}`. The endpoint name of `get_available_list()`
+            is the resource name, e.g. `stock`.
+
+    Attributes:
+        hits (int): Number of requests served from the cache.
+        misses (int): Number of requests not found in the cache.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        recent_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.recent_ttl = recent_ttl
+        self.ttls = ttls or {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        """Returns the cached value of `key`, or `MISSING` if absent or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Stores `value` under `key` for `ttl` seconds."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        raise NotImplementedError
+
+    def get_ttl(self, path: str, params: dict[str, Any] | None = None) -> float:
+        endpoint = get_endpoint(path)
+        if endpoint in self.ttls:
+            return self.ttls[endpoint]
+        if is_recent(params):
+            return self.recent_ttl
+        return self.ttl
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _record(self, value: Any) -> Any:
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+
+def is_recent(params: dict[str, Any] | None) -> bool:
+    """Whether the range given by `params` reaches the current day or year."""
+    if not params:
+        return False
+    today = datetime.today().date()
+    end_date = params.get('end_date')
+    if end_date is not None:
+        return canonicalize(end_date) >= today.isoformat()
+    end_year = params.get('end_year')
+    if end_year is not None:
+        return int(end_year) >= today.year
+    return False
+
+
+class MemoryCache(CacheBase):
+    """
+    In-process response cache with TTL expiration and LRU eviction.
+
+    Cached results are shared between callers, so they should not be mutated.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.cache import MemoryCache
+
+        fa = FmdApi(cache=MemoryCache(maxsize=1024, ttls={'price': 300}))
+        ```
+
+    Parameters:
+        maxsize (int): Maximum number of entries; the least recently used entry is evicted first.
+        ttl (float): Seconds to keep responses of closed periods and static endpoints.
+        recent_ttl (float): Seconds to keep responses whose range reaches the current period.
+        ttls (dict[str, float] | None): Seconds to keep responses per endpoint name.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 86400.0,
+        recent_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+    ) -> None:
+        super().__init__(ttl=ttl, recent_ttl=recent_ttl, ttls=ttls)
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return self._record(MISSING)
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return self._record(MISSING)
+            self._data.move_to_end(key)
+            return self._record(value)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache(CacheBase):
+    """
+    Persistent response cache stored in a SQLite database.
+
+    The database runs in WAL mode, so several processes can read and write the same
+    file concurrently. Once the stored payloads exceed `max_bytes`, the expired and then
+    the least recently used entries are evicted. To keep hits read-only, the last access time of an entry
+    is only updated once it is older than `touch_interval` seconds.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.cache import SQLiteCache
+
+        fa = FmdApi(cache=SQLiteCache('~/.cache/fmd.sqlite', max_bytes=1024**3))
+        ```
+
+    Parameters:
+        path (str): Path of the database file.
+        max_bytes (int): Maximum total size in bytes of the stored payloads.
+        ttl (float): Seconds to keep responses of closed periods and static endpoints.
+        recent_ttl (float): Seconds to keep responses whose range reaches the current period.
+        ttls (dict[str, float] | None): Seconds to keep responses per endpoint name.
+        touch_interval (float): Seconds before the last access time of an entry is updated
+            again on a hit.
+    """
+
+    def __init__(
+        self,
+        path: str = 'fmd-cache.sqlite',
+        max_bytes: int = 512 * 1024**2,
+        ttl: float = 86400.0,
+        recent_ttl: float = 60.0,
+        ttls: dict[str, float] | None = None,
+        touch_interval: float = 60.0,
+    ) -> None:
+        super().__init__(ttl=ttl, recent_ttl=recent_ttl, ttls=ttls)
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # NOTE: The total size is kept up to date by triggers, so a write doesn't sum every entry
+        self._connect().executescript("""
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,
+                expires_at REAL NOT NULL, accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS responses_size (total INTEGER NOT NULL);
+            INSERT INTO responses_size SELECT COALESCE(SUM(size), 0) FROM responses
+                WHERE NOT EXISTS (SELECT 1 FROM responses_size);
+            CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+                UPDATE responses_size SET total = total + new.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+                UPDATE responses_size SET total = total + new.size - old.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+                UPDATE responses_size SET total = total - old.size;
+            END;
+            COMMIT;
+            """)
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT value, accessed_at FROM responses WHERE key = ? AND expires_at > ?',
+                (key, now),
+            ).fetchone()
+            # NOTE: A write takes the single WAL write lock, so most hits skip it
+            if row is not None and now - row[1] >= self.touch_interval:
+                conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+        with self._lock:
+            return self._record(MISSING if row is None else json.loads(row[0]))
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO responses VALUES (?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET '
+                'value = excluded.value, size = excluded.size, '
+                'expires_at = excluded.expires_at, accessed_at = excluded.accessed_at',
+                (key, payload, len(payload), now + ttl, now),
+            )
+            self._evict(conn, now)
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute('DELETE FROM responses')
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        if self._get_size(conn) <= self.max_bytes:
+            return
+        conn.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+        total = self._get_size(conn)
+        if total <= self.max_bytes:
+            return
+        keys = []
+        for key, size in conn.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+            keys.append((key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        conn.executemany('DELETE FROM responses WHERE key = ?', keys)
+
+    def _get_size(self, conn: sqlite3.Connection) -> int:
+        return conn.execute('SELECT total FROM responses_size').fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        # NOTE: sqlite connections can't be shared between threads, nor survive a fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
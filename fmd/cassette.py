@@ -0,0 +1,293 @@
+import asyncio
+import json as jsonlib
+import mmap
+import os
+import shutil
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Literal
+
+from requests.structures import CaseInsensitiveDict
+
+from fmd.backend import RequestsBackend
+from fmd.cache import make_key
+from fmd.exceptions import CassetteMissError
+
+MAGIC = b'FMDCAS1\n'
+MAGIC_SIZE = len(MAGIC)
+# NOTE: The last bytes of a cassette are the offset of its index, then the magic again
+FOOTER = struct.Struct('<Q8s')
+# NOTE: The body is decoded already and may be recompressed, so these don't apply anymore
+SKIPPED_HEADERS = frozenset(
+    {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'}
+)
+
+
+class CassetteResponse:
+    """A response replayed from a cassette, with the attributes read by the clients."""
+
+    def __init__(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: dict[str, str] | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.timings = timings or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+
+def get_cassette_key(
+    method: str,
+    url: str,
+    json: dict[str, Any] | bytes | None = None,
+    params: dict[str, Any] | None = None,
+) -> str:
+    """
+    Builds the key of a request in a cassette.
+
+    The scheme and host of `url` are dropped, so a cassette recorded against the live API
+    replays for any base URL, and params are canonicalized like the cache keys.
+    """
+    path = url.split('://', 1)[-1]
+    start = path.find('/')
+    path = path[start:] if start >= 0 else '/'
+    key = make_key(method, path, params)
+    if json is not None:
+        body = json if isinstance(json, bytes) else jsonlib.dumps(json, sort_keys=True).encode()
+        key = f'{key} {body.hex()}'
+    return key
+
+
+def read_index(data: bytes | mmap.mmap) -> tuple[int, dict[str, list[Any]]]:
+    """Returns the offset and the entries of the index of a cassette."""
+    footer_at = len(data) - FOOTER.size
+    if footer_at < MAGIC_SIZE or data[:MAGIC_SIZE] != MAGIC:
+        raise ValueError('not a cassette')
+    offset, magic = FOOTER.unpack(data[footer_at:])
+    if magic != MAGIC:
+        raise ValueError('cassette is truncated, it was not closed after recording')
+    index = jsonlib.loads(data[offset:footer_at])
+    return offset, index['entries']
+
+
+class RecordingBackend:
+    """
+    Backend recording the responses of another backend into a cassette file.
+
+    A cassette is a single file holding the response bodies back to back, each
+    compressed with zlib, followed by an index mapping every request, i.e. its method,
+    path, params and JSON body, to the offset of its response. Recording into an
+    existing cassette adds to it, and the last response of a request wins, so retried
+    requests keep their final response. Responses are recorded into a copy of the
+    cassette, which replaces it once `close()` writes the index, so call it, or use the
+    backend as a context manager.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.cassette import RecordingBackend
+
+        with RecordingBackend('fixtures/prices.cassette') as backend:
+            fa = FmdApi(backend=backend)
+            fa.stock.get('2330').get_price(start_date='2024-01-01', end_date='2024-06-30')
+        ```
+
+    Parameters:
+        path (str): Path of the cassette file.
+        backend (Any | None): The backend sending the requests, defaults to `RequestsBackend`.
+        compress (bool): Whether to compress the response bodies.
+    """
+
+    def __init__(self, path: str, backend: Any | None = None, compress: bool = True) -> None:
+        self.path = os.path.expanduser(path)
+        self.backend = backend or RequestsBackend()
+        self.compress = compress
+        self._lock = threading.Lock()
+        # NOTE: Recorded into a copy replacing the cassette on `close()`, so a process dying
+        # while recording leaves the previous cassette intact
+        self._tmp_path = f'{self.path}.recording'
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            with open(self.path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self._end, self._entries = read_index(m)
+            shutil.copyfile(self.path, self._tmp_path)
+            self._file = open(self._tmp_path, 'r+b')
+            self._file.truncate(self._end)
+        else:
+            self._file = open(self._tmp_path, 'w+b')
+            self._file.write(MAGIC)
+            self._end, self._entries = MAGIC_SIZE, {}
+
+    @property
+    def retryable_exceptions(self) -> tuple[type[Exception], ...]:
+        return getattr(self.backend, 'retryable_exceptions', (ConnectionError, TimeoutError))
+
+    def send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ):
+        started = time.perf_counter()
+        res = self.backend.send_request(
+            method=method, url=url, json=json, params=params, timeout=timeout
+        )
+        elapsed = time.perf_counter() - started
+        body = zlib.compress(res.content) if self.compress else res.content
+        headers = {k: v for k, v in res.headers.items() if k.lower() not in SKIPPED_HEADERS}
+        key = get_cassette_key(method, url, json, params)
+        with self._lock:
+            if self._file.closed:
+                raise ValueError('cassette is closed')
+            self._file.seek(self._end)
+            self._file.write(body)
+            self._entries[key] = [
+                self._end,
+                len(body),
+                res.status_code,
+                round(elapsed, 6),
+                int(self.compress),
+                headers,
+            ]
+            self._end += len(body)
+        return res
+
+    def close(self) -> None:
+        """Writes the index and closes the cassette."""
+        with self._lock:
+            if self._file.closed:
+                return
+            index = jsonlib.dumps({'version': 1, 'entries': self._entries}).encode()
+            self._file.seek(self._end)
+            self._file.write(index)
+            self._file.write(FOOTER.pack(self._end, MAGIC))
+            self._file.truncate()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            os.replace(self._tmp_path, self.path)
+
+    def __enter__(self) -> 'RecordingBackend':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class ReplayBackend:
+    """
+    Backend serving the responses recorded in a cassette, without any network access.
+
+    The cassette is memory-mapped, so opening it only reads its index, and each body
+    is read from the page cache when its request is replayed. A request missing from
+    the cassette raises `CassetteMissError`, which is not retried.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.cassette import ReplayBackend
+
+        fa = FmdApi(backend=ReplayBackend('fixtures/prices.cassette', latency='recorded'))
+        fa.stock.get('2330').get_price(start_date='2024-01-01', end_date='2024-06-30')
+        ```
+
+    Parameters:
+        path (str): Path of the cassette file.
+        latency (float | 'recorded' | None): Seconds to wait before every response,
+            `recorded` waits as long as the recorded request took, `None` doesn't wait.
+
+    Attributes:
+        hits (int): Number of requests replayed.
+        misses (int): Number of requests missing from the cassette.
+    """
+
+    retryable_exceptions: tuple[type[Exception], ...] = ()
+
+    def __init__(self, path: str, latency: float | Literal['recorded'] | None = None) -> None:
+        self.path = os.path.expanduser(path)
+        self.latency = latency
+        self.hits = 0
+        self.misses = 0
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _, self._entries = read_index(self._mmap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> CassetteResponse:
+        res, delay = self._replay(method, url, json, params)
+        if delay:
+            time.sleep(delay)
+        return res
+
+    def close(self) -> None:
+        """Unmaps the cassette."""
+        self._mmap.close()
+
+    def _replay(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> tuple[CassetteResponse, float]:
+        key = get_cassette_key(method, url, json, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            raise CassetteMissError(key)
+        self.hits += 1
+        offset, length, status_code, elapsed, compressed, headers = entry
+        end = offset + length
+        content = self._mmap[offset:end]
+        if compressed:
+            content = zlib.decompress(content)
+        delay = elapsed if self.latency == 'recorded' else self.latency or 0.0
+        return CassetteResponse(status_code, content, headers, {'wait': delay}), delay
+
+
+class AsyncReplayBackend(ReplayBackend):
+    """
+    Backend serving the responses recorded in a cassette to `AsyncFmdApi`.
+
+    The asynchronous counterpart of `ReplayBackend`, the simulated latency doesn't
+    block the event loop.
+    """
+
+    async def send_request(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> CassetteResponse:
+        res, delay = self._replay(method, url, json, params)
+        if delay:
+            await asyncio.sleep(delay)
+        return res
+
+    async def aclose(self) -> None:
+        """Unmaps the cassette."""
+        self.close()
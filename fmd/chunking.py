@@ -0,0 +1,58 @@
+from datetime import date, timedelta
+from typing import Literal
+
+from fmd.store import ONE_DAY
+
+Window = Literal['yearly', 'quarterly', 'monthly'] | int
+
+
+class ChunkPolicy:
+    """
+    Splits long daily ranges into windows which are fetched concurrently.
+
+    A multi-year request such as `get_price(start_date='2004-01-01', end_date='2024-12-31')`
+    is sent as one request per window, and the rows of the windows are stitched back in
+    order. Every window is retried on its own, so a failure only refetches that window.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.chunking import ChunkPolicy
+
+        fa = FmdApi(chunking=ChunkPolicy(window='yearly', max_workers=4))
+        fa.stock.get('2330').get_price(start_date='2004-01-01', end_date='2024-12-31')
+        ```
+
+    Parameters:
+        window (str | int): The size of a window, `yearly`, `quarterly` and `monthly` windows
+            follow the calendar, while an `int` is a number of days.
+        max_workers (int): The maximum number of windows fetched at the same time.
+    """
+
+    def __init__(self, window: Window = 'yearly', max_workers: int = 4) -> None:
+        if isinstance(window, int):
+            if window < 1:
+                raise ValueError('window must be at least 1 day')
+        elif window not in ('yearly', 'quarterly', 'monthly'):
+            raise ValueError(f'Unknown window: {window}, expected yearly, quarterly or monthly')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.window = window
+        self.max_workers = max_workers
+
+    def split(self, start: date, end: date) -> list[tuple[date, date]]:
+        """Returns the consecutive windows covering `start` to `end`, both inclusive."""
+        windows = []
+        current = start
+        while current <= end:
+            window_end = min(self._next_start(current) - ONE_DAY, end)
+            windows.append((current, window_end))
+            current = window_end + ONE_DAY
+        return windows
+
+    def _next_start(self, current: date) -> date:
+        if isinstance(self.window, int):
+            return current + timedelta(days=self.window)
+        months = {'yearly': 12, 'quarterly': 3, 'monthly': 1}[self.window]
+        index = current.year * 12 + (current.month - 1) // months * months + months
+        return date(index // 12, index % 12 + 1, 1)
@@ -0,0 +1,417 @@
+import argparse
+import csv
+import inspect
+import io
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterator
+
+RESOURCES = {'stock': 'Stock', 'etf': 'ETF', 'index': 'Index'}
+FORMATS = ('jsonl', 'csv', 'parquet')
+JOURNAL_NAME = '.fmd-journal.jsonl'
+
+
+def get_endpoints(resource: str) -> dict[str, str]:
+    """Returns the endpoints of a resource with their methods, e.g. `{'price': 'get_price'}`."""
+    from fmd import resources
+
+    obj = getattr(resources, RESOURCES[resource])
+    return {
+        name.removeprefix('get_').replace('_', '-'): name
+        for name in dir(obj)
+        if name.startswith('get_') and callable(getattr(obj, name))
+    }
+
+
+def get_range_kwargs(func: Any, start: date | None, end: date | None) -> dict[str, Any]:
+    """Returns the arguments of `func` selecting the data from `start` to `end`."""
+    params = inspect.signature(func).parameters
+    if start is None and end is None:
+        return {}
+    end = end or date.today()
+    start = start or end
+    if 'start_date' in params:
+        return {'start_date': start, 'end_date': end}
+    if 'start_month' in params:
+        return {
+            'start_year': start.year,
+            'start_month': start.month,
+            'end_year': end.year,
+            'end_month': end.month,
+        }
+    if 'start_quarter' in params:
+        return {
+            'start_year': start.year,
+            'start_quarter': (start.month - 1) // 3 + 1,
+            'end_year': end.year,
+            'end_quarter': (end.month - 1) // 3 + 1,
+        }
+    if 'start_year' in params:
+        return {'start_year': start.year, 'end_year': end.year}
+    return {}
+
+
+def read_symbols(path: str) -> list[str]:
+    """Reads one symbol per line, skipping blank lines and `#` comments."""
+    with open(path, encoding='utf-8') as f:
+        lines = (line.split('#', 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+
+class Journal:
+    """
+    Append-only checkpoint journal of a download, one JSON object per line.
+
+    The first line describes the run, every following line records a finished or failed
+    `(endpoint, symbol)` task. For JSONL and CSV output, finished tasks also record the
+    size of the output file after their rows were written, so an interrupted run is
+    resumed by truncating the files to the last recorded size.
+
+    Parameters:
+        path (Path): Path of the journal file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.run: dict[str, Any] | None = None
+        self.done: dict[tuple[str, str], dict[str, Any]] = {}
+        self.failed: dict[tuple[str, str], dict[str, Any]] = {}
+        if path.exists():
+            self._load()
+        self._file = open(path, 'a', encoding='utf-8')
+        if self._file.tell() and not path.read_bytes().endswith(b'\n'):
+            # NOTE: End the line cut short by a crash, so the next entry starts a new one
+            self._file.write('\n')
+
+    def start(self, run: dict[str, Any]) -> None:
+        """Starts the run, unless the journal belongs to a run with other arguments."""
+        if self.run is not None and self.run != run:
+            raise ValueError(
+                f'{self.path.parent} holds a download with other arguments, '
+                'pass --restart to start over'
+            )
+        if self.run is None:
+            self.run = run
+            self._write({'run': run})
+
+    def record(self, endpoint: str, symbol: str, **entry: Any) -> None:
+        """Records a task, flushed to disk before returning."""
+        entry = {'endpoint': endpoint, 'symbol': symbol, **entry}
+        self._write(entry)
+        if entry['status'] == 'done':
+            self.done[(endpoint, symbol)] = entry
+            self.failed.pop((endpoint, symbol), None)
+        else:
+            self.failed[(endpoint, symbol)] = entry
+
+    def get_offset(self, endpoint: str) -> int:
+        """Returns the size of the output file of `endpoint` after its last finished task."""
+        offsets = [
+            entry.get('offset') or 0 for (name, _), entry in self.done.items() if name == endpoint
+        ]
+        return max(offsets, default=0)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _write(self, entry: dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self) -> None:
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # NOTE: The last line may be cut short by a crash
+                    continue
+                if 'run' in entry:
+                    self.run = entry['run']
+                    continue
+                key = (entry['endpoint'], entry['symbol'])
+                if entry['status'] == 'done':
+                    self.done[key] = entry
+                    self.failed.pop(key, None)
+                else:
+                    self.failed[key] = entry
+
+
+class RowWriter:
+    """
+    Appends rows of every symbol to a JSONL or CSV file, resuming at `offset` bytes.
+
+    Parameters:
+        path (Path): Path of the output file.
+        file_format (str): `jsonl` or `csv`.
+        offset (int): The size the file is truncated to before writing.
+    """
+
+    def __init__(self, path: Path, file_format: str, offset: int = 0) -> None:
+        self.path = path
+        self.file_format = file_format
+        self.fieldnames: list[str] | None = None
+        self._file = open(path, 'r+b' if path.exists() else 'w+b')
+        self._file.truncate(offset)
+        if file_format == 'csv' and offset:
+            self._file.seek(0)
+            header = self._file.readline().decode('utf-8')
+            self.fieldnames = next(csv.reader([header]))
+        self._file.seek(offset)
+
+    def write(self, symbol: str, data: Any) -> tuple[int, int]:
+        """Writes the rows of a symbol, returns the number of rows and the new file size."""
+        rows = [data] if isinstance(data, dict) else data or []
+        rows = [{'symbol': symbol, **row} for row in rows]
+        buffer = io.StringIO()
+        if self.file_format == 'jsonl':
+            for row in rows:
+                buffer.write(json.dumps(row, ensure_ascii=False) + '\n')
+        elif rows:
+            writer = csv.DictWriter(buffer, self.fieldnames or list(rows[0]), extrasaction='ignore')
+            if self.fieldnames is None:
+                self.fieldnames = list(writer.fieldnames)
+                writer.writeheader()
+            writer.writerows(rows)
+        self._file.write(buffer.getvalue().encode('utf-8'))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return len(rows), self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """
+    Writes the table of every symbol to its own Parquet file in a directory.
+
+    Files are written to a temporary path and renamed, so an interrupted run never leaves
+    a partial file behind. The directory reads as one dataset with `pyarrow.dataset`,
+    pandas, Polars or DuckDB.
+
+    Parameters:
+        path (Path): The directory of the files.
+        compression (str): The Parquet compression codec.
+    """
+
+    def __init__(self, path: Path, compression: str = 'zstd') -> None:
+        from fmd.formats import import_optional
+
+        self.pq = import_optional('pyarrow.parquet', 'arrow')
+        self.path = path
+        self.compression = compression
+        path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, symbol: str, table: Any) -> tuple[int, None]:
+        target = self.path / f'{symbol}.parquet'
+        tmp = target.with_name(f'.{target.name}.tmp')
+        self.pq.write_table(table, tmp, compression=self.compression)
+        os.replace(tmp, target)
+        return table.num_rows, None
+
+    def close(self) -> None:
+        pass
+
+
+def download(args: argparse.Namespace) -> int:
+    """Runs the `download` command, returns the exit code."""
+    from fmd import FmdApi
+    from fmd.chunking import ChunkPolicy
+    from fmd.ratelimit import TokenBucket
+    from fmd.retry import RetryPolicy
+
+    endpoints = get_endpoints(args.resource)
+    selected = args.endpoints or list(endpoints)
+    unknown = sorted(set(selected) - set(endpoints))
+    if unknown:
+        print(
+            f'Unknown {args.resource} endpoints: {", ".join(unknown)}, '
+            f'expected {", ".join(endpoints)}',
+            file=sys.stderr,
+        )
+        return 2
+
+    fa = FmdApi(
+        retry=RetryPolicy(max_retries=args.retries),
+        rate_limiter=TokenBucket(args.rate, burst=max(int(args.rate), 1)) if args.rate else None,
+        # NOTE: Symbols run concurrently already, so windows of a long range run one by one
+        chunking=ChunkPolicy(window='yearly', max_workers=1),
+    )
+    manager = getattr(fa, args.resource)
+    if args.symbols:
+        symbols = args.symbols
+    elif args.symbols_file:
+        symbols = read_symbols(args.symbols_file)
+    else:
+        symbols = [row['symbol'] for row in manager.get_available_list()]
+
+    output = Path(args.output)
+    output.mkdir(parents=True, exist_ok=True)
+    journal_path = output / JOURNAL_NAME
+    if args.restart and journal_path.exists():
+        journal_path.unlink()
+    journal = Journal(journal_path)
+    journal.start(
+        {
+            'resource': args.resource,
+            'format': args.format,
+            'start_date': args.start_date and args.start_date.isoformat(),
+            'end_date': args.end_date and args.end_date.isoformat(),
+        }
+    )
+
+    writers: dict[str, RowWriter | ParquetWriter] = {}
+    for endpoint in selected:
+        path = output / f'{args.resource}-{endpoint}'
+        if args.format == 'parquet':
+            writers[endpoint] = ParquetWriter(path)
+        else:
+            offset = 0 if args.restart else journal.get_offset(endpoint)
+            writers[endpoint] = RowWriter(path.with_suffix(f'.{args.format}'), args.format, offset)
+
+    tasks = [
+        (endpoint, symbol)
+        for endpoint in selected
+        for symbol in symbols
+        if (endpoint, symbol) not in journal.done
+    ]
+    skipped = len(selected) * len(symbols) - len(tasks)
+    if skipped and not args.quiet:
+        print(f'Resuming, {skipped} tasks finished already', file=sys.stderr)
+
+    def fetch(endpoint: str, symbol: str) -> Any:
+        method = getattr(manager.get(symbol), endpoints[endpoint])
+        kwargs = get_range_kwargs(method, args.start_date, args.end_date)
+        if args.format == 'parquet':
+            kwargs['as_'] = 'arrow'
+        return method(**kwargs)
+
+    failed = 0
+    try:
+        for i, (endpoint, symbol, result) in enumerate(
+            run_tasks(fetch, tasks, args.workers), start=1
+        ):
+            if isinstance(result, Exception):
+                failed += 1
+                journal.record(endpoint, symbol, status='failed', error=repr(result))
+                message = f'failed: {result!r}'
+            else:
+                rows, offset = writers[endpoint].write(symbol, result)
+                journal.record(endpoint, symbol, status='done', rows=rows, offset=offset)
+                message = f'{rows} rows'
+            if not args.quiet:
+                print(f'[{i}/{len(tasks)}] {endpoint} {symbol}: {message}', file=sys.stderr)
+    except KeyboardInterrupt:
+        print('Interrupted, run the same command again to resume', file=sys.stderr)
+        return 130
+    finally:
+        for writer in writers.values():
+            writer.close()
+        journal.close()
+
+    if failed:
+        print(f'{failed} tasks failed, run the same command again to retry them', file=sys.stderr)
+        return 1
+    return 0
+
+
+def run_tasks(
+    fetch: Any, tasks: list[tuple[str, str]], max_workers: int
+) -> Iterator[tuple[str, str, Any]]:
+    """
+    Runs `fetch(endpoint, symbol)` for every task from a pool of threads.
+
+    Yields `(endpoint, symbol, result)` as tasks finish, the result being the exception
+    raised by a failed task. At most `2 * max_workers` tasks are submitted at a time,
+    so finished results don't pile up in memory while the caller writes them.
+    """
+    tasks_iter = iter(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='fmd-cli') as executor:
+        pending: dict[Future, tuple[str, str]] = {}
+        try:
+            while True:
+                for task in tasks_iter:
+                    pending[executor.submit(fetch, *task)] = task
+                    if len(pending) >= 2 * max_workers:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    endpoint, symbol = pending.pop(future)
+                    try:
+                        yield endpoint, symbol, future.result()
+                    except Exception as e:
+                        yield endpoint, symbol, e
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='fmd', description='Download Taiwan financial market data via FMD API.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    download_parser = subparsers.add_parser(
+        'download',
+        help='Download endpoints of many symbols into files.',
+        description=(
+            'Download endpoints of many symbols into one file per endpoint. Finished symbols '
+            'are recorded in a journal in the output directory, so an interrupted or failed '
+            'download resumes where it stopped when the same command runs again.'
+        ),
+    )
+    download_parser.add_argument('resource', choices=list(RESOURCES))
+    download_parser.add_argument(
+        '-e',
+        '--endpoints',
+        nargs='+',
+        metavar='ENDPOINT',
+        help='Endpoints to download, e.g. price margin-balance. Defaults to all of them.',
+    )
+    universe = download_parser.add_mutually_exclusive_group()
+    universe.add_argument('-s', '--symbols', nargs='+', metavar='SYMBOL')
+    universe.add_argument(
+        '--symbols-file',
+        metavar='PATH',
+        help='File with one symbol per line. Defaults to every available symbol.',
+    )
+    download_parser.add_argument('--start-date', type=date.fromisoformat, metavar='YYYY-MM-DD')
+    download_parser.add_argument(
+        '--end-date',
+        type=date.fromisoformat,
+        metavar='YYYY-MM-DD',
+        help='Defaults to today. Without any dates, every endpoint uses its default range.',
+    )
+    download_parser.add_argument('-o', '--output', default='fmd-data', help='Output directory.')
+    download_parser.add_argument('-f', '--format', choices=FORMATS, default='jsonl')
+    download_parser.add_argument(
+        '-w', '--workers', type=int, default=8, help='Concurrent requests.'
+    )
+    download_parser.add_argument(
+        '--rate', type=float, help='Maximum requests per second. Defaults to no limit.'
+    )
+    download_parser.add_argument('--retries', type=int, default=5, help='Retries per request.')
+    download_parser.add_argument(
+        '--restart', action='store_true', help='Ignore the journal and download everything.'
+    )
+    download_parser.add_argument('-q', '--quiet', action='store_true')
+    download_parser.set_defaults(func=download)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = make_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f'fmd: error: {e}', file=sys.stderr)
+        return 2
@@ -1,23 +1,90 @@
+import functools
+import threading
 import time
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable
 
-from fmd.backend import RequestsBackend, ResponseStatus, ResponseType
-from fmd.exceptions import RequestError
+from fmd.cache import MISSING, CacheBase, make_key
+from fmd.chunking import ChunkPolicy
+from fmd.decoders import Decoder, get_decoder
+from fmd.exceptions import DeadlineExceededError, RequestError
+from fmd.hedge import HedgePolicy
+from fmd.hooks import Hooks, RequestEvent, get_endpoint_template
+from fmd.metrics import ClientMetrics, get_wire_bytes
+from fmd.ratelimit import TokenBucket
+from fmd.retry import RetryPolicy
+from fmd.singleflight import AsyncSingleFlight, SingleFlight
+from fmd.store import PeriodCache, RangeCache, iter_periods, to_date
+from fmd.types import ResponseStatus, ResponseType
+
+if TYPE_CHECKING:
+    from fmd.resources import (
+        AsyncETFManager,
+        AsyncIndexManager,
+        AsyncStockManager,
+        ETFManager,
+        IndexManager,
+        StockManager,
+    )
 
 
 class FmdApi:
-    def __init__(self, version: str = '1') -> None:
+    def __init__(
+        self,
+        version: str = '1',
+        backend: Any | None = None,
+        timeout: float | None = 30.0,
+        retry: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        cache: CacheBase | None = None,
+        range_cache: RangeCache | None = None,
+        period_cache: PeriodCache | None = None,
+        json_decoder: str | Decoder = 'auto',
+        chunking: ChunkPolicy | None = None,
+        coalesce: bool = False,
+        hedge: HedgePolicy | None = None,
+        hooks: list[Hooks] | None = None,
+    ) -> None:
         self._base_url = 'https://api.fmarketdata.com'
         self._url = f'{self._base_url}/api/v{version}'
-        self._client = RequestsBackend()
+        if backend is not None:
+            self._client = backend
+        self._timeout = timeout
+        self._retry = retry if retry is not None else RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._range_cache = range_cache
+        self._period_cache = period_cache
+        # NOTE: Picking the fastest installed library imports it, so `auto` is resolved on first use
+        if json_decoder != 'auto':
+            self._decode = get_decoder(json_decoder)
+        self._chunking = chunking
+        self._singleflight = self._make_singleflight() if coalesce else None
+        self._hedge = hedge
+        self._hedge_executor = self._make_hedge_executor() if hedge is not None else None
+        self.metrics = ClientMetrics()
+        self._hooks: list[Hooks] = [self.metrics, *(hooks or [])]
+
+    # NOTE: Resources and the default backend are created on first use, so importing fmd and
+    # creating a client stays cheap for callers touching a single endpoint
+    @functools.cached_property
+    def stock(self) -> 'StockManager':
+        from fmd.resources import StockManager
+
+        return StockManager(self)
+
+    @functools.cached_property
+    def etf(self) -> 'ETFManager':
+        from fmd.resources import ETFManager
+
+        return ETFManager(self)
 
-        # NOTE: To avoid circular import
-        from fmd import resources
+    @functools.cached_property
+    def index(self) -> 'IndexManager':
+        from fmd.resources import IndexManager
 
-        # Resources
-        self.stock = resources.StockManager(self)
-        self.etf = resources.ETFManager(self)
-        self.index = resources.IndexManager(self)
+        return IndexManager(self)
 
     def send_request(
         self,
@@ -26,29 +93,673 @@ class FmdApi:
         json: dict[str, Any] | bytes | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
-        max_retries: int = 10,
+        max_retries: int | None = None,
     ):
-        url = self._get_url(path)
-        current_retries = 0
+        key, data = self._get_cached(method, path, json, params)
+        if data is not MISSING:
+            return data
+        flight_key = self._get_flight_key(method, path, json, params)
+        if flight_key is not None:
+            return self._singleflight.do(
+                flight_key, self._load, key, method, path, json, params, timeout, max_retries
+            )
+        return self._load(key, method, path, json, params, timeout, max_retries)
+
+    def _load(
+        self,
+        key: str | None,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        data = self._fetch(method, path, json, params, timeout, max_retries)
+        self._set_cached(key, path, params, data)
+        return data
+
+    def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        plan = self._plan_fetch(method, path, json, params)
+        result = None
         while True:
             try:
-                res = self._client.send_request(
-                    method=method, url=url, json=json, params=params, timeout=timeout
+                step = plan.send(result)
+            except StopIteration as stop:
+                return stop.value
+            if step[0] == 'range':
+                _, step_params, start, end = step
+                result = self._fetch_range(
+                    method, path, json, step_params, start, end, timeout, max_retries
                 )
-            except Exception:
-                if current_retries < max_retries:
-                    current_retries += 1
-                    secs = current_retries * 0.5
-                    time.sleep(secs)
+            else:
+                _, step_params = step
+                result = self._request(method, path, json, step_params, timeout, max_retries)
+
+    def _plan_fetch(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> Generator[tuple[Any, ...], Any, Any]:
+        """
+        Plans the requests of a call, shared by the sync and async clients.
+
+        Yields `('range', params, start, end)` for a date range, possibly split into
+        windows, and `('request', params)` for a single request, receiving their data,
+        and returns the data of the call, served from the range and period caches
+        where possible.
+        """
+        date_range = self._get_date_range(method, json, params)
+        if date_range is not None and self._range_cache is not None:
+            start, end = date_range
+            key = self._get_range_key(method, path, params)
+            for gap_start, gap_end in self._range_cache.get_gaps(key, start, end):
+                rows = yield 'range', params, gap_start, gap_end
+                self._range_cache.update(key, gap_start, gap_end, rows)
+            return self._range_cache.read(key, start, end)
+        if date_range is not None:
+            return (yield 'range', params, *date_range)
+
+        period_range = self._get_period_range(method, json, params)
+        if period_range is not None:
+            field, periods = period_range
+            key = self._get_range_key(method, path, params)
+            missing = self._period_cache.get_missing(key, periods)
+            if not missing:
+                return self._period_cache.read(key, periods)
+            index = periods.index(missing[0])
+            year, period = periods[index]
+            fetch_params = {**params, 'start_year': year, f'start_{field}': period}
+            rows = yield 'request', fetch_params
+            fetched = self._period_cache.update(key, field, periods[index:], rows or [])
+            return self._period_cache.read(key, periods[:index]) + fetched
+
+        return (yield 'request', params)
+
+    def _fetch_range(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any],
+        start: date,
+        end: date,
+        timeout: float | None,
+        max_retries: int | None,
+    ) -> list[Any]:
+        windows = self._get_windows(start, end)
+
+        def fetch(window: tuple[date, date]) -> list[Any]:
+            window_params = get_window_params(params, window)
+            return self._request(method, path, json, window_params, timeout, max_retries) or []
+
+        if not windows:
+            # NOTE: The range is empty, i.e. it ends before it starts
+            return []
+        if len(windows) == 1:
+            return fetch(windows[0])
+        with ThreadPoolExecutor(max_workers=min(self._chunking.max_workers, len(windows))) as pool:
+            return merge_rows(pool.map(fetch, windows))
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        url = self._get_url(path)
+        plan = self._plan_attempts(method, path, params, timeout, max_retries)
+        step = next(plan)
+        while True:
+            try:
+                if step[0] == 'sleep':
+                    time.sleep(step[1])
+                    step = next(plan)
                     continue
-                raise
-            res_json: ResponseType = res.json()
-            if res_json.get('status') == ResponseStatus.SUCCESS:
-                return res_json.get('data')
-            raise RequestError(status_code=res.status_code, msg=res_json.get('msg'))
+                try:
+                    res = self._send(method, url, json, params, step[1])
+                except Exception as e:
+                    step = plan.throw(e)
+                else:
+                    step = plan.send(res)
+            except StopIteration as stop:
+                return stop.value
+
+    def _plan_attempts(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ) -> Generator[tuple[str, float | None], Any, Any]:
+        """
+        Plans the attempts of a request, shared by the sync and async clients.
+
+        Yields `('sleep', seconds)` before waiting, and `('send', timeout)` before every
+        attempt, receiving its response or having its exception thrown in. Returns the
+        decoded data, or raises the error of the last attempt.
+        """
+        retry = self._retry
+        max_retries = retry.max_retries if max_retries is None else max_retries
+        deadline_at = retry.start()
+        current_retries = 0
+        while True:
+            wait_secs = self._reserve_token(deadline_at)
+            if wait_secs:
+                yield 'sleep', wait_secs
+            attempt_timeout = retry.get_timeout(
+                self._timeout if timeout is None else timeout, deadline_at
+            )
+            event = RequestEvent(method, path, params, current_retries)
+            self._emit('before_request', event)
+            started = time.perf_counter()
+            try:
+                res = yield 'send', attempt_timeout
+            except Exception as e:
+                event.elapsed = time.perf_counter() - started
+                event.error = e
+                secs = self._next_retry_delay(current_retries, max_retries, deadline_at, exc=e)
+                if secs is None:
+                    self._emit('on_error', event)
+                    raise
+            else:
+                self._on_response(event, res, started)
+                secs = self._next_retry_delay(current_retries, max_retries, deadline_at, res=res)
+                if secs is None:
+                    return self._finish(event, res)
+                self._emit('after_response', event)
+            event.delay = secs
+            self._emit('on_retry', event)
+            current_retries += 1
+            yield 'sleep', secs
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+    ):
+        send = functools.partial(
+            self._client.send_request,
+            method=method,
+            url=url,
+            json=json,
+            params=params,
+            timeout=timeout,
+        )
+        if self._hedge is None or method.lower() != 'get':
+            return send()
+        delay = self._hedge.get_delay()
+        started = time.monotonic()
+        if delay is None:
+            # NOTE: Nothing can race it, so it's sent on the calling thread
+            res = send()
+            self._hedge.record(time.monotonic() - started)
+            return res
+        # NOTE: The first attempt gets its own thread rather than one of the hedge executor, so
+        # requests never queue behind each other and the delay only counts the request itself
+        first: Future = Future()
+        threading.Thread(target=run_future, args=(first, send), daemon=True).start()
+        futures = [first]
+        done, _ = wait(futures, timeout=delay)
+        if not done and self._hedge.allow_hedge():
+            futures.append(self._hedge_executor.submit(self._send_hedge, send, first))
+        # NOTE: The slower request can't be cancelled, its response is discarded
+        errors = []
+        for future in as_completed(futures):
+            try:
+                res = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            self._hedge.record(time.monotonic() - started)
+            return res
+        raise errors[0]
+
+    def _send_hedge(self, send: Callable[[], Any], first: Future):
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+            if first.done() and first.exception() is None:
+                # NOTE: Answered while waiting for a token, the duplicate isn't needed anymore
+                return first.result()
+        return send()
+
+    def _reserve_token(self, deadline_at: float | None) -> float:
+        """Takes a token of the rate limiter and returns the seconds to wait before sending."""
+        if self._rate_limiter is None:
+            return 0.0
+        if deadline_at is None:
+            return self._rate_limiter.reserve()
+        # NOTE: A token which can't be used in time is left in the bucket for other callers
+        max_wait = deadline_at - time.monotonic()
+        secs = self._rate_limiter.reserve(max_wait=max(max_wait, 0.0))
+        if secs is None:
+            raise DeadlineExceededError(
+                f'waiting for the rate limiter would exceed the deadline in {max_wait:.2f}s'
+            )
+        return secs
+
+    def _on_response(self, event: RequestEvent, res: Any, started: float) -> None:
+        event.elapsed = time.perf_counter() - started
+        event.status_code = res.status_code
+        timings = getattr(res, 'timings', None)
+        if isinstance(timings, dict):
+            event.timings.update(timings)
+        event.wire_bytes = get_wire_bytes(res)
+        event.decoded_bytes = len(res.content)
+
+    def _finish(self, event: RequestEvent, res: Any):
+        started = time.perf_counter()
+        try:
+            return self._handle_response(res)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.timings['decode'] = time.perf_counter() - started
+            self._emit('after_response', event)
+            if event.error is not None:
+                self._emit('on_error', event)
+
+    def _emit(self, name: str, event: RequestEvent) -> None:
+        for hook in self._hooks:
+            getattr(hook, name)(event)
+
+    def _get_cached(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> tuple[str | None, Any]:
+        """Returns the cache key of a request and its cached data, `MISSING` on a miss."""
+        key = self._get_cache_key(method, path, json, params)
+        if key is None:
+            return None, MISSING
+        data = self._cache.get(key)
+        self.metrics.record_cache(get_endpoint_template(path), data is not MISSING)
+        return key, data
+
+    def _set_cached(
+        self, key: str | None, path: str, params: dict[str, Any] | None, data: Any
+    ) -> None:
+        if key is not None:
+            self._cache.set(key, data, self._cache.get_ttl(path, params))
+
+    def _get_windows(self, start: date, end: date) -> list[tuple[date, date]]:
+        return [(start, end)] if self._chunking is None else self._chunking.split(start, end)
+
+    def _get_cache_key(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> str | None:
+        if self._cache is None or method.lower() != 'get' or json is not None:
+            return None
+        return make_key(method, path, params)
+
+    def _get_flight_key(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> str | None:
+        if self._singleflight is None or method.lower() != 'get' or json is not None:
+            return None
+        return make_key(method, path, params)
+
+    @functools.cached_property
+    def _client(self) -> Any:
+        return self._make_backend()
+
+    @functools.cached_property
+    def _decode(self) -> Decoder:
+        return get_decoder('auto')
+
+    def _make_backend(self) -> Any:
+        from fmd.backend import RequestsBackend
+
+        return RequestsBackend()
+
+    def _make_singleflight(self) -> SingleFlight:
+        return SingleFlight()
+
+    def _make_hedge_executor(self) -> ThreadPoolExecutor | None:
+        return ThreadPoolExecutor(self._hedge.max_workers, thread_name_prefix='fmd-hedge')
+
+    def _get_date_range(
+        self,
+        method: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> tuple[date, date] | None:
+        if self._range_cache is None and self._chunking is None:
+            return None
+        if method.lower() != 'get' or json is not None or not params:
+            return None
+        start_date, end_date = params.get('start_date'), params.get('end_date')
+        if start_date is None or end_date is None:
+            return None
+        try:
+            return to_date(start_date), to_date(end_date)
+        except ValueError:
+            return None
+
+    def _get_period_range(
+        self,
+        method: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+    ) -> tuple[str, list[tuple[int, int]]] | None:
+        if self._period_cache is None or method.lower() != 'get' or json is not None or not params:
+            return None
+        for field, per_year in (('quarter', 4), ('month', 12)):
+            keys = ('start_year', f'start_{field}', 'end_year', f'end_{field}')
+            if all(params.get(k) is not None for k in keys):
+                return field, iter_periods(*(params[k] for k in keys), per_year)
+        return None
+
+    def _get_range_key(self, method: str, path: str, params: dict[str, Any]) -> str:
+        range_params = {
+            'start_date',
+            'end_date',
+            'start_year',
+            'end_year',
+            'start_quarter',
+            'end_quarter',
+            'start_month',
+            'end_month',
+        }
+        params = {k: v for k, v in params.items() if k not in range_params}
+        return make_key(method, path, params)
+
+    def _next_retry_delay(
+        self,
+        retries: int,
+        max_retries: int,
+        deadline_at: float | None,
+        exc: Exception | None = None,
+        res: Any = None,
+    ) -> float | None:
+        return self._retry.next_delay(
+            retries,
+            max_retries,
+            deadline_at,
+            exc=exc,
+            res=res,
+            retryable_exceptions=getattr(
+                self._client, 'retryable_exceptions', (ConnectionError, TimeoutError)
+            ),
+        )
+
+    def _handle_response(self, res):
+        try:
+            res_json: ResponseType = self._decode(res.content)
+        except ValueError:
+            raise RequestError(status_code=res.status_code, msg=res.text)
+        if res_json.get('status') == ResponseStatus.SUCCESS:
+            return res_json.get('data')
+        raise RequestError(status_code=res.status_code, msg=res_json.get('msg'))
 
     def _get_url(self, path: str) -> str:
         if path.startswith('http://') or path.startswith('https://'):
             return path
         _url = self._url.rstrip('/')
         return f'{_url}{path}'
+
+
+class AsyncFmdApi(FmdApi):
+    """
+    Asynchronous counterpart of `FmdApi`.
+
+    Every resource method returns an awaitable, so many requests can run
+    concurrently on a single event loop while sharing one connection pool.
+
+    Example:
+        ```python
+        import asyncio
+
+        from fmd import AsyncFmdApi
+
+
+        async def main():
+            async with AsyncFmdApi() as fa:
+                stocks = [fa.stock.get(symbol) for symbol in ('2330', '2317', '2454')]
+                return await asyncio.gather(*(stock.get_price() for stock in stocks))
+
+
+        prices = asyncio.run(main())
+        ```
+    """
+
+    @functools.cached_property
+    def stock(self) -> 'AsyncStockManager':
+        from fmd.resources import AsyncStockManager
+
+        return AsyncStockManager(self)
+
+    @functools.cached_property
+    def etf(self) -> 'AsyncETFManager':
+        from fmd.resources import AsyncETFManager
+
+        return AsyncETFManager(self)
+
+    @functools.cached_property
+    def index(self) -> 'AsyncIndexManager':
+        from fmd.resources import AsyncIndexManager
+
+        return AsyncIndexManager(self)
+
+    async def send_request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+    ):
+        key, data = self._get_cached(method, path, json, params)
+        if data is not MISSING:
+            return data
+        flight_key = self._get_flight_key(method, path, json, params)
+        if flight_key is not None:
+            return await self._singleflight.do(
+                flight_key, self._load, key, method, path, json, params, timeout, max_retries
+            )
+        return await self._load(key, method, path, json, params, timeout, max_retries)
+
+    async def _load(
+        self,
+        key: str | None,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        data = await self._fetch(method, path, json, params, timeout, max_retries)
+        self._set_cached(key, path, params, data)
+        return data
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        plan = self._plan_fetch(method, path, json, params)
+        result = None
+        while True:
+            try:
+                step = plan.send(result)
+            except StopIteration as stop:
+                return stop.value
+            if step[0] == 'range':
+                _, step_params, start, end = step
+                result = await self._fetch_range(
+                    method, path, json, step_params, start, end, timeout, max_retries
+                )
+            else:
+                _, step_params = step
+                result = await self._request(method, path, json, step_params, timeout, max_retries)
+
+    async def _fetch_range(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any],
+        start: date,
+        end: date,
+        timeout: float | None,
+        max_retries: int | None,
+    ) -> list[Any]:
+        import asyncio
+
+        windows = self._get_windows(start, end)
+        semaphore = asyncio.Semaphore(1 if self._chunking is None else self._chunking.max_workers)
+
+        async def fetch(window: tuple[date, date]) -> list[Any]:
+            window_params = get_window_params(params, window)
+            async with semaphore:
+                rows = await self._request(method, path, json, window_params, timeout, max_retries)
+            return rows or []
+
+        return merge_rows(await asyncio.gather(*(fetch(window) for window in windows)))
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+        max_retries: int | None,
+    ):
+        import asyncio
+
+        url = self._get_url(path)
+        plan = self._plan_attempts(method, path, params, timeout, max_retries)
+        step = next(plan)
+        while True:
+            try:
+                if step[0] == 'sleep':
+                    await asyncio.sleep(step[1])
+                    step = next(plan)
+                    continue
+                try:
+                    res = await self._send(method, url, json, params, step[1])
+                except Exception as e:
+                    step = plan.throw(e)
+                else:
+                    step = plan.send(res)
+            except StopIteration as stop:
+                return stop.value
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | bytes | None,
+        params: dict[str, Any] | None,
+        timeout: float | None,
+    ):
+        import asyncio
+
+        def send():
+            return self._client.send_request(
+                method=method, url=url, json=json, params=params, timeout=timeout
+            )
+
+        async def send_hedge():
+            if self._rate_limiter is not None:
+                await asyncio.sleep(self._rate_limiter.reserve())
+            return await send()
+
+        if self._hedge is None or method.lower() != 'get':
+            return await send()
+        started = time.monotonic()
+        delay = self._hedge.get_delay()
+        tasks = [asyncio.ensure_future(send())]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._hedge.allow_hedge():
+                    tasks.append(asyncio.ensure_future(send_hedge()))
+            errors = []
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    res = await next_done
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                self._hedge.record(time.monotonic() - started)
+                return res
+            raise errors[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _make_backend(self) -> Any:
+        from fmd.backend import HttpxAsyncBackend
+
+        return HttpxAsyncBackend()
+
+    def _make_singleflight(self) -> AsyncSingleFlight:
+        return AsyncSingleFlight()
+
+    def _make_hedge_executor(self) -> ThreadPoolExecutor | None:
+        return None
+
+    async def aclose(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncFmdApi':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def run_future(future: Future, func: Callable[[], Any]) -> None:
+    """Runs `func` and sets its result, or its exception, on `future`."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(func())
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def get_window_params(params: dict[str, Any], window: tuple[date, date]) -> dict[str, Any]:
+    return {**params, 'start_date': window[0], 'end_date': window[1]}
+
+
+def merge_rows(results: Iterable[list[Any]]) -> list[Any]:
+    """Concatenates the rows of consecutive windows."""
+    return [row for rows in results for row in rows]
@@ -0,0 +1,54 @@
+import json
+from typing import Any, Callable
+
+Decoder = Callable[[bytes], Any]
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Decoder:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def _json() -> Decoder:
+    return json.loads
+
+
+# NOTE: Ordered by decoding speed of resource payloads, see benchmarks/bench_decode.py
+DECODERS: dict[str, Callable[[], Decoder]] = {
+    'msgspec': _msgspec,
+    'orjson': _orjson,
+    'json': _json,
+}
+
+
+def get_decoder(decoder: str | Decoder = 'auto') -> Decoder:
+    """
+    Returns a function decoding JSON directly from response bytes.
+
+    Parameters:
+        decoder (str | Decoder): `orjson`, `msgspec`, `json`, a custom callable, or `auto`
+            to pick the fastest installed library, falling back to the standard `json` module.
+
+    Returns:
+        A function taking `bytes` and returning the decoded object. It raises `ValueError`
+        for invalid JSON.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == 'auto':
+        for name in ('msgspec', 'orjson'):
+            try:
+                return DECODERS[name]()
+            except ImportError:
+                continue
+        return _json()
+    if decoder not in DECODERS:
+        raise ValueError(f'Unknown JSON decoder: {decoder}, expected one of {list(DECODERS)}')
+    return DECODERS[decoder]()
@@ -1,7 +1,9 @@
+import functools
+import inspect
 from datetime import datetime, timedelta
+from typing import Literal
 
-from dateutil.relativedelta import relativedelta
-from typing_extensions import Literal
+from fmd.formats import OutputFormat, convert
 
 
 def default_data_range(
@@ -14,6 +16,7 @@ def default_data_range(
     """Set default data range when retrieving data from API."""
 
     def dec(func):
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
             match freq:
                 case 'daily':
@@ -30,6 +33,9 @@ def default_data_range(
                         and not kwargs.get('end_year')
                         and not kwargs.get('end_month')
                     ):
+                        # NOTE: Imported here, since only monthly data needs it
+                        from dateutil.relativedelta import relativedelta
+
                         today = datetime.today()
                         end_year = today.year
                         end_month = today.month
@@ -75,3 +81,25 @@ def default_data_range(
         return wrapper
 
     return dec
+
+
+def output(data_type: type):
+    """Convert the data retrieved from API into the format given by the `as_` argument."""
+
+    def dec(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, as_: OutputFormat | None = None, **kwargs):
+            result = func(self, *args, **kwargs)
+            if as_ is None:
+                return result
+            if inspect.isawaitable(result):
+
+                async def convert_result():
+                    return convert(await result, data_type, as_)
+
+                return convert_result()
+            return convert(result, data_type, as_)
+
+        return wrapper
+
+    return dec
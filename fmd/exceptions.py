@@ -5,3 +5,17 @@ class RequestError(Exception):
 
     def __str__(self) -> str:
         return f'status code: {self.status_code}. {self.msg}'
+
+
+class CassetteMissError(LookupError):
+    """Raised when a replayed request was not recorded in the cassette."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def __str__(self) -> str:
+        return f'no response recorded for {self.key}'
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a call can't be sent before the deadline of its `RetryPolicy`."""
@@ -0,0 +1,121 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Iterable
+
+from fmd.base import ManagerBase
+from fmd.formats import import_optional
+
+
+def export_parquet(
+    manager: ManagerBase,
+    symbols: Iterable[str],
+    method: str,
+    root: str | Path,
+    max_workers: int = 8,
+    compression: str = 'zstd',
+    **kwargs: Any,
+) -> dict[str, Exception]:
+    """
+    Downloads data for many symbols into a Parquet dataset partitioned by endpoint, symbol and year.
+
+    Symbols are fetched concurrently and every table is written as soon as it arrives,
+    so at most about `2 * max_workers` tables are held in memory at once. Files are laid
+    out as `<root>/<endpoint>/<symbol>/year=<year>/<symbol>.parquet`, which
+    `pyarrow.dataset`, pandas, Polars and DuckDB read as hive partitions. The symbol is
+    kept as a string column in the files, so symbols like `0050` keep their leading
+    zeros. Data without a `date` or `year` field is partitioned by symbol only.
+
+    Exporting into an existing dataset merges the new rows into every partition they
+    fall into, replacing the rows of the same date, so a later range can be appended
+    and an overlapping range refreshed.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.export import export_parquet
+
+        fa = FmdApi()
+        errors = export_parquet(
+            fa.stock, ['2330', '2317'], 'get_price', 'data', start_date='2020-01-01'
+        )
+        ```
+
+    Parameters:
+        manager (ManagerBase): The manager of the objects, e.g. `fa.stock`.
+        symbols (Iterable[str]): The symbols to download.
+        method (str): The method called on every object, e.g. `get_price`.
+        root (str | Path): The root directory of the dataset.
+        max_workers (int): The maximum number of requests running at the same time.
+        compression (str): The Parquet compression codec.
+        **kwargs: Arguments passed to `method`, e.g. `start_date`.
+
+    Returns:
+        The exceptions raised by the symbols that failed, keyed by symbol.
+    """
+    pa = import_optional('pyarrow', 'arrow')
+    pc = import_optional('pyarrow.compute', 'arrow')
+    pq = import_optional('pyarrow.parquet', 'arrow')
+
+    base_dir = Path(root) / method.removeprefix('get_')
+    errors: dict[str, Exception] = {}
+
+    def fetch(symbol: str):
+        return getattr(manager.get(symbol=symbol), method)(as_='arrow', **kwargs)
+
+    def write(symbol: str, table: Any) -> None:
+        table = add_partition_columns(pa, table, symbol)
+        symbol_dir = base_dir / symbol
+        if 'year' not in table.column_names:
+            write_partition(pa, pc, pq, table, symbol_dir / f'{symbol}.parquet', compression)
+            return
+        for year in pc.unique(table['year']).to_pylist():
+            part = table.filter(pc.equal(table['year'], year)).drop_columns(['year'])
+            path = symbol_dir / f'year={year}' / f'{symbol}.parquet'
+            write_partition(pa, pc, pq, part, path, compression)
+
+    symbols = iter(symbols)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: dict[Future, str] = {}
+        while True:
+            # NOTE: Bound the submitted symbols, so finished tables don't pile up in memory
+            for symbol in symbols:
+                pending[executor.submit(fetch, symbol)] = symbol
+                if len(pending) >= 2 * max_workers:
+                    break
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                symbol = pending.pop(future)
+                try:
+                    write(symbol, future.result())
+                except Exception as e:
+                    errors[symbol] = e
+    return errors
+
+
+def add_partition_columns(pa: Any, table: Any, symbol: str):
+    """Adds the `symbol` and `year` columns used to partition the table, when missing."""
+    pc = import_optional('pyarrow.compute', 'arrow')
+    if 'symbol' not in table.column_names:
+        table = table.append_column('symbol', pa.array([symbol] * table.num_rows, pa.string()))
+    if 'year' not in table.column_names and 'date' in table.column_names:
+        table = table.append_column('year', pc.year(table['date']).cast(pa.int64()))
+    return table
+
+
+def write_partition(pa: Any, pc: Any, pq: Any, table: Any, path: Path, compression: str) -> None:
+    """Writes a partition, keeping the rows of an existing file whose dates are not in `table`."""
+    if path.exists():
+        existing = pq.read_table(path, partitioning=None)
+        if 'date' in table.column_names and 'date' in existing.column_names:
+            kept = pc.invert(pc.is_in(existing['date'], value_set=table['date']))
+            table = pa.concat_tables(
+                [existing.filter(kept), table], promote_options='default'
+            ).sort_by('date')
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # NOTE: Replace the file at once, so an interrupted export doesn't lose the earlier rows
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    pq.write_table(table, tmp_path, compression=compression)
+    os.replace(tmp_path, path)
@@ -0,0 +1,256 @@
+import importlib
+from collections import namedtuple
+from datetime import date
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin, get_type_hints
+
+OutputFormat = Literal['numpy', 'pandas', 'arrow', 'records']
+
+FieldKind = Literal['date', 'int', 'number', 'text']
+
+# NOTE: `str` fields which hold text, the other `str` fields hold numbers like '942.00'
+TEXT_FIELDS = frozenset(
+    {
+        'symbol',
+        'name',
+        'chinese_name',
+        'chairman',
+        'president',
+        'company_url',
+        'industry',
+        'market_category',
+        'marker_category',
+        'category',
+        'issuer',
+        'underlying_index',
+        'period',
+    }
+)
+
+
+def import_optional(name: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f'{name} is required for this output format, install it with `pip install fmd[{extra}]`'
+        ) from e
+
+
+@lru_cache
+def get_schema(data_type: type) -> dict[str, FieldKind]:
+    """
+    Returns the kind of every field of a data type such as `StockPrice`.
+
+    Fields annotated with `int` are integers, `date` and `*_date` fields are dates,
+    fields in `TEXT_FIELDS` are text and the other `str` fields hold numbers like `'942.00'`.
+    """
+    return {name: get_kind(name, hint) for name, hint in get_type_hints(data_type).items()}
+
+
+def get_kind(name: str, hint: Any = str) -> FieldKind:
+    if get_origin(hint) in (Union, UnionType):
+        hint = next((arg for arg in get_args(hint) if arg is not NoneType), str)
+    if hint is int:
+        return 'int'
+    if name == 'date' or name.endswith('_date'):
+        return 'date'
+    if name in TEXT_FIELDS:
+        return 'text'
+    return 'number'
+
+
+def get_fields(rows: list[dict[str, Any]], data_type: type) -> dict[str, FieldKind]:
+    """Returns the fields of `rows` with their kinds, falling back to the data type's fields."""
+    schema = get_schema(data_type)
+    if not rows:
+        return dict(schema)
+    return {name: schema.get(name) or get_kind(name) for name in rows[0]}
+
+
+def as_rows(data: list[dict[str, Any]] | dict[str, Any] | None) -> list[dict[str, Any]]:
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        return [data]
+    return data
+
+
+def to_numpy(data: list[dict[str, Any]] | dict[str, Any] | None, data_type: type):
+    """
+    Converts rows into a columnar `dict` of NumPy arrays.
+
+    Dates become `datetime64[D]`, integers `int64` and numeric strings `float64`;
+    missing values become `NaT` or `NaN`. Text stays in string arrays.
+
+    Parameters:
+        data (list[dict] | dict | None): Rows returned by a resource method.
+        data_type (type): The data type of the rows, e.g. `StockPrice`.
+
+    Returns:
+        A `dict` mapping every field to an array.
+    """
+    np = import_optional('numpy', 'numpy')
+    rows = as_rows(data)
+    return {
+        name: to_array(np, [row.get(name) for row in rows], kind)
+        for name, kind in get_fields(rows, data_type).items()
+    }
+
+
+def to_array(np: Any, values: list[Any], kind: FieldKind):
+    if kind == 'date':
+        try:
+            return np.array(values, dtype='datetime64[D]')
+        except ValueError:
+            return np.array(values, dtype=object)
+    if kind == 'int':
+        try:
+            return np.array(values, dtype=np.int64)
+        except (TypeError, ValueError):
+            return to_array(np, values, 'number')
+    has_none = None in values
+    if kind == 'number':
+        try:
+            numbers = [np.nan if v is None else v for v in values] if has_none else values
+            return np.array(numbers).astype(np.float64)
+        except (TypeError, ValueError):
+            pass
+    return np.array(values, dtype=object if has_none else None)
+
+
+def to_pandas(data: list[dict[str, Any]] | dict[str, Any] | None, data_type: type):
+    """
+    Converts rows into a pandas `DataFrame`.
+
+    Columns get the dtypes of `to_numpy()` and `symbol` is categorical. Daily data is
+    indexed by a `DatetimeIndex` named `date`, while quarterly and monthly data are
+    indexed by a `PeriodIndex` named `period` built from the `year` and `quarter` or
+    `month` fields.
+
+    Parameters:
+        data (list[dict] | dict | None): Rows returned by a resource method.
+        data_type (type): The data type of the rows, e.g. `StockPrice`.
+
+    Returns:
+        A `DataFrame` of the rows.
+    """
+    pd = import_optional('pandas', 'pandas')
+    df = pd.DataFrame(to_numpy(data, data_type))
+    if 'symbol' in df:
+        df['symbol'] = df['symbol'].astype('category')
+    if 'date' in df:
+        return df.set_index('date')
+    for field, freq in (('quarter', 'Q'), ('month', 'M')):
+        if 'year' in df and field in df:
+            sep = 'Q' if field == 'quarter' else '-'
+            periods = [f'{year}{sep}{period}' for year, period in zip(df['year'], df[field])]
+            df.index = pd.PeriodIndex(periods, freq=freq, name='period')
+            return df.drop(columns=['year', field])
+    return df
+
+
+def get_arrow_type(pa: Any, kind: FieldKind):
+    return {
+        'date': pa.date32(),
+        'int': pa.int64(),
+        'number': pa.float64(),
+        'text': pa.string(),
+    }[kind]
+
+
+def to_arrow(data: list[dict[str, Any]] | dict[str, Any] | None, data_type: type):
+    """
+    Converts rows into an Arrow `Table`.
+
+    Dates become `date32`, integers `int64` and numeric strings `float64`, converted
+    by Arrow compute kernels; missing values become nulls.
+
+    Parameters:
+        data (list[dict] | dict | None): Rows returned by a resource method.
+        data_type (type): The data type of the rows, e.g. `StockPrice`.
+
+    Returns:
+        A `pyarrow.Table` of the rows.
+    """
+    pa = import_optional('pyarrow', 'arrow')
+    rows = as_rows(data)
+    arrays, fields = [], []
+    for name, kind in get_fields(rows, data_type).items():
+        values = [row.get(name) for row in rows]
+        try:
+            array = pa.array(values, type=pa.string() if kind in ('date', 'number') else None)
+            array = array.cast(get_arrow_type(pa, kind))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array(values)
+        if array.type == pa.null():
+            array = array.cast(get_arrow_type(pa, kind))
+        arrays.append(array)
+        fields.append(pa.field(name, array.type))
+    return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+
+@lru_cache
+def get_record_type(data_type: type, fields: tuple[str, ...] | None = None) -> type:
+    """
+    Returns the compact record type of a data type such as `StockPrice`.
+
+    Records are named tuples generated from the fields of the `TypedDict`, so the field
+    names are stored once in the class instead of in every row.
+    """
+    return namedtuple(data_type.__name__, fields or tuple(get_schema(data_type)), rename=True)
+
+
+def to_records(data: list[dict[str, Any]] | dict[str, Any] | None, data_type: type):
+    """
+    Converts rows into compact records with attribute access.
+
+    Dates become `datetime.date`, integers `int` and numeric strings `float`, e.g.
+    `record.close`. A record takes a fraction of the memory of a row `dict`, and
+    `record._asdict()` converts it back.
+
+    Parameters:
+        data (list[dict] | dict | None): Rows returned by a resource method.
+        data_type (type): The data type of the rows, e.g. `StockPrice`.
+
+    Returns:
+        A record for a single row, otherwise a `list` of records.
+    """
+    rows = as_rows(data)
+    fields = get_fields(rows, data_type)
+    record_type = get_record_type(data_type, tuple(fields))
+    kinds = list(fields.values())
+    records = [
+        record_type._make([to_value(row.get(name), kind) for name, kind in zip(fields, kinds)])
+        for row in rows
+    ]
+    return records[0] if isinstance(data, dict) else records
+
+
+def to_value(value: Any, kind: FieldKind) -> Any:
+    if value is None or kind == 'text':
+        return value
+    try:
+        if kind == 'date':
+            return date.fromisoformat(value)
+        if kind == 'int':
+            return int(value)
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+CONVERTERS = {
+    'numpy': to_numpy,
+    'pandas': to_pandas,
+    'arrow': to_arrow,
+    'records': to_records,
+}
+
+
+def convert(data: Any, data_type: type, as_: str) -> Any:
+    """Converts the result of a resource method into the `as_` output format."""
+    if as_ not in CONVERTERS:
+        raise ValueError(f'Unknown output format: {as_}, expected one of {list(CONVERTERS)}')
+    return CONVERTERS[as_](data, data_type)
@@ -0,0 +1,81 @@
+import math
+import threading
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Decides when a slow request is duplicated, taking the first response of the two.
+
+    The delay before hedging is the `percentile` of the recently observed latencies,
+    e.g. their p95, so only the slowest requests are duplicated. Hedges are capped to
+    `max_ratio` of the requests, so a slow upstream is not flooded with duplicates.
+    Only `GET` requests are hedged, since they are idempotent, and duplicates take a
+    token of the client's rate limiter like any other request.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.hedge import HedgePolicy
+
+        fa = FmdApi(hedge=HedgePolicy(percentile=95, max_ratio=0.05))
+        ```
+
+    Parameters:
+        percentile (float): The percentile of the observed latencies after which a request is hedged.
+        min_delay (float): The minimum delay in seconds before hedging.
+        max_ratio (float): The maximum ratio of hedged requests to requests.
+        window (int): The number of recent latencies the percentile is computed from.
+        min_samples (int): The number of latencies observed before hedging starts.
+        max_workers (int): The maximum number of threads sending the duplicates of `FmdApi`.
+
+    Attributes:
+        requests (int): Number of requests which could have been hedged.
+        hedges (int): Number of duplicated requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        max_ratio: float = 0.1,
+        window: int = 1000,
+        min_samples: int = 20,
+        max_workers: int = 64,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError('percentile must be between 0 and 100')
+        if not 0 <= max_ratio <= 1:
+            raise ValueError('max_ratio must be between 0 and 1')
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+
+    def get_delay(self) -> float | None:
+        """Returns the seconds to wait before hedging a new request, `None` means no hedging."""
+        with self._lock:
+            self.requests += 1
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        index = min(math.ceil(len(latencies) * self.percentile / 100) - 1, len(latencies) - 1)
+        return max(latencies[max(index, 0)], self.min_delay)
+
+    def allow_hedge(self) -> bool:
+        """Takes a hedge, unless hedging again would exceed `max_ratio`."""
+        with self._lock:
+            if self.hedges + 1 > self.max_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def record(self, latency: float) -> None:
+        """Records the latency in seconds of a completed request."""
+        with self._lock:
+            self._latencies.append(latency)
@@ -0,0 +1,102 @@
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class RequestEvent:
+    """
+    An attempt of a request, passed to the `Hooks` of a client.
+
+    The same event is passed to every hook of an attempt, and is filled in as the
+    attempt progresses.
+
+    Attributes:
+        method (str): The HTTP method.
+        path (str): The path of the request, e.g. `/stock/2330/price`.
+        endpoint (str): The path with the symbol replaced, e.g. `/stock/{symbol}/price`.
+        params (dict[str, Any] | None): The query params.
+        attempt (int): The number of the attempt, `0` for the first one.
+        status_code (int | None): The status code of the response.
+        error (Exception | None): The exception raised by the attempt.
+        delay (float | None): The seconds to wait before the next attempt, set for `on_retry`.
+        elapsed (float | None): Seconds from sending the request to receiving the whole response.
+        timings (dict[str, float]): Seconds spent in each phase: `connect` to open a connection,
+            `wait` for the response headers, `download` for the body and `decode` to parse it.
+            Phases not reported by the backend are missing.
+        wire_bytes (int | None): Bytes of the response body received on the wire.
+        decoded_bytes (int | None): Bytes of the decoded response body.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        attempt: int = 0,
+    ) -> None:
+        self.method = method
+        self.path = path
+        self.endpoint = get_endpoint_template(path)
+        self.params = params
+        self.attempt = attempt
+        self.status_code: int | None = None
+        self.error: Exception | None = None
+        self.delay: float | None = None
+        self.elapsed: float | None = None
+        self.timings: dict[str, float] = {}
+        self.wire_bytes: int | None = None
+        self.decoded_bytes: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f'RequestEvent({self.method.upper()} {self.path}, attempt={self.attempt}, '
+            f'status_code={self.status_code}, error={self.error!r})'
+        )
+
+
+class Hooks:
+    """
+    Base class of the hooks called around every attempt of a request.
+
+    Override the methods of interest and pass the hooks to the client, e.g.
+    `FmdApi(hooks=[LogHooks()])`. Hooks run in the thread or task sending the request,
+    so they should be quick.
+
+    Example:
+        ```python
+        import logging
+
+        from fmd import FmdApi
+        from fmd.hooks import Hooks
+
+
+        class LogRetries(Hooks):
+            def on_retry(self, event):
+                logging.warning('Retrying %s in %.1fs: %r', event.path, event.delay, event.error)
+
+
+        fa = FmdApi(hooks=[LogRetries()])
+        ```
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before every attempt is sent."""
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called after a response is received and, for the final attempt, decoded."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called before waiting `event.delay` seconds to retry a failed attempt."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when a request fails for good, before the exception is raised."""
+
+
+def get_endpoint_template(path: str) -> str:
+    """Returns the path with the symbol replaced, e.g. `/stock/{symbol}/price`."""
+    if '://' in path:
+        path = urlsplit(path).path or '/'
+    path = path.split('?', 1)[0]
+    parts = path.split('/')
+    if len(parts) > 3:
+        parts[2] = '{symbol}'
+    return '/'.join(parts)
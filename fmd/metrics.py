@@ -0,0 +1,273 @@
+import bisect
+import os
+import threading
+from pathlib import Path
+from typing import Any, TextIO
+
+from fmd.hooks import Hooks, RequestEvent
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """
+    Cumulative histogram of observed values, with Prometheus' bucket semantics.
+
+    Parameters:
+        buckets (tuple[float, ...]): The sorted upper bounds of the buckets, `+Inf` is implied.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Returns `(upper_bound, count)` of every bucket, counting all smaller values."""
+        total, result = 0, []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> float | None:
+        """Estimates the `q` quantile, e.g. `0.99`, as the upper bound of its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')  # pragma: no cover
+
+
+class ClientMetrics(Hooks):
+    """
+    In-process metrics registry of a client.
+
+    Collects per-endpoint latency histograms, request, error and retry counters, time
+    spent per phase, cache hits and misses, and the bytes received on the wire versus
+    decoded. Endpoints are paths with the symbol replaced, e.g. `/stock/{symbol}/price`.
+    Every client has one as `metrics`, which can be exported in the Prometheus text format.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+
+        fa = FmdApi()
+        fa.stock.get_available_list()
+        fa.metrics.compression_ratio
+        fa.metrics.latency['/stock'].quantile(0.99)
+        fa.metrics.write_prometheus('/var/lib/node_exporter/fmd.prom')
+        ```
+
+    Parameters:
+        buckets (tuple[float, ...]): The upper bounds in seconds of the latency buckets.
+
+    Attributes:
+        responses (int): Number of responses received.
+        wire_bytes (int): Bytes of the response bodies received on the wire.
+        decoded_bytes (int): Bytes of the decoded response bodies.
+        endpoints (dict[str, dict[str, int]]): The response and byte counters per endpoint.
+        latency (dict[str, Histogram]): Latency of the attempts per endpoint.
+        requests (dict[tuple[str, str], int]): Attempts per endpoint and status code, or
+            `error` when no response was received.
+        retries (dict[str, int]): Retried attempts per endpoint.
+        errors (dict[str, int]): Failed requests per endpoint.
+        phases (dict[tuple[str, str], float]): Seconds spent per endpoint and phase.
+        cache_hits (dict[str, int]): Requests served from the response cache per endpoint.
+        cache_misses (dict[str, int]): Requests not found in the response cache per endpoint.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Resets every metric."""
+        self.responses = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.endpoints: dict[str, dict[str, int]] = {}
+        self.latency: dict[str, Histogram] = {}
+        self.requests: dict[tuple[str, str], int] = {}
+        self.retries: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        self.phases: dict[tuple[str, str], float] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.cache_misses: dict[str, int] = {}
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._observe(event, str(event.status_code))
+        if event.wire_bytes is not None and event.decoded_bytes is not None:
+            self.record_transfer(event.endpoint, event.wire_bytes, event.decoded_bytes)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            if event.status_code is None:
+                self._observe(event, 'error')
+            increment(self.retries, event.endpoint)
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            if event.status_code is None:
+                self._observe(event, 'error')
+            increment(self.errors, event.endpoint)
+
+    def record_cache(self, endpoint: str, hit: bool) -> None:
+        """Records a lookup of the response cache."""
+        with self._lock:
+            increment(self.cache_hits if hit else self.cache_misses, endpoint)
+
+    def record_transfer(self, endpoint: str, wire_bytes: int, decoded_bytes: int) -> None:
+        """Records the wire and decoded sizes of a response body."""
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            counters = self.endpoints.setdefault(
+                endpoint, {'responses': 0, 'wire_bytes': 0, 'decoded_bytes': 0}
+            )
+            counters['responses'] += 1
+            counters['wire_bytes'] += wire_bytes
+            counters['decoded_bytes'] += decoded_bytes
+
+    @property
+    def compression_ratio(self) -> float:
+        """Decoded bytes per wire byte, `1.0` when nothing was compressed."""
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def cache_hit_ratio(self, endpoint: str | None = None) -> float:
+        """Returns the ratio of cache hits of an endpoint, or of all endpoints."""
+        with self._lock:
+            if endpoint is None:
+                hits, misses = sum(self.cache_hits.values()), sum(self.cache_misses.values())
+            else:
+                hits, misses = self.cache_hits.get(endpoint, 0), self.cache_misses.get(endpoint, 0)
+        return hits / (hits + misses) if hits + misses else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns a copy of the transfer counters."""
+        with self._lock:
+            return {
+                'responses': self.responses,
+                'wire_bytes': self.wire_bytes,
+                'decoded_bytes': self.decoded_bytes,
+                'endpoints': {name: dict(counters) for name, counters in self.endpoints.items()},
+            }
+
+    def to_prometheus(self, prefix: str = 'fmd') -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            metric = f'{prefix}_request_duration_seconds'
+            lines += [
+                f'# HELP {metric} Latency of request attempts.',
+                f'# TYPE {metric} histogram',
+            ]
+            for endpoint, histogram in sorted(self.latency.items()):
+                labels = f'endpoint="{escape(endpoint)}"'
+                for bound, count in histogram.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f'{metric}_sum{{{labels}}} {histogram.sum!r}')
+                lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+            counters = [
+                ('requests_total', 'Request attempts by status code.', self.requests, 'status'),
+                ('retries_total', 'Retried request attempts.', self.retries, None),
+                ('errors_total', 'Requests that failed after every attempt.', self.errors, None),
+                ('phase_seconds_total', 'Seconds spent per request phase.', self.phases, 'phase'),
+                ('cache_hits_total', 'Requests served from the cache.', self.cache_hits, None),
+                ('cache_misses_total', 'Requests not found in the cache.', self.cache_misses, None),
+                (
+                    'response_wire_bytes_total',
+                    'Bytes of response bodies received on the wire.',
+                    {k: v['wire_bytes'] for k, v in self.endpoints.items()},
+                    None,
+                ),
+                (
+                    'response_decoded_bytes_total',
+                    'Bytes of decoded response bodies.',
+                    {k: v['decoded_bytes'] for k, v in self.endpoints.items()},
+                    None,
+                ),
+            ]
+            for name, help_text, values, label in counters:
+                metric = f'{prefix}_{name}'
+                lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} counter']
+                for key, value in sorted(values.items()):
+                    if label is None:
+                        labels = f'endpoint="{escape(key)}"'
+                    else:
+                        labels = f'endpoint="{escape(key[0])}",{label}="{escape(key[1])}"'
+                    lines.append(f'{metric}{{{labels}}} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, target: str | Path | TextIO, prefix: str = 'fmd') -> None:
+        """
+        Writes every metric in the Prometheus text format.
+
+        Parameters:
+            target (str | Path | TextIO): A file path, e.g. for the node_exporter textfile
+                collector, which is replaced atomically, or any object with a `write()` method.
+            prefix (str): The prefix of the metric names.
+        """
+        text = self.to_prometheus(prefix)
+        if hasattr(target, 'write'):
+            target.write(text)
+            return
+        import tempfile
+
+        path = Path(target)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.')
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def _observe(self, event: RequestEvent, status: str) -> None:
+        increment(self.requests, (event.endpoint, status))
+        if event.elapsed is not None:
+            histogram = self.latency.get(event.endpoint)
+            if histogram is None:
+                histogram = self.latency[event.endpoint] = Histogram(self.buckets)
+            histogram.observe(event.elapsed)
+        for phase, seconds in event.timings.items():
+            increment(self.phases, (event.endpoint, phase), seconds)
+
+
+def increment(counters: dict[Any, Any], key: Any, value: float = 1) -> None:
+    counters[key] = counters.get(key, 0) + value
+
+
+def escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def get_wire_bytes(res: Any) -> int:
+    """
+    Returns the bytes of a response body received on the wire.
+
+    Reads the counters of `requests` and `httpx` responses, falling back to the size of
+    the decoded body for other backends.
+    """
+    raw = getattr(res, 'raw', None)
+    tell = getattr(raw, 'tell', None)
+    if tell is not None:
+        try:
+            wire_bytes = tell()
+        except (OSError, ValueError):
+            wire_bytes = None
+        if isinstance(wire_bytes, int):
+            return wire_bytes
+    wire_bytes = getattr(res, 'num_bytes_downloaded', None)
+    if isinstance(wire_bytes, int):
+        return wire_bytes
+    return len(res.content)
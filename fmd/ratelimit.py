@@ -0,0 +1,128 @@
+import os
+import struct
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter shared by every thread of the process.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per second.
+    Each request takes one token; when the bucket is empty the caller waits for
+    its turn, so concurrent callers are spread evenly over time.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.ratelimit import TokenBucket
+
+        fa = FmdApi(rate_limiter=TokenBucket(rate=10, burst=20))
+        ```
+
+    Parameters:
+        rate (float): Number of requests allowed per second.
+        burst (int): Number of requests allowed at once after being idle.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError('rate must be positive and burst must be at least 1')
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        """
+        Takes a token and returns the seconds to wait before it can be used.
+
+        With `max_wait`, the token is only taken when it can be used within `max_wait`
+        seconds, otherwise `None` is returned and the bucket is left as it was.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, self._updated, wait = self._take(
+                self._tokens, self._updated, now, max_wait
+            )
+            return wait
+
+    def acquire(self) -> None:
+        """Takes a token, blocking until it can be used."""
+        time.sleep(self.reserve())
+
+    def _take(
+        self, tokens: float, updated: float, now: float, max_wait: float | None = None
+    ) -> tuple[float, float, float | None]:
+        """Returns the refilled tokens after taking one, their update time and the wait."""
+        tokens = min(tokens + (now - updated) * self.rate, float(self.burst))
+        wait = max((1 - tokens) / self.rate, 0.0)
+        if max_wait is not None and wait > max_wait:
+            return tokens, now, None
+        return tokens - 1, now, wait
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket rate limiter shared by every process of the host.
+
+    The bucket state is stored in a small file guarded by an exclusive `flock`, so
+    all workers using the same `path` share one rate. Only available on POSIX systems.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.ratelimit import FileTokenBucket
+
+        fa = FmdApi(rate_limiter=FileTokenBucket(rate=10, burst=20, path='/tmp/fmd.bucket'))
+        ```
+
+    Parameters:
+        rate (float): Number of requests allowed per second.
+        burst (int): Number of requests allowed at once after being idle.
+        path (str): Path of the file holding the bucket state.
+    """
+
+    _state = struct.Struct('dd')
+
+    def __init__(self, rate: float, burst: int = 1, path: str = 'fmd.bucket') -> None:
+        try:
+            import fcntl
+        except ImportError as e:  # pragma: no cover
+            raise ImportError('FileTokenBucket is only available on POSIX systems') from e
+
+        super().__init__(rate, burst)
+        self._fcntl = fcntl
+        self.path = path
+        self._fd: int | None = None
+        self._pid: int | None = None
+
+    def reserve(self, max_wait: float | None = None) -> float | None:
+        with self._lock:
+            fd = self._open()
+            self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+            try:
+                # NOTE: Wall clock time, since the state is shared between processes
+                now = time.time()
+                data = os.pread(fd, self._state.size, 0)
+                if len(data) == self._state.size:
+                    tokens, updated = self._state.unpack(data)
+                else:
+                    tokens, updated = float(self.burst), now
+                tokens, updated, wait = self._take(tokens, updated, now, max_wait)
+                os.pwrite(fd, self._state.pack(tokens, updated), 0)
+            finally:
+                self._fcntl.flock(fd, self._fcntl.LOCK_UN)
+            return wait
+
+    def _open(self) -> int:
+        # NOTE: A forked child shares the parent's open file, and thus its lock, so reopen it
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def __del__(self) -> None:
+        if getattr(self, '_fd', None) is not None and self._pid == os.getpid():
+            os.close(self._fd)
@@ -1,5 +1,56 @@
-from fmd.resources.etf.obj import ETF, ETFManager
-from fmd.resources.index.obj import Index, IndexManager
-from fmd.resources.stock.obj import Stock, StockManager
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ['StockManager', 'Stock', 'ETFManager', 'ETF', 'IndexManager', 'Index']
+if TYPE_CHECKING:
+    from fmd.resources.etf.obj import ETF, AsyncETF, AsyncETFManager, ETFManager
+    from fmd.resources.index.obj import (
+        AsyncIndex,
+        AsyncIndexManager,
+        Index,
+        IndexManager,
+    )
+    from fmd.resources.stock.obj import (
+        AsyncStock,
+        AsyncStockManager,
+        Stock,
+        StockManager,
+    )
+
+__all__ = [
+    'StockManager',
+    'Stock',
+    'ETFManager',
+    'ETF',
+    'IndexManager',
+    'Index',
+    'AsyncStockManager',
+    'AsyncStock',
+    'AsyncETFManager',
+    'AsyncETF',
+    'AsyncIndexManager',
+    'AsyncIndex',
+]
+
+# NOTE: Loaded on first access (PEP 562), so using one resource doesn't import the others
+_LAZY_ATTRS = {
+    **dict.fromkeys(
+        ['StockManager', 'Stock', 'AsyncStockManager', 'AsyncStock'], 'fmd.resources.stock.obj'
+    ),
+    **dict.fromkeys(['ETFManager', 'ETF', 'AsyncETFManager', 'AsyncETF'], 'fmd.resources.etf.obj'),
+    **dict.fromkeys(
+        ['IndexManager', 'Index', 'AsyncIndexManager', 'AsyncIndex'], 'fmd.resources.index.obj'
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
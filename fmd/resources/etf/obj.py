@@ -1,8 +1,9 @@
 from datetime import date
-from typing import cast
+from typing import Any, Iterable, Iterator, cast
 
 from fmd.base import ManagerBase, ObjectBase
-from fmd.decorators import default_data_range
+from fmd.chunking import Window
+from fmd.decorators import default_data_range, output
 from fmd.resources.etf.types import (
     ETFDividend,
     ETFInstitutionTradeSummary,
@@ -32,8 +33,15 @@ class ETF(ObjectBase):
             Retrieves the price data for the ETF within the specified date range.
         get_dividend(start_year, end_year):
             Retrieves the dividend data for the ETF within the specified year range.
+        iter_price(start_date, end_date, window, prefetch):
+            Iterates over the price data for the ETF window by window.
+        iter_margin_balance(start_date, end_date, window, prefetch):
+            Iterates over the margin balance data for the ETF window by window.
+        iter_institution_trade_summary(start_date, end_date, window, prefetch):
+            Iterates over the institution trade summary for the ETF window by window.
     """
 
+    @output(ETFPrice)
     @default_data_range(freq='daily', days=30)
     def get_price(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -45,6 +53,8 @@ class ETF(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for the price data.
             end_date (str | date | None): The end date for the price data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `ETFPrice` objects containing price information.
@@ -53,6 +63,7 @@ class ETF(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(ETFDividend)
     @default_data_range(freq='yearly', years=3)
     def get_dividend(
         self, start_year: int | None = None, end_year: int | None = None
@@ -64,6 +75,8 @@ class ETF(ObjectBase):
         Parameters:
             start_year (int | None): The start year for the dividend data.
             end_year (int | None): The end year for the dividend data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `ETFDividend` objects containing dividend information.
@@ -72,16 +85,22 @@ class ETF(ObjectBase):
         params = {'start_year': start_year, 'end_year': end_year}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(ETFProfile)
     def get_profile(self) -> ETFProfile:
         """
         Retrieves the profile for the ETF.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A `ETFProfile` object containing the profile information of the ETF.
         """
         path = f'/etf/{self.symbol}/profile'
         return self.manger.fa.send_request('get', path)
 
+    @output(ETFMarginBalance)
     @default_data_range(freq='daily', days=30)
     def get_margin_balance(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -93,6 +112,8 @@ class ETF(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for data.
             end_date (str | date | None): The end date for data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `ETFMarginBalance` objects containing margin balance information.
@@ -101,6 +122,7 @@ class ETF(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(ETFInstitutionTradeSummary)
     @default_data_range(freq='daily', days=30)
     def get_institution_trade_summary(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -112,6 +134,8 @@ class ETF(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for data.
             end_date (str | date | None): The end date for data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `ETFInstitutionTradeSummary` objects containing institutions trade summary.
@@ -120,6 +144,82 @@ class ETF(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    def iter_price(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[ETFPrice]]:
+        """
+        Iterates over the price data for the ETF window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `ETFPrice` data of every window, in order.
+        """
+        return self._iter_range('get_price', start_date, end_date, window, prefetch, **kwargs)
+
+    def iter_margin_balance(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[ETFMarginBalance]]:
+        """
+        Iterates over the margin balance data for the ETF window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_margin_balance()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `ETFMarginBalance` data of every window, in order.
+        """
+        return self._iter_range(
+            'get_margin_balance', start_date, end_date, window, prefetch, **kwargs
+        )
+
+    def iter_institution_trade_summary(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[ETFInstitutionTradeSummary]]:
+        """
+        Iterates over the institution trade summary for the ETF window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_institution_trade_summary()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `ETFInstitutionTradeSummary` data of every window, in order.
+        """
+        return self._iter_range(
+            'get_institution_trade_summary', start_date, end_date, window, prefetch, **kwargs
+        )
+
 
 class ETFManager(ManagerBase):
     """
@@ -128,8 +228,12 @@ class ETFManager(ManagerBase):
     Methods:
         get(symbol):
             Retrieves an ETF object based on the provided symbol.
+        get_many(symbols, max_workers):
+            Retrieves a group of ETF objects whose methods run concurrently for every symbol.
         get_available_list():
             Retrieves a list of available ETFs with their profiles.
+        iter_prices(symbols, start_date, end_date, window, prefetch):
+            Iterates over the price data of many symbols window by window.
     """
 
     _obj = ETF
@@ -146,12 +250,93 @@ class ETFManager(ManagerBase):
         """
         return cast(cls._obj, super().get(symbol=symbol))
 
+    @output(ETFProfile)
     def get_available_list(self) -> list[ETFProfile]:
         """
         Retrieves a list of available ETFs with their profiles.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A list of `ETFProfile` objects containing the profile information of available ETFs.
         """
         path = '/etf'
         return self.fa.send_request('get', path)
+
+    def iter_prices(
+        self,
+        symbols: Iterable[str],
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[tuple[str, list[ETFPrice]]]:
+        """
+        Iterates over the price data of many symbols window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer, so memory stays flat
+        regardless of the number of symbols.
+
+        Example:
+            ```python
+            for symbol, rows in fa.etf.iter_prices(symbols, start_date='2004-01-01'):
+                write(symbol, rows)
+            ```
+
+        Parameters:
+            symbols (Iterable[str]): The symbols to iterate over, consumed lazily.
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of `(symbol, data)` tuples, in the order of `symbols`.
+        """
+        return self.iter_many(
+            symbols, 'get_price', start_date, end_date, window, prefetch, **kwargs
+        )
+
+
+class AsyncETF(ETF):
+    """
+    Represents an ETF retrieved through `AsyncFmdApi`.
+
+    Provides the same methods as `ETF`, but each of them returns an awaitable,
+    and the `iter_*` methods return async iterators.
+
+    Example:
+        ```python
+        from fmd import AsyncFmdApi
+
+        async with AsyncFmdApi() as fa:
+            etf = fa.etf.get(symbol='0050')
+            data = await etf.get_price()
+        ```
+    """
+
+
+class AsyncETFManager(ETFManager):
+    """
+    Manages multiple AsyncETF objects.
+
+    Provides the same methods as `ETFManager`, but `get_available_list()` returns an awaitable
+    and `iter_prices()` returns an async iterator.
+    """
+
+    _obj = AsyncETF
+
+    def get(self, symbol: str) -> AsyncETF:
+        """
+        Retrieves an AsyncETF object based on the provided symbol.
+
+        Parameters:
+            symbol (str): The symbol of the ETF to retrieve.
+
+        Returns:
+            An `AsyncETF` object corresponding to the provided symbol.
+        """
+        return cast(self._obj, super().get(symbol=symbol))
@@ -1,8 +1,9 @@
 from datetime import date
-from typing import cast
+from typing import Any, Iterable, Iterator, cast
 
 from fmd.base import ManagerBase, ObjectBase
-from fmd.decorators import default_data_range
+from fmd.chunking import Window
+from fmd.decorators import default_data_range, output
 from fmd.resources.index.types import IndexPrice, IndexProfile
 
 
@@ -26,8 +27,11 @@ class Index(ObjectBase):
             Retrieves the price data for the index within the specified date range.
         get_profile():
             Retrieves the profile information of the index.
+        iter_price(start_date, end_date, window, prefetch):
+            Iterates over the price data for the index window by window.
     """
 
+    @output(IndexPrice)
     @default_data_range(freq='daily', days=30)
     def get_price(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -39,6 +43,8 @@ class Index(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for the price data.
             end_date (str | date | None): The end date for the price data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `IndexPrice` objects containing price information.
@@ -47,16 +53,45 @@ class Index(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(IndexProfile)
     def get_profile(self) -> IndexProfile:
         """
         Retrieves the profile for the index.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A `IndexProfile` object containing the profile information of the index.
         """
         path = f'/index/{self.symbol}/profile'
         return self.manger.fa.send_request('get', path)
 
+    def iter_price(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[IndexPrice]]:
+        """
+        Iterates over the price data for the index window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `IndexPrice` data of every window, in order.
+        """
+        return self._iter_range('get_price', start_date, end_date, window, prefetch, **kwargs)
+
 
 class IndexManager(ManagerBase):
     """
@@ -65,8 +100,12 @@ class IndexManager(ManagerBase):
     Methods:
         get(symbol):
             Retrieves a Index object based on the provided symbol.
+        get_many(symbols, max_workers):
+            Retrieves a group of Index objects whose methods run concurrently for every symbol.
         get_available_list():
             Retrieves a list of available indexs with their profiles.
+        iter_prices(symbols, start_date, end_date, window, prefetch):
+            Iterates over the price data of many symbols window by window.
     """
 
     _obj = Index
@@ -83,12 +122,93 @@ class IndexManager(ManagerBase):
         """
         return cast(self._obj, super().get(symbol=symbol))
 
+    @output(IndexProfile)
     def get_available_list(self) -> list[IndexProfile]:
         """
         Retrieves a list of available indexs with their profiles.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A list of `IndexProfile` objects containing the profile information of available indexs.
         """
         path = '/index'
         return self.fa.send_request('get', path)
+
+    def iter_prices(
+        self,
+        symbols: Iterable[str],
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[tuple[str, list[IndexPrice]]]:
+        """
+        Iterates over the price data of many symbols window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer, so memory stays flat
+        regardless of the number of symbols.
+
+        Example:
+            ```python
+            for symbol, rows in fa.index.iter_prices(symbols, start_date='2004-01-01'):
+                write(symbol, rows)
+            ```
+
+        Parameters:
+            symbols (Iterable[str]): The symbols to iterate over, consumed lazily.
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of `(symbol, data)` tuples, in the order of `symbols`.
+        """
+        return self.iter_many(
+            symbols, 'get_price', start_date, end_date, window, prefetch, **kwargs
+        )
+
+
+class AsyncIndex(Index):
+    """
+    Represents an index retrieved through `AsyncFmdApi`.
+
+    Provides the same methods as `Index`, but each of them returns an awaitable,
+    and the `iter_*` methods return async iterators.
+
+    Example:
+        ```python
+        from fmd import AsyncFmdApi
+
+        async with AsyncFmdApi() as fa:
+            index = fa.index.get(symbol='LI0001')
+            data = await index.get_price()
+        ```
+    """
+
+
+class AsyncIndexManager(IndexManager):
+    """
+    Manages multiple AsyncIndex objects.
+
+    Provides the same methods as `IndexManager`, but `get_available_list()` returns an awaitable
+    and `iter_prices()` returns an async iterator.
+    """
+
+    _obj = AsyncIndex
+
+    def get(self, symbol: str) -> AsyncIndex:
+        """
+        Retrieves an AsyncIndex object based on the provided symbol.
+
+        Parameters:
+            symbol (str): The symbol of the index to retrieve.
+
+        Returns:
+            An `AsyncIndex` object corresponding to the provided symbol.
+        """
+        return cast(self._obj, super().get(symbol=symbol))
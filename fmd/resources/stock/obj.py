@@ -1,8 +1,9 @@
 from datetime import date
-from typing import cast
+from typing import Any, Iterable, Iterator, cast
 
 from fmd.base import ManagerBase, ObjectBase
-from fmd.decorators import default_data_range
+from fmd.chunking import Window
+from fmd.decorators import default_data_range, output
 from fmd.resources.stock.types import (
     BalanceSheet,
     CashFlowStatement,
@@ -57,8 +58,17 @@ class Stock(ObjectBase):
             Retrieves the institution trade summary for the stock within the specified date range.
         get_cash_flow_statement(start_year, start_quarter, end_year, end_quarter):
             Retrieves the cash flow statement data for the stock within the specified date range.
+        iter_price(start_date, end_date, window, prefetch):
+            Iterates over the price data for the stock window by window.
+        iter_vm(start_date, end_date, window, prefetch):
+            Iterates over the valuation measurement data for the stock window by window.
+        iter_margin_balance(start_date, end_date, window, prefetch):
+            Iterates over the margin balance data for the stock window by window.
+        iter_institution_trade_summary(start_date, end_date, window, prefetch):
+            Iterates over the institution trade summary for the stock window by window.
     """
 
+    @output(StockPrice)
     @default_data_range(freq='daily', days=30)
     def get_price(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -70,6 +80,8 @@ class Stock(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for the price data.
             end_date (str | date | None): The end date for the price data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `StockPrice` objects containing price information.
@@ -78,6 +90,7 @@ class Stock(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(ValuationMeasurement)
     @default_data_range(freq='daily', days=30)
     def get_vm(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -89,6 +102,8 @@ class Stock(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for the valuation measurement data.
             end_date (str | date | None): The end date for the valuation measurement data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `ValuationMeasurement` objects containing valuation measurement information.
@@ -97,6 +112,7 @@ class Stock(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(StockDividend)
     @default_data_range(freq='yearly', years=3)
     def get_dividend(
         self, start_year: int | None = None, end_year: int | None = None
@@ -108,6 +124,8 @@ class Stock(ObjectBase):
         Parameters:
             start_year (int | None): The start year for the dividend data.
             end_year (int | None): The end year for the dividend data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `StockDividend` objects containing dividend information.
@@ -116,16 +134,22 @@ class Stock(ObjectBase):
         params = {'start_year': start_year, 'end_year': end_year}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(StockCompany)
     def get_company(self) -> StockCompany:
         """
         Retrieves the company profile for the stock.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A `StockCompany` object containing the company's profile information.
         """
         path = f'/stock/{self.symbol}/company'
         return self.manger.fa.send_request('get', path)
 
+    @output(Revenue)
     @default_data_range(freq='monthly', months=6)
     def get_revenue(
         self,
@@ -143,6 +167,8 @@ class Stock(ObjectBase):
             start_month (int | None): The start month for the revenue data.
             end_year (int | None): The end year for the revenue data.
             end_month (int | None): The end month for the revenue data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `Revenue` objects containing revenue information.
@@ -156,6 +182,7 @@ class Stock(ObjectBase):
         }
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(FinancialRatio)
     @default_data_range(freq='quarterly', quarters=8)
     def get_financial_ratio(
         self,
@@ -173,6 +200,8 @@ class Stock(ObjectBase):
             start_quarter (int | None): The start quarter for the financial ratio data.
             end_year (int | None): The end year for the financial ratio data.
             end_quarter (int | None): The end quarter for the financial ratio data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `FinancialRatio` objects containing financial ratio information.
@@ -186,6 +215,7 @@ class Stock(ObjectBase):
         }
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(BalanceSheet)
     @default_data_range(freq='quarterly', quarters=8)
     def get_balance_sheet(
         self,
@@ -203,6 +233,8 @@ class Stock(ObjectBase):
             start_quarter (int | None): The start quarter for the balance sheet data.
             end_year (int | None): The end year for the balance sheet data.
             end_quarter (int | None): The end quarter for the balance sheet data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `BalanceSheet` objects containing balance sheet information.
@@ -216,6 +248,7 @@ class Stock(ObjectBase):
         }
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(IncomeStatement)
     @default_data_range(freq='quarterly', quarters=8)
     def get_income_statement(
         self,
@@ -233,6 +266,8 @@ class Stock(ObjectBase):
             start_quarter (int | None): The start quarter for the income statement data.
             end_year (int | None): The end year for the income statement data.
             end_quarter (int | None): The end quarter for the income statement data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `IncomeStatement` objects containing income statement information.
@@ -246,6 +281,7 @@ class Stock(ObjectBase):
         }
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(StockMarginBalance)
     @default_data_range(freq='daily', days=30)
     def get_margin_balance(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -257,6 +293,8 @@ class Stock(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for the data.
             end_date (str | date | None): The end date for the data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `StockMarginBalance` objects containing margin balance information.
@@ -265,6 +303,7 @@ class Stock(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(StockInstitutionTradeSummary)
     @default_data_range(freq='daily', days=30)
     def get_institution_trade_summary(
         self, start_date: str | date | None = None, end_date: str | date | None = None
@@ -276,6 +315,8 @@ class Stock(ObjectBase):
         Parameters:
             start_date (str | date | None): The start date for data.
             end_date (str | date | None): The end date for data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `StockInstitutionTradeSummary` objects containing institutions trade summary.
@@ -284,6 +325,7 @@ class Stock(ObjectBase):
         params = {'start_date': start_date, 'end_date': end_date}
         return self.manger.fa.send_request('get', path, params=params)
 
+    @output(CashFlowStatement)
     @default_data_range(freq='quarterly', quarters=8)
     def get_cash_flow_statement(
         self,
@@ -301,6 +343,8 @@ class Stock(ObjectBase):
             start_quarter (int | None): The start quarter for the cash flow statement data.
             end_year (int | None): The end year for the cash flow statement data.
             end_quarter (int | None): The end quarter for the cash flow statement data.
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
 
         Returns:
             A list of `CashFlowStatement` objects containing cash flow statement information.
@@ -314,6 +358,106 @@ class Stock(ObjectBase):
         }
         return self.manger.fa.send_request('get', path, params=params)
 
+    def iter_price(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[StockPrice]]:
+        """
+        Iterates over the price data for the stock window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `StockPrice` data of every window, in order.
+        """
+        return self._iter_range('get_price', start_date, end_date, window, prefetch, **kwargs)
+
+    def iter_vm(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[ValuationMeasurement]]:
+        """
+        Iterates over the valuation measurement data for the stock window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_vm()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `ValuationMeasurement` data of every window, in order.
+        """
+        return self._iter_range('get_vm', start_date, end_date, window, prefetch, **kwargs)
+
+    def iter_margin_balance(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[StockMarginBalance]]:
+        """
+        Iterates over the margin balance data for the stock window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_margin_balance()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `StockMarginBalance` data of every window, in order.
+        """
+        return self._iter_range(
+            'get_margin_balance', start_date, end_date, window, prefetch, **kwargs
+        )
+
+    def iter_institution_trade_summary(
+        self,
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 2,
+        **kwargs: Any,
+    ) -> Iterator[list[StockInstitutionTradeSummary]]:
+        """
+        Iterates over the institution trade summary for the stock window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer.
+
+        Parameters:
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_institution_trade_summary()`, e.g. `as_`.
+
+        Returns:
+            An iterator of the `StockInstitutionTradeSummary` data of every window, in order.
+        """
+        return self._iter_range(
+            'get_institution_trade_summary', start_date, end_date, window, prefetch, **kwargs
+        )
+
 
 class StockManager(ManagerBase):
     """
@@ -322,8 +466,12 @@ class StockManager(ManagerBase):
     Methods:
         get(symbol):
             Retrieves a Stock object based on the provided symbol.
+        get_many(symbols, max_workers):
+            Retrieves a group of Stock objects whose methods run concurrently for every symbol.
         get_available_list():
             Retrieves a list of available stocks with their profiles.
+        iter_prices(symbols, start_date, end_date, window, prefetch):
+            Iterates over the price data of many symbols window by window.
     """
 
     _obj = Stock
@@ -340,12 +488,93 @@ class StockManager(ManagerBase):
         """
         return cast(self._obj, super().get(symbol=symbol))
 
+    @output(StockProfile)
     def get_available_list(self) -> list[StockProfile]:
         """
         Retrieves a list of available stocks with their profiles.
 
+        Parameters:
+            as_ (str | None): Output format, `numpy`, `pandas`, `arrow` or `records`.
+                Defaults to the JSON data.
+
         Returns:
             A list of `StockProfile` objects containing the profile information of available stocks.
         """
         path = '/stock'
         return self.fa.send_request('get', path)
+
+    def iter_prices(
+        self,
+        symbols: Iterable[str],
+        start_date: str | date,
+        end_date: str | date | None = None,
+        window: Window = 'yearly',
+        prefetch: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[tuple[str, list[StockPrice]]]:
+        """
+        Iterates over the price data of many symbols window by window, e.g. year by year.
+        At most `prefetch` windows are fetched ahead of the consumer, so memory stays flat
+        regardless of the number of symbols.
+
+        Example:
+            ```python
+            for symbol, rows in fa.stock.iter_prices(symbols, start_date='2004-01-01'):
+                write(symbol, rows)
+            ```
+
+        Parameters:
+            symbols (Iterable[str]): The symbols to iterate over, consumed lazily.
+            start_date (str | date): The start date for the data.
+            end_date (str | date | None): The end date for the data, defaults to today.
+            window (str | int): The size of a window, `yearly`, `quarterly`, `monthly` or days.
+            prefetch (int): The maximum number of windows fetched ahead.
+            **kwargs: Arguments passed to `get_price()`, e.g. `as_`.
+
+        Returns:
+            An iterator of `(symbol, data)` tuples, in the order of `symbols`.
+        """
+        return self.iter_many(
+            symbols, 'get_price', start_date, end_date, window, prefetch, **kwargs
+        )
+
+
+class AsyncStock(Stock):
+    """
+    Represents a stock retrieved through `AsyncFmdApi`.
+
+    Provides the same methods as `Stock`, but each of them returns an awaitable,
+    and the `iter_*` methods return async iterators.
+
+    Example:
+        ```python
+        from fmd import AsyncFmdApi
+
+        async with AsyncFmdApi() as fa:
+            stock = fa.stock.get(symbol='2330')
+            data = await stock.get_price()
+        ```
+    """
+
+
+class AsyncStockManager(StockManager):
+    """
+    Manages multiple AsyncStock objects.
+
+    Provides the same methods as `StockManager`, but `get_available_list()` returns an awaitable
+    and `iter_prices()` returns an async iterator.
+    """
+
+    _obj = AsyncStock
+
+    def get(self, symbol: str) -> AsyncStock:
+        """
+        Retrieves a AsyncStock object based on the provided symbol.
+
+        Parameters:
+            symbol (str): The symbol of the stock to retrieve.
+
+        Returns:
+            A `AsyncStock` object corresponding to the provided symbol.
+        """
+        return cast(self._obj, super().get(symbol=symbol))
@@ -1,4 +1,4 @@
-from fmd.backend import JsonDict
+from fmd.types import JsonDict
 
 
 class StockProfile(JsonDict):
@@ -0,0 +1,128 @@
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait before the next attempt.
+
+    Delays grow exponentially with full jitter, i.e. a random value between 0 and
+    `min(backoff_max, backoff_base * 2 ** attempt)`, unless the server asks for a
+    specific delay with a `Retry-After` header. All attempts of a call, including the
+    waits between them, must finish before `deadline`.
+
+    Subclass it and override `is_retryable_exception()`, `is_retryable_response()` or
+    `get_delay()` to customize the behavior.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.retry import RetryPolicy
+
+        fa = FmdApi(retry=RetryPolicy(max_retries=3, deadline=10))
+        ```
+
+    Parameters:
+        max_retries (int): The maximum number of retries after the first attempt.
+        backoff_base (float): The base delay in seconds of the exponential backoff.
+        backoff_max (float): The upper bound in seconds of a single delay.
+        deadline (float | None): Seconds allowed for all attempts of a call, `None` means no limit.
+        retry_statuses (frozenset[int]): HTTP status codes which are retried, by default
+            `429`, `500`, `502`, `503` and `504`.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        deadline: float | None = 60.0,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+
+    def start(self) -> float | None:
+        """Returns the monotonic time at which a call starting now must be finished."""
+        if self.deadline is None:
+            return None
+        return time.monotonic() + self.deadline
+
+    def get_timeout(self, timeout: float | None, deadline_at: float | None) -> float | None:
+        """Returns the timeout of the next attempt, capped by the time left before the deadline."""
+        if deadline_at is None:
+            return timeout
+        remaining = max(deadline_at - time.monotonic(), 0.0)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def is_retryable_exception(
+        self, exc: Exception, retryable_exceptions: tuple[type[Exception], ...]
+    ) -> bool:
+        return isinstance(exc, retryable_exceptions)
+
+    def is_retryable_response(self, res: Any) -> bool:
+        return res.status_code in self.retry_statuses
+
+    def get_delay(self, retries: int, retry_after: float | None = None) -> float:
+        """Returns the seconds to wait before retry number `retries + 1`."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**retries))
+
+    def next_delay(
+        self,
+        retries: int,
+        max_retries: int,
+        deadline_at: float | None,
+        exc: Exception | None = None,
+        res: Any = None,
+        retryable_exceptions: tuple[type[Exception], ...] = (),
+    ) -> float | None:
+        """
+        Returns the seconds to wait before retrying, or `None` when the call should not be retried.
+
+        Parameters:
+            retries (int): The number of retries made so far.
+            max_retries (int): The maximum number of retries.
+            deadline_at (float | None): The value returned by `start()`.
+            exc (Exception | None): The exception raised by the last attempt.
+            res (Any): The response of the last attempt.
+            retryable_exceptions (tuple[type[Exception], ...]): Transport errors of the backend.
+        """
+        if retries >= max_retries:
+            return None
+        if exc is not None:
+            if not self.is_retryable_exception(exc, retryable_exceptions):
+                return None
+            delay = self.get_delay(retries)
+        else:
+            if not self.is_retryable_response(res):
+                return None
+            delay = self.get_delay(retries, parse_retry_after(res.headers.get('Retry-After')))
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parses a `Retry-After` header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls sharing the same key into a single call.
+
+    While a call for a key is in flight, other threads calling `do()` with the same
+    key wait for it and receive its result, or its exception, instead of running
+    the function again.
+
+    Attributes:
+        shared (int): Number of calls served by waiting on another call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future] = {}
+        self.shared = 0
+
+    def do(self, key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Calls `func(*args, **kwargs)`, unless a call for `key` is in flight already."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent calls sharing the same key into a single call on an event loop.
+
+    The asynchronous counterpart of `SingleFlight`.
+
+    Attributes:
+        shared (int): Number of calls served by waiting on another call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, Any] = {}
+        self.shared = 0
+
+    async def do(
+        self, key: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Awaits `func(*args, **kwargs)`, unless a call for `key` is in flight already."""
+        import asyncio
+
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func(*args, **kwargs))
+            task.add_done_callback(lambda task: self._done(key, task))
+        else:
+            self.shared += 1
+        # NOTE: The call runs as its own task and every caller shields it, so a cancelled
+        # caller, even the first one, doesn't cancel the call shared with the others
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: Any) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # NOTE: Mark it as retrieved, in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,200 @@
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any
+
+ONE_DAY = timedelta(days=1)
+
+
+def to_date(value: str | date) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+class RangeCache:
+    """
+    Interval cache of daily time series.
+
+    Remembers which date ranges of each endpoint, e.g. `/stock/2330/price`, are already
+    stored, so a request only fetches the missing gaps and the stored rows are merged
+    into one sorted series without duplicated dates. The current day is never marked
+    as stored, since its data may still change. Once more than `maxsize` endpoints are
+    stored, the least recently used one is evicted with all its rows.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.store import RangeCache
+
+        fa = FmdApi(range_cache=RangeCache())
+        stock = fa.stock.get('2330')
+        stock.get_price(start_date='2024-01-01', end_date='2024-06-30')
+        # Only 2024-07-01 ~ 2024-07-31 is fetched
+        stock.get_price(start_date='2024-03-01', end_date='2024-07-31')
+        ```
+
+    Parameters:
+        maxsize (int): Maximum number of endpoints, e.g. one per symbol for prices. It should
+            be well above the number of concurrent requests, whose rows are read back from
+            the cache once fetched.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive')
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._intervals: dict[str, list[tuple[date, date]]] = {}
+        self._rows: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    def get_gaps(self, path: str, start: date, end: date) -> list[tuple[date, date]]:
+        """Returns the ranges between `start` and `end` which are not stored yet."""
+        gaps = []
+        current = start
+        with self._lock:
+            intervals = self._intervals.get(path, [])
+            if path in self._rows:
+                self._rows.move_to_end(path)
+        for interval_start, interval_end in intervals:
+            if interval_end < current:
+                continue
+            if interval_start > end:
+                break
+            if interval_start > current:
+                gaps.append((current, interval_start - ONE_DAY))
+            current = max(current, interval_end + ONE_DAY)
+            if current > end:
+                break
+        if current <= end:
+            gaps.append((current, end))
+        return gaps
+
+    def update(self, path: str, start: date, end: date, rows: list[dict[str, Any]]) -> None:
+        """Stores the rows fetched for the range between `start` and `end`."""
+        end = min(end, datetime.today().date() - ONE_DAY)
+        with self._lock:
+            stored = self._rows.setdefault(path, {})
+            self._rows.move_to_end(path)
+            for row in rows:
+                stored[row['date']] = row
+            if start <= end:
+                self._intervals[path] = merge_intervals(
+                    self._intervals.get(path, []) + [(start, end)]
+                )
+            while len(self._rows) > self.maxsize:
+                evicted, _ = self._rows.popitem(last=False)
+                self._intervals.pop(evicted, None)
+
+    def read(self, path: str, start: date, end: date) -> list[dict[str, Any]]:
+        """Returns the stored rows between `start` and `end`, sorted by date."""
+        start_str, end_str = start.isoformat(), end.isoformat()
+        with self._lock:
+            stored = self._rows.get(path, {})
+            return [stored[d] for d in sorted(stored) if start_str <= d <= end_str]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._intervals.clear()
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def merge_intervals(intervals: list[tuple[date, date]]) -> list[tuple[date, date]]:
+    """Sorts the intervals and merges the overlapping or adjacent ones."""
+    merged: list[tuple[date, date]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + ONE_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class PeriodCache:
+    """
+    Cache of finalized quarterly and monthly periods.
+
+    Rows of closed periods, e.g. the financial statements of a past quarter, never change,
+    so once a newer period has been published they are stored permanently and are never
+    fetched again. Only the most recent period and the periods after it are refetched.
+
+    Example:
+        ```python
+        from fmd import FmdApi
+        from fmd.store import PeriodCache
+
+        fa = FmdApi(period_cache=PeriodCache())
+        stock = fa.stock.get('2330')
+        stock.get_balance_sheet(start_year=2020, start_quarter=1, end_year=2024, end_quarter=4)
+        # Only the latest published quarter is fetched again
+        stock.get_balance_sheet(start_year=2020, start_quarter=1, end_year=2024, end_quarter=4)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._rows: dict[str, dict[tuple[int, int], list[dict[str, Any]]]] = {}
+
+    def get_missing(self, key: str, periods: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Returns the periods which are not finalized yet."""
+        with self._lock:
+            stored = self._rows.get(key, {})
+            return [period for period in periods if period not in stored]
+
+    def update(
+        self,
+        key: str,
+        field: str,
+        periods: list[tuple[int, int]],
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Stores the rows of finalized periods fetched for `periods`.
+
+        Parameters:
+            key (str): The key of the endpoint.
+            field (str): The period field of the rows, `quarter` or `month`.
+            periods (list[tuple[int, int]]): The fetched periods.
+            rows (list[dict[str, Any]]): The fetched rows.
+
+        Returns:
+            The fetched rows of `periods`, sorted by period.
+        """
+        grouped: dict[tuple[int, int], list[dict[str, Any]]] = {period: [] for period in periods}
+        for row in rows:
+            period = (int(row['year']), int(row[field]))
+            if period in grouped:
+                grouped[period].append(row)
+        published = [period for period, period_rows in grouped.items() if period_rows]
+        if published:
+            latest = max(published)
+            with self._lock:
+                stored = self._rows.setdefault(key, {})
+                for period, period_rows in grouped.items():
+                    if period < latest:
+                        stored[period] = period_rows
+        return [row for period in sorted(grouped) for row in grouped[period]]
+
+    def read(self, key: str, periods: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        """Returns the stored rows of `periods`, sorted by period."""
+        with self._lock:
+            stored = self._rows.get(key, {})
+            return [row for period in sorted(periods) for row in stored.get(period, [])]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+
+
+def iter_periods(
+    start_year: int, start_period: int, end_year: int, end_period: int, per_year: int
+) -> list[tuple[int, int]]:
+    """Returns every (year, period) between the start and end, e.g. quarters when `per_year=4`."""
+    start = int(start_year) * per_year + int(start_period) - 1
+    end = int(end_year) * per_year + int(end_period) - 1
+    return [(i // per_year, i % per_year + 1) for i in range(start, end + 1)]
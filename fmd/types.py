@@ -0,0 +1,31 @@
+from enum import Enum
+from typing import Literal, TypedDict, TypeVar
+
+
+class JsonDict(TypedDict):
+    pass
+
+
+T = TypeVar('T', bound=JsonDict)
+
+
+class ResponseStatus(str, Enum):
+    SUCCESS = 'success'
+    FAIL = 'fail'
+
+
+class Response(TypedDict):
+    status: Literal[ResponseStatus.SUCCESS, ResponseStatus.FAIL]
+    msg: str
+
+
+class SuccessResponse(Response):
+    status: Literal[ResponseStatus.SUCCESS]
+    data: list[T] | T | None
+
+
+class FailResponse(Response):
+    status: Literal[ResponseStatus.FAIL]
+
+
+ResponseType = SuccessResponse | FailResponse
@@ -19,3 +19,18 @@ def mock_fa_send_request(mocker):
 @pytest.fixture
 def mock_manager_get(mocker):
     yield mocker.patch('fmd.base.ManagerBase.get')
+
+
+@pytest.fixture
+def mock_async_request(mocker):
+    yield mocker.patch('httpx.AsyncClient.request', new_callable=mocker.AsyncMock)
+
+
+@pytest.fixture
+def mock_async_send_request(mocker):
+    yield mocker.patch('fmd.backend.HttpxAsyncBackend.send_request', new_callable=mocker.AsyncMock)
+
+
+@pytest.fixture
+def mock_async_fa_send_request(mocker):
+    yield mocker.patch('fmd.client.AsyncFmdApi.send_request', new_callable=mocker.AsyncMock)
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
-from fmd import FmdApi
-from fmd.resources import ETF, ETFManager
+from fmd import AsyncFmdApi, FmdApi
+from fmd.resources import ETF, AsyncETF, AsyncETFManager, ETFManager
 
 
 class TestETF:
@@ -136,3 +138,34 @@ class TestETFManager:
         response = self.manager.get_available_list()
         mock_fa_send_request.assert_called_once_with('get', '/etf')
         assert response == {'data': 'available_list'}
+
+
+class TestAsyncETFManager:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.api = AsyncFmdApi()
+        self.manager = AsyncETFManager(self.api)
+        yield
+
+    def test_get_etf(self) -> None:
+        etf = self.manager.get(symbol='0050')
+
+        assert isinstance(etf, AsyncETF)
+        assert etf.symbol == '0050'
+
+    def test_get_price(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'price_data'}
+        etf = self.manager.get(symbol='0050')
+
+        response = asyncio.run(etf.get_price(start_date='2023-01-01', end_date='2023-01-31'))
+
+        mock_async_fa_send_request.assert_awaited_once()
+        assert response == {'data': 'price_data'}
+
+    def test_get_available_list(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'available_list'}
+
+        response = asyncio.run(self.manager.get_available_list())
+
+        mock_async_fa_send_request.assert_awaited_once_with('get', '/etf')
+        assert response == {'data': 'available_list'}
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
-from fmd import FmdApi
-from fmd.resources import Index, IndexManager
+from fmd import AsyncFmdApi, FmdApi
+from fmd.resources import AsyncIndex, AsyncIndexManager, Index, IndexManager
 
 
 class TestIndex:
@@ -69,3 +71,34 @@ class TestIndexManager:
         response = self.manager.get_available_list()
         mock_fa_send_request.assert_called_once_with('get', '/index')
         assert response == {'data': 'available_list'}
+
+
+class TestAsyncIndexManager:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.api = AsyncFmdApi()
+        self.manager = AsyncIndexManager(self.api)
+        yield
+
+    def test_get_index(self) -> None:
+        index = self.manager.get(symbol='LI0001')
+
+        assert isinstance(index, AsyncIndex)
+        assert index.symbol == 'LI0001'
+
+    def test_get_price(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'price_data'}
+        index = self.manager.get(symbol='LI0001')
+
+        response = asyncio.run(index.get_price(start_date='2023-01-01', end_date='2023-01-31'))
+
+        mock_async_fa_send_request.assert_awaited_once()
+        assert response == {'data': 'price_data'}
+
+    def test_get_available_list(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'available_list'}
+
+        response = asyncio.run(self.manager.get_available_list())
+
+        mock_async_fa_send_request.assert_awaited_once_with('get', '/index')
+        assert response == {'data': 'available_list'}
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
-from fmd import FmdApi
-from fmd.resources import Stock, StockManager
+from fmd import AsyncFmdApi, FmdApi
+from fmd.resources import AsyncStock, AsyncStockManager, Stock, StockManager
 
 
 class TestStock:
@@ -310,3 +312,34 @@ class TestStockManager:
         response = self.manager.get_available_list()
         mock_fa_send_request.assert_called_once_with('get', '/stock')
         assert response == {'data': 'available_list'}
+
+
+class TestAsyncStockManager:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.api = AsyncFmdApi()
+        self.manager = AsyncStockManager(self.api)
+        yield
+
+    def test_get_stock(self) -> None:
+        stock = self.manager.get(symbol='2330')
+
+        assert isinstance(stock, AsyncStock)
+        assert stock.symbol == '2330'
+
+    def test_get_price(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'price_data'}
+        stock = self.manager.get(symbol='2330')
+
+        response = asyncio.run(stock.get_price(start_date='2023-01-01', end_date='2023-01-31'))
+
+        mock_async_fa_send_request.assert_awaited_once()
+        assert response == {'data': 'price_data'}
+
+    def test_get_available_list(self, mock_async_fa_send_request) -> None:
+        mock_async_fa_send_request.return_value = {'data': 'available_list'}
+
+        response = asyncio.run(self.manager.get_available_list())
+
+        mock_async_fa_send_request.assert_awaited_once_with('get', '/stock')
+        assert response == {'data': 'available_list'}
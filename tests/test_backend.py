@@ -1,9 +1,20 @@
-from unittest.mock import MagicMock
+import asyncio
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, MagicMock
 
+import httpx
 import pytest
 import requests
 
-from fmd.backend import RequestsBackend
+from fmd.backend import (
+    HttpxAsyncBackend,
+    HttpxBackend,
+    PoolAdapter,
+    RequestsBackend,
+    get_socket_options,
+)
 
 
 class TestRequestsBackend:
@@ -75,3 +86,210 @@ class TestRequestsBackend:
             timeout=timeout,
             json=None,
         )
+
+    def test_pooled_sessions(self, mock_request) -> None:
+        barrier = threading.Barrier(4)
+
+        def request(**kwargs):
+            # NOTE: Keeps the 4 requests of a batch in flight at once
+            barrier.wait()
+            return MagicMock(spec=requests.Response)
+
+        mock_request.side_effect = request
+        # NOTE: Every batch runs on new threads, like `get_many()` does
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        lambda _: self.backend.send_request(self.method, self.url), range(4)
+                    )
+                )
+
+        assert len(self.backend._sessions) == 4
+        assert self.backend._idle.qsize() == 4
+
+    def test_pooled_sessions_reused(self, mock_request) -> None:
+        mock_request.return_value = MagicMock(spec=requests.Response)
+
+        self.backend.send_request(self.method, self.url)
+        session = self.backend._idle.queue[-1]
+        self.backend.send_request(self.method, self.url)
+
+        assert mock_request.call_count == 2
+        assert self.backend._idle.queue == [session]
+
+    def test_pooled_sessions_over_maxsize_closed(self) -> None:
+        backend = RequestsBackend(pool_maxsize=1)
+        sessions = [backend._get_session(), backend._get_session()]
+
+        for session in sessions:
+            backend._put_session(session)
+
+        assert backend._idle.queue == [sessions[0]]
+        assert list(backend._sessions) == [sessions[0]]
+
+    def test_pooled_sessions_block(self) -> None:
+        backend = RequestsBackend(pool_maxsize=1, pool_block=True)
+        session = backend._get_session()
+        threading.Timer(0.05, backend._put_session, args=[session]).start()
+
+        assert backend._get_session() is session
+
+    def test_thread_local_sessions(self) -> None:
+        backend = RequestsBackend(sessions='thread')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            sessions = list(executor.map(lambda _: backend._get_session(), range(2)))
+
+        assert backend._get_session() is backend._get_session()
+        assert len({id(session) for session in sessions + [backend._get_session()]}) >= 2
+
+    def test_shared_session(self) -> None:
+        backend = RequestsBackend(sessions='shared')
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = set(executor.map(lambda _: backend._get_session(), range(8)))
+
+        assert len(sessions) == 1
+
+    def test_unknown_sessions(self) -> None:
+        with pytest.raises(ValueError, match='Unknown sessions'):
+            RequestsBackend(sessions='global')
+
+    def test_pool_config(self) -> None:
+        backend = RequestsBackend(pool_maxsize=64, pool_block=True, keep_alive=False)
+
+        session = backend._get_session()
+        adapter = session.get_adapter('https://api.fmarketdata.com')
+
+        assert isinstance(adapter, PoolAdapter)
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+        assert session.headers['Connection'] == 'close'
+        assert 'gzip' in session.headers['Accept-Encoding']
+
+    def test_accept_encoding(self) -> None:
+        backend = RequestsBackend(accept_encoding='zstd')
+
+        assert backend._get_session().headers['Accept-Encoding'] == 'zstd'
+
+    def test_tcp_keepalive(self) -> None:
+        backend = RequestsBackend(tcp_keepalive=30)
+
+        adapter = backend._get_session().get_adapter('https://api.fmarketdata.com')
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.socket_options
+        assert adapter.poolmanager.connection_pool_kw['socket_options'] == adapter.socket_options
+        assert get_socket_options(None) is None
+
+    def test_session_recreated_after_fork(self, mocker) -> None:
+        session = self.backend._get_session()
+        self.backend._put_session(session)
+        mocker.patch('os.getpid', return_value=self.backend._pid + 1)
+
+        assert self.backend._get_session() is not session
+
+    def test_session_from_before_fork_not_pooled(self, mocker) -> None:
+        session = self.backend._get_session()
+        mocker.patch('os.getpid', return_value=self.backend._pid + 1)
+        self.backend._get_session()
+        mock_close = mocker.patch.object(session, 'close')
+
+        self.backend._put_session(session)
+
+        mock_close.assert_called_once()
+        assert session not in self.backend._idle.queue
+
+    def test_close(self, mocker) -> None:
+        session = self.backend._get_session()
+        mock_close = mocker.patch.object(session, 'close')
+
+        self.backend.close()
+
+        mock_close.assert_called_once()
+        assert self.backend._get_session() is not session
+
+
+class TestHttpxBackend:
+
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        pytest.importorskip('h2')
+        self.backend = HttpxBackend()
+        self.url = 'http://example.com'
+        self.method = 'get'
+        yield
+
+    def test_send_request_success(self, mocker) -> None:
+        mock_request = mocker.patch('httpx.Client.request')
+        mock_request.return_value = MagicMock(spec=httpx.Response, status_code=200)
+        params = {'param1': 'value1', 'param2': None}
+
+        response = self.backend.send_request(
+            method=self.method, url=self.url, params=params, timeout=5.0
+        )
+
+        mock_request.assert_called_once_with(
+            method=self.method,
+            url=self.url,
+            params={'param1': 'value1'},
+            timeout=5.0,
+            json=None,
+            extensions={'trace': ANY},
+        )
+        assert response.status_code == 200
+
+    def test_http2_enabled(self, mocker) -> None:
+        mock_client = mocker.patch('httpx.Client')
+
+        HttpxBackend(max_connections=10)
+
+        assert mock_client.call_args.kwargs['http2'] is True
+        assert mock_client.call_args.kwargs['limits'].max_connections == 10
+
+    def test_client_recreated_after_fork(self, mocker) -> None:
+        client = self.backend._get_client()
+        mocker.patch('os.getpid', return_value=self.backend._pid + 1)
+
+        assert self.backend._get_client() is not client
+
+
+class TestHttpxAsyncBackend:
+
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.backend = HttpxAsyncBackend()
+        self.url = 'http://example.com'
+        self.method = 'get'
+        yield
+
+    def test_send_request_success(self, mock_async_request) -> None:
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_async_request.return_value = mock_response
+
+        response = asyncio.run(self.backend.send_request(method=self.method, url=self.url))
+
+        mock_async_request.assert_awaited_once_with(
+            method=self.method,
+            url=self.url,
+            params=None,
+            timeout=None,
+            json=None,
+            extensions={'trace': ANY},
+        )
+        assert response.status_code == 200
+
+    def test_send_request_drops_none_params(self, mock_async_request) -> None:
+        mock_async_request.return_value = MagicMock(spec=httpx.Response)
+        params = {'param1': 'value1', 'param2': None}
+
+        asyncio.run(self.backend.send_request(method=self.method, url=self.url, params=params))
+
+        mock_async_request.assert_awaited_once_with(
+            method=self.method,
+            url=self.url,
+            params={'param1': 'value1'},
+            timeout=None,
+            json=None,
+            extensions={'trace': ANY},
+        )
@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+from fmd import AsyncFmdApi, FmdApi
+from fmd.base import BulkResult, ObjectGroup
+from fmd.exceptions import RequestError
+
+
+class TestObjectGroup:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.symbols = ['2330', '2317', '2454']
+        yield
+
+    def test_get_many(self) -> None:
+        group = FmdApi().stock.get_many(self.symbols)
+
+        assert isinstance(group, ObjectGroup)
+        assert [obj.symbol for obj in group.objs] == self.symbols
+
+    def test_call(self, mock_fa_send_request) -> None:
+        mock_fa_send_request.side_effect = lambda method, path, **kwargs: path
+
+        result = FmdApi().stock.get_many(self.symbols).get_company()
+
+        assert isinstance(result, BulkResult)
+        assert result == {symbol: f'/stock/{symbol}/company' for symbol in self.symbols}
+        assert result.errors == {}
+
+    def test_call_collects_errors(self, mock_fa_send_request) -> None:
+        def send_request(method, path, **kwargs):
+            if '2317' in path:
+                raise RequestError(status_code=404, msg='not found')
+            return path
+
+        mock_fa_send_request.side_effect = send_request
+
+        result = (
+            FmdApi()
+            .stock.get_many(self.symbols)
+            .get_price(start_date='2024-01-01', end_date='2024-01-31')
+        )
+
+        assert set(result) == {'2330', '2454'}
+        assert isinstance(result.errors['2317'], RequestError)
+
+    def test_async_call(self, mock_async_fa_send_request) -> None:
+        async def send_request(method, path, **kwargs):
+            if '2317' in path:
+                raise RequestError(status_code=404, msg='not found')
+            return path
+
+        mock_async_fa_send_request.side_effect = send_request
+
+        result = asyncio.run(AsyncFmdApi().etf.get_many(self.symbols, max_workers=2).get_profile())
+
+        assert result == {'2330': '/etf/2330/profile', '2454': '/etf/2454/profile'}
+        assert isinstance(result.errors['2317'], RequestError)
+
+    def test_call_empty(self, mock_fa_send_request) -> None:
+        result = FmdApi().stock.get_many([]).get_price()
+
+        assert result == {}
+        assert result.errors == {}
+        mock_fa_send_request.assert_not_called()
+
+    def test_async_call_empty(self, mock_async_fa_send_request) -> None:
+        result = asyncio.run(AsyncFmdApi().stock.get_many([]).get_price())
+
+        assert result == {}
+        mock_async_fa_send_request.assert_not_awaited()
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError):
+            FmdApi().index.get_many([])._private
+        with pytest.raises(AttributeError):
+            FmdApi().index.get_many(['IX0001']).get_vm
+
+
+class TestIter:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.calls = []
+        yield
+
+    def send_request(self, method, path, params=None, **kwargs):
+        self.calls.append((path, params['start_date'], params['end_date']))
+        return [{'path': path, 'start_date': str(params['start_date'])}]
+
+    def test_iter_price(self, mock_fa_send_request) -> None:
+        mock_fa_send_request.side_effect = self.send_request
+
+        chunks = (
+            FmdApi().stock.get('2330').iter_price(start_date='2022-06-01', end_date='2024-01-31')
+        )
+
+        assert self.calls == []
+        assert [chunk[0]['start_date'] for chunk in chunks] == [
+            '2022-06-01',
+            '2023-01-01',
+            '2024-01-01',
+        ]
+
+    def test_iter_prefetch_is_bounded(self, mock_fa_send_request) -> None:
+        mock_fa_send_request.side_effect = self.send_request
+
+        chunks = (
+            FmdApi()
+            .etf.get('0050')
+            .iter_price(start_date='2020-01-01', end_date='2024-12-31', prefetch=2)
+        )
+        next(chunks)
+
+        assert len(self.calls) <= 3
+        chunks.close()
+
+    def test_iter_prices(self, mock_fa_send_request) -> None:
+        mock_fa_send_request.side_effect = self.send_request
+
+        chunks = list(
+            FmdApi().stock.iter_prices(
+                iter(['2330', '2317']), start_date='2023-07-01', end_date='2024-01-31'
+            )
+        )
+
+        assert [(symbol, chunk[0]['start_date']) for symbol, chunk in chunks] == [
+            ('2330', '2023-07-01'),
+            ('2330', '2024-01-01'),
+            ('2317', '2023-07-01'),
+            ('2317', '2024-01-01'),
+        ]
+
+    def test_iter_raises(self, mock_fa_send_request) -> None:
+        mock_fa_send_request.side_effect = RequestError(status_code=500, msg='error')
+
+        with pytest.raises(RequestError):
+            list(FmdApi().index.get('IX0001').iter_price(start_date='2024-01-01'))
+
+    def test_iter_invalid_prefetch(self) -> None:
+        with pytest.raises(ValueError):
+            FmdApi().index.get('IX0001').iter_price(start_date='2024-01-01', prefetch=0)
+
+    def test_async_iter_prices(self, mock_async_fa_send_request) -> None:
+        async def send_request(method, path, params=None, **kwargs):
+            return self.send_request(method, path, params)
+
+        mock_async_fa_send_request.side_effect = send_request
+
+        async def run():
+            chunks = AsyncFmdApi().stock.iter_prices(
+                ['2330', '2317'], start_date='2024-01-01', end_date='2024-02-29', window='monthly'
+            )
+            return [(symbol, chunk[0]['start_date']) async for symbol, chunk in chunks]
+
+        assert asyncio.run(run()) == [
+            ('2330', '2024-01-01'),
+            ('2330', '2024-02-01'),
+            ('2317', '2024-01-01'),
+            ('2317', '2024-02-01'),
+        ]
+
+    def test_async_iter_price(self, mock_async_fa_send_request) -> None:
+        async def send_request(method, path, params=None, **kwargs):
+            return self.send_request(method, path, params)
+
+        mock_async_fa_send_request.side_effect = send_request
+
+        async def run():
+            stock = AsyncFmdApi().stock.get('2330')
+            chunks = stock.iter_price(start_date='2023-12-01', end_date='2024-01-31')
+            return [chunk async for chunk in chunks]
+
+        assert len(asyncio.run(run())) == 2
@@ -0,0 +1,196 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from fmd.cache import (
+    MISSING,
+    MemoryCache,
+    SQLiteCache,
+    get_endpoint,
+    is_recent,
+    make_key,
+)
+
+
+@pytest.mark.parametrize(
+    ['params', 'expected'],
+    argvalues=[
+        pytest.param(None, 'GET /stock/2330/company', id='No params'),
+        pytest.param(
+            {'start_date': date(2024, 1, 1), 'end_date': '2024-01-31'},
+            'GET /stock/2330/company?end_date=2024-01-31&start_date=2024-01-01',
+            id='Dates are canonicalized and sorted',
+        ),
+        pytest.param(
+            {'start_year': 2020, 'end_year': None},
+            'GET /stock/2330/company?start_year=2020',
+            id='None is dropped',
+        ),
+    ],
+)
+def test_make_key(params, expected) -> None:
+    assert make_key('get', '/stock/2330/company', params) == expected
+
+
+def test_make_key_equivalent_params() -> None:
+    assert make_key('get', '/p', {'start_date': datetime(2024, 1, 1)}) == make_key(
+        'GET', '/p', {'start_date': '2024-01-01'}
+    )
+
+
+@pytest.mark.parametrize(
+    ['path', 'expected'],
+    [('/stock/2330/price', 'price'), ('/stock', 'stock'), ('/etf/0050/profile/', 'profile')],
+)
+def test_get_endpoint(path, expected) -> None:
+    assert get_endpoint(path) == expected
+
+
+def test_is_recent() -> None:
+    today = datetime.today().date()
+
+    assert is_recent({'end_date': today})
+    assert not is_recent({'end_date': today - timedelta(days=1)})
+    assert is_recent({'end_year': today.year})
+    assert not is_recent({'end_year': today.year - 1})
+    assert not is_recent(None)
+
+
+class TestMemoryCache:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.cache = MemoryCache(maxsize=2, ttl=100, recent_ttl=10, ttls={'company': 1000})
+        yield
+
+    def test_get_set(self) -> None:
+        assert self.cache.get('a') is MISSING
+
+        self.cache.set('a', [1], ttl=10)
+
+        assert self.cache.get('a') == [1]
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+        assert self.cache.hit_ratio == 0.5
+
+    def test_expired(self, mocker) -> None:
+        mock_monotonic = mocker.patch('time.monotonic', return_value=0.0)
+        self.cache.set('a', 1, ttl=10)
+
+        mock_monotonic.return_value = 10.0
+
+        assert self.cache.get('a') is MISSING
+        assert len(self.cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        self.cache.set('a', 1, ttl=10)
+        self.cache.set('b', 2, ttl=10)
+        self.cache.get('a')
+        self.cache.set('c', 3, ttl=10)
+
+        assert self.cache.get('b') is MISSING
+        assert self.cache.get('a') == 1
+        assert self.cache.get('c') == 3
+
+    def test_get_ttl(self) -> None:
+        today = datetime.today().date()
+
+        assert self.cache.get_ttl('/stock/2330/company') == 1000
+        assert self.cache.get_ttl('/stock/2330/price', {'end_date': today}) == 10
+        assert self.cache.get_ttl('/stock/2330/price', {'end_date': '2020-01-01'}) == 100
+
+
+class TestSQLiteCache:
+    @pytest.fixture(autouse=True)
+    def setUp(self, tmp_path):
+        self.path = str(tmp_path / 'cache.sqlite')
+        self.cache = SQLiteCache(self.path, max_bytes=100)
+        yield
+
+    def test_get_set(self) -> None:
+        value = [{'date': '2024-01-02', 'close': '593.00'}]
+        assert self.cache.get('a') is MISSING
+
+        self.cache.set('a', value, ttl=10)
+
+        assert self.cache.get('a') == value
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_shared_between_instances(self) -> None:
+        self.cache.set('a', {'symbol': '2330'}, ttl=10)
+
+        assert SQLiteCache(self.path).get('a') == {'symbol': '2330'}
+
+    def test_shared_between_threads(self) -> None:
+        self.cache.set('a', 1, ttl=10)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            values = list(executor.map(lambda _: self.cache.get('a'), range(8)))
+
+        assert values == [1] * 8
+
+    def test_expired(self, mocker) -> None:
+        mock_time = mocker.patch('time.time', return_value=1000.0)
+        self.cache.set('a', 1, ttl=10)
+
+        mock_time.return_value = 1010.0
+
+        assert self.cache.get('a') is MISSING
+
+    def test_size_eviction(self, mocker) -> None:
+        mock_time = mocker.patch('time.time', return_value=1000.0)
+        for i, key in enumerate('abc'):
+            mock_time.return_value = 1000.0 + i
+            self.cache.set(key, 'x' * 40, ttl=100)
+
+        assert len(self.cache) == 2
+        assert self.cache.get('a') is MISSING
+        assert self.cache.get('c') == 'x' * 40
+
+    def test_size_total(self) -> None:
+        conn = self.cache._connect()
+
+        def get_sizes() -> tuple[int, int]:
+            (total,) = conn.execute('SELECT total FROM responses_size').fetchone()
+            return total, conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+        self.cache.set('a', 'x' * 10, ttl=100)
+        self.cache.set('b', 'x' * 20, ttl=100)
+        self.cache.set('a', 'x' * 30, ttl=100)
+        assert get_sizes() == (54, 54)
+
+        self.cache.set('c', 'x' * 60, ttl=100)
+        assert get_sizes() == (94, 94)
+
+        self.cache.clear()
+        assert get_sizes() == (0, 0)
+
+    def test_size_total_of_existing_database(self) -> None:
+        self.cache.set('a', 'x' * 10, ttl=100)
+        conn = self.cache._connect()
+        conn.execute('DROP TABLE responses_size')
+        conn.commit()
+
+        cache = SQLiteCache(self.path)
+
+        assert cache._get_size(cache._connect()) == 12
+
+    def test_touch_interval(self, mocker) -> None:
+        mock_time = mocker.patch('time.time', return_value=1000.0)
+        self.cache.set('a', 1, ttl=1000)
+        conn = self.cache._connect()
+
+        def get_accessed_at() -> float:
+            return conn.execute('SELECT accessed_at FROM responses').fetchone()[0]
+
+        mock_time.return_value = 1030.0
+        assert self.cache.get('a') == 1
+        assert get_accessed_at() == 1000.0
+
+        mock_time.return_value = 1060.0
+        assert self.cache.get('a') == 1
+        assert get_accessed_at() == 1060.0
+
+    def test_wal_mode(self) -> None:
+        (mode,) = self.cache._connect().execute('PRAGMA journal_mode').fetchone()
+
+        assert mode == 'wal'
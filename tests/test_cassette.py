@@ -0,0 +1,167 @@
+import asyncio
+from json import dumps
+from unittest.mock import MagicMock
+
+import pytest
+
+from fmd import AsyncFmdApi, FmdApi
+from fmd.cassette import (
+    AsyncReplayBackend,
+    RecordingBackend,
+    ReplayBackend,
+    get_cassette_key,
+)
+from fmd.exceptions import CassetteMissError
+
+URL = 'https://api.fmarketdata.com/api/v1/stock/2330/price'
+
+
+def make_backend(data: object = 'result', status_code: int = 200) -> MagicMock:
+    backend = MagicMock()
+    backend.send_request.return_value = MagicMock(
+        status_code=status_code,
+        headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+        content=dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode(),
+    )
+    return backend
+
+
+def record(path, backend: MagicMock, **kwargs) -> None:
+    with RecordingBackend(str(path), backend=backend, **kwargs) as recorder:
+        recorder.send_request('get', URL, params={'start_date': '2024-01-01', 'end_date': None})
+
+
+@pytest.mark.parametrize(
+    ['args', 'expected'],
+    argvalues=[
+        pytest.param(('get', URL), 'GET /api/v1/stock/2330/price', id='Host is dropped'),
+        pytest.param(
+            ('get', '/stock', None, {'b': 2, 'a': None}),
+            'GET /stock?b=2',
+            id='Params are canonicalized',
+        ),
+        pytest.param(
+            ('post', 'http://localhost/stock', {'b': 1, 'a': 2}),
+            'POST /stock ' + b'{"a": 2, "b": 1}'.hex(),
+            id='JSON body is part of the key',
+        ),
+    ],
+)
+def test_get_cassette_key(args, expected) -> None:
+    assert get_cassette_key(*args) == expected
+
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_record_and_replay(tmp_path, compress) -> None:
+    path = tmp_path / 'test.cassette'
+    backend = make_backend([{'close': '593.00'}])
+    record(path, backend, compress=compress)
+
+    replay = ReplayBackend(str(path))
+    res = replay.send_request('get', URL, params={'start_date': '2024-01-01'})
+
+    assert res.status_code == 200
+    assert res.content == backend.send_request.return_value.content
+    assert res.headers['content-type'] == 'application/json'
+    assert 'Content-Encoding' not in res.headers
+    assert len(replay) == 1
+    assert replay.hits == 1
+
+
+def test_replay_miss(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    record(path, make_backend())
+    replay = ReplayBackend(str(path))
+
+    with pytest.raises(CassetteMissError):
+        replay.send_request('get', URL)
+
+    assert replay.misses == 1
+
+
+def test_record_appends(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    record(path, make_backend('old'))
+    with RecordingBackend(str(path), backend=make_backend('new')) as recorder:
+        recorder.send_request('get', URL, params={'start_date': '2024-01-01'})
+        recorder.send_request('get', URL)
+
+    replay = ReplayBackend(str(path))
+
+    assert len(replay) == 2
+    assert b'new' in replay.send_request('get', URL, params={'start_date': '2024-01-01'}).content
+
+
+def test_record_unclosed_keeps_cassette(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    record(path, make_backend('old'))
+    recorder = RecordingBackend(str(path), backend=make_backend('new'))
+    recorder.send_request('get', URL)
+    recorder._file.flush()
+
+    replay = ReplayBackend(str(path))
+
+    assert len(replay) == 1
+    assert b'old' in replay.send_request('get', URL, params={'start_date': '2024-01-01'}).content
+
+
+def test_replay_unclosed_cassette(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    recorder = RecordingBackend(str(path), backend=make_backend())
+    recorder.send_request('get', URL)
+    recorder._file.flush()
+
+    assert not path.exists()
+    with pytest.raises(ValueError, match='truncated'):
+        ReplayBackend(recorder._tmp_path)
+
+
+def test_replay_not_a_cassette(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    path.write_bytes(b'x' * 100)
+
+    with pytest.raises(ValueError, match='not a cassette'):
+        ReplayBackend(str(path))
+
+
+def test_replay_latency(mocker, tmp_path) -> None:
+    mock_sleep = mocker.patch('time.sleep')
+    path = tmp_path / 'test.cassette'
+    record(path, make_backend())
+
+    ReplayBackend(str(path), latency=0.5).send_request(
+        'get', URL, params={'start_date': '2024-01-01'}
+    )
+    ReplayBackend(str(path), latency='recorded').send_request(
+        'get', URL, params={'start_date': '2024-01-01'}
+    )
+
+    assert mock_sleep.call_args_list[0].args == (0.5,)
+    assert mock_sleep.call_count == 2
+
+
+def test_client_replay(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    with RecordingBackend(str(path), backend=make_backend([{'close': '593.00'}])) as recorder:
+        FmdApi(backend=recorder).stock.get('2330').get_price(
+            start_date='2024-01-01', end_date='2024-01-31'
+        )
+
+    fa = FmdApi(backend=ReplayBackend(str(path)))
+    data = fa.stock.get('2330').get_price(start_date='2024-01-01', end_date='2024-01-31')
+
+    assert data == [{'close': '593.00'}]
+    with pytest.raises(CassetteMissError):
+        fa.stock.get('2317').get_price(start_date='2024-01-01', end_date='2024-01-31')
+
+
+def test_async_client_replay(tmp_path) -> None:
+    path = tmp_path / 'test.cassette'
+    with RecordingBackend(str(path), backend=make_backend('result')) as recorder:
+        FmdApi(backend=recorder).stock.get('2330').get_company()
+
+    async def main():
+        async with AsyncFmdApi(backend=AsyncReplayBackend(str(path))) as fa:
+            return await fa.stock.get('2330').get_company()
+
+    assert asyncio.run(main()) == 'result'
@@ -0,0 +1,54 @@
+from datetime import date
+
+import pytest
+
+from fmd.chunking import ChunkPolicy
+
+
+def test_split_yearly() -> None:
+    windows = ChunkPolicy('yearly').split(date(2004, 3, 5), date(2006, 2, 1))
+
+    assert windows == [
+        (date(2004, 3, 5), date(2004, 12, 31)),
+        (date(2005, 1, 1), date(2005, 12, 31)),
+        (date(2006, 1, 1), date(2006, 2, 1)),
+    ]
+
+
+def test_split_quarterly() -> None:
+    windows = ChunkPolicy('quarterly').split(date(2024, 2, 5), date(2024, 7, 1))
+
+    assert windows == [
+        (date(2024, 2, 5), date(2024, 3, 31)),
+        (date(2024, 4, 1), date(2024, 6, 30)),
+        (date(2024, 7, 1), date(2024, 7, 1)),
+    ]
+
+
+def test_split_monthly_across_years() -> None:
+    windows = ChunkPolicy('monthly').split(date(2024, 12, 5), date(2025, 1, 3))
+
+    assert windows == [
+        (date(2024, 12, 5), date(2024, 12, 31)),
+        (date(2025, 1, 1), date(2025, 1, 3)),
+    ]
+
+
+def test_split_days() -> None:
+    windows = ChunkPolicy(10).split(date(2024, 1, 1), date(2024, 1, 25))
+
+    assert windows == [
+        (date(2024, 1, 1), date(2024, 1, 10)),
+        (date(2024, 1, 11), date(2024, 1, 20)),
+        (date(2024, 1, 21), date(2024, 1, 25)),
+    ]
+
+
+def test_split_empty() -> None:
+    assert ChunkPolicy().split(date(2024, 1, 2), date(2024, 1, 1)) == []
+
+
+@pytest.mark.parametrize('kwargs', [{'window': 'weekly'}, {'window': 0}, {'max_workers': 0}])
+def test_invalid(kwargs) -> None:
+    with pytest.raises(ValueError):
+        ChunkPolicy(**kwargs)
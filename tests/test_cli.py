@@ -0,0 +1,217 @@
+import csv
+import json
+from datetime import date
+
+import pytest
+
+from fmd.cli import (
+    JOURNAL_NAME,
+    Journal,
+    get_endpoints,
+    get_range_kwargs,
+    main,
+    read_symbols,
+)
+from fmd.resources import Stock
+
+
+def fake_send_request(fail: set[str] | None = None):
+    def send_request(method, path, params=None, **kwargs):
+        parts = path.split('/')
+        if len(parts) == 2:
+            return [{'symbol': '2330'}, {'symbol': '2317'}]
+        symbol = parts[2]
+        if symbol in (fail or set()):
+            raise ConnectionError(symbol)
+        if parts[3] in ('company', 'profile'):
+            return {'name': f'name-{symbol}'}
+        return [{'date': '2024-01-02', 'close': 1.0}, {'date': '2024-01-03', 'close': 2.0}]
+
+    return send_request
+
+
+def read_jsonl(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_get_endpoints():
+    assert get_endpoints('index') == {'price': 'get_price', 'profile': 'get_profile'}
+    assert get_endpoints('stock')['margin-balance'] == 'get_margin_balance'
+
+
+@pytest.mark.parametrize(
+    ['method', 'expected'],
+    argvalues=[
+        pytest.param(
+            'get_price',
+            {'start_date': date(2023, 2, 1), 'end_date': date(2024, 5, 1)},
+            id='Daily',
+        ),
+        pytest.param(
+            'get_revenue',
+            {'start_year': 2023, 'start_month': 2, 'end_year': 2024, 'end_month': 5},
+            id='Monthly',
+        ),
+        pytest.param(
+            'get_balance_sheet',
+            {'start_year': 2023, 'start_quarter': 1, 'end_year': 2024, 'end_quarter': 2},
+            id='Quarterly',
+        ),
+        pytest.param('get_dividend', {'start_year': 2023, 'end_year': 2024}, id='Yearly'),
+        pytest.param('get_company', {}, id='No range'),
+    ],
+)
+def test_get_range_kwargs(method, expected):
+    func = getattr(Stock, method)
+    assert get_range_kwargs(func, date(2023, 2, 1), date(2024, 5, 1)) == expected
+
+
+def test_get_range_kwargs_without_dates():
+    assert get_range_kwargs(Stock.get_price, None, None) == {}
+
+
+def test_read_symbols(tmp_path):
+    path = tmp_path / 'symbols.txt'
+    path.write_text('2330\n\n# Comment\n2317  # Hon Hai\n')
+    assert read_symbols(str(path)) == ['2330', '2317']
+
+
+def test_download_jsonl(mock_fa_send_request, tmp_path):
+    mock_fa_send_request.side_effect = fake_send_request()
+    code = main(['download', 'stock', '-e', 'price', 'company', '-o', str(tmp_path), '-q'])
+
+    assert code == 0
+    rows = read_jsonl(tmp_path / 'stock-price.jsonl')
+    assert sorted(row['symbol'] for row in rows) == ['2317', '2317', '2330', '2330']
+    assert {'symbol': '2330', 'date': '2024-01-02', 'close': 1.0} in rows
+    assert len(read_jsonl(tmp_path / 'stock-company.jsonl')) == 2
+
+    journal = Journal(tmp_path / JOURNAL_NAME)
+    journal.close()
+    assert journal.run['resource'] == 'stock'
+    assert set(journal.done) == {
+        ('price', '2330'),
+        ('price', '2317'),
+        ('company', '2330'),
+        ('company', '2317'),
+    }
+
+
+def test_download_passes_date_range(mock_fa_send_request, tmp_path):
+    mock_fa_send_request.side_effect = fake_send_request()
+    main(
+        [
+            'download',
+            'stock',
+            '-e',
+            'revenue',
+            '-s',
+            '2330',
+            '--start-date',
+            '2023-01-01',
+            '--end-date',
+            '2023-12-31',
+            '-o',
+            str(tmp_path),
+            '-q',
+        ]
+    )
+
+    params = mock_fa_send_request.call_args.kwargs['params']
+    assert params == {'start_year': 2023, 'start_month': 1, 'end_year': 2023, 'end_month': 12}
+
+
+def test_download_csv(mock_fa_send_request, tmp_path):
+    mock_fa_send_request.side_effect = fake_send_request()
+    main(['download', 'etf', '-e', 'price', '-s', '0050', '-o', str(tmp_path), '-f', 'csv', '-q'])
+
+    with open(tmp_path / 'etf-price.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [
+        {'symbol': '0050', 'date': '2024-01-02', 'close': '1.0'},
+        {'symbol': '0050', 'date': '2024-01-03', 'close': '2.0'},
+    ]
+
+
+def test_download_parquet(mock_fa_send_request, tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    mock_fa_send_request.side_effect = fake_send_request()
+    main(['download', 'index', '-e', 'price', '-s', 'IX0001', '-o', str(tmp_path), '-f', 'parquet'])
+
+    table = pq.read_table(tmp_path / 'index-price' / 'IX0001.parquet')
+    assert table.column_names == ['date', 'close']
+    assert table.num_rows == 2
+
+
+def test_download_failures_resume(mock_fa_send_request, tmp_path):
+    args = ['download', 'stock', '-e', 'price', '-s', '2330', '2317', '-o', str(tmp_path), '-q']
+    mock_fa_send_request.side_effect = fake_send_request(fail={'2317'})
+    assert main(args) == 1
+    assert {row['symbol'] for row in read_jsonl(tmp_path / 'stock-price.jsonl')} == {'2330'}
+
+    mock_fa_send_request.reset_mock()
+    mock_fa_send_request.side_effect = fake_send_request()
+    assert main(args) == 0
+    # NOTE: Only the failed symbol is downloaded again
+    mock_fa_send_request.assert_called_once()
+    assert '/stock/2317/price' in mock_fa_send_request.call_args.args
+    rows = read_jsonl(tmp_path / 'stock-price.jsonl')
+    assert [row['symbol'] for row in rows] == ['2330', '2330', '2317', '2317']
+
+
+def test_download_resume_truncates_unrecorded_rows(mock_fa_send_request, tmp_path):
+    args = ['download', 'stock', '-e', 'price', '-s', '2330', '-o', str(tmp_path), '-f', 'csv']
+    mock_fa_send_request.side_effect = fake_send_request()
+    main(args + ['-q'])
+    path = tmp_path / 'stock-price.csv'
+    content = path.read_bytes()
+    # NOTE: Rows written by a run killed before journaling them
+    with open(path, 'ab') as f:
+        f.write(b'2317,2024-01-02,1.0\r\n2317,2024-')
+
+    main(
+        ['download', 'stock', '-e', 'price', '-s', '2330', '2317', '-o', str(tmp_path), '-f', 'csv']
+    )
+
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert path.read_bytes().startswith(content)
+    assert [row['symbol'] for row in rows] == ['2330', '2330', '2317', '2317']
+
+
+def test_download_other_arguments(mock_fa_send_request, tmp_path, capsys):
+    mock_fa_send_request.side_effect = fake_send_request()
+    args = ['download', 'stock', '-e', 'price', '-s', '2330', '-o', str(tmp_path), '-q']
+    main(args)
+
+    assert main(args + ['-f', 'csv']) == 2
+    assert '--restart' in capsys.readouterr().err
+
+    assert main(args + ['-f', 'csv', '--restart']) == 0
+    assert (tmp_path / 'stock-price.csv').exists()
+
+
+def test_download_unknown_endpoint(tmp_path, capsys):
+    assert main(['download', 'index', '-e', 'vm', '-s', 'IX0001', '-o', str(tmp_path)]) == 2
+    assert 'Unknown index endpoints: vm' in capsys.readouterr().err
+
+
+def test_journal_skips_truncated_line(tmp_path):
+    path = tmp_path / JOURNAL_NAME
+    path.write_text(
+        '{"run": {"resource": "stock"}}\n'
+        '{"endpoint": "price", "symbol": "2330", "status": "done", "rows": 2, "offset": 10}\n'
+        '{"endpoint": "price", "symbol": "2317", "sta'
+    )
+    journal = Journal(path)
+    journal.close()
+
+    assert set(journal.done) == {('price', '2330')}
+    assert journal.get_offset('price') == 10
+
+    journal = Journal(path)
+    journal.record('price', '2317', status='done', rows=2, offset=20)
+    journal.close()
+    journal = Journal(path)
+    journal.close()
+    assert journal.get_offset('price') == 20
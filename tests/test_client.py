@@ -1,9 +1,33 @@
+import asyncio
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
+import requests
 
-from fmd import FmdApi
-from fmd.exceptions import RequestError
+from fmd import AsyncFmdApi, FmdApi
+from fmd.cache import MemoryCache
+from fmd.chunking import ChunkPolicy
+from fmd.exceptions import DeadlineExceededError, RequestError
+from fmd.hedge import HedgePolicy
+from fmd.ratelimit import TokenBucket
+from fmd.retry import RetryPolicy
+from fmd.store import PeriodCache, RangeCache
+
+
+def send_daily_request(method, url, json, params, timeout):
+    start, end = params['start_date'], params['end_date']
+    days = (end - start).days + 1
+    data = [{'date': str(start + datetime.timedelta(days=i))} for i in range(days)]
+    return MagicMock(
+        status_code=200,
+        content=dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode(),
+    )
 
 
 class TestFmdApi:
@@ -18,48 +42,48 @@ class TestFmdApi:
     def test_send_request_success(self, mock_send_request) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'status': 'success', 'msg': 'ok', 'data': 'result'}
+        mock_response.content = dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode()
         mock_send_request.return_value = mock_response
 
         response = self.api.send_request(method=self.method, path=self.path)
 
         mock_send_request.assert_called_once_with(
-            method=self.method, url=self.url, json=None, params=None, timeout=None
+            method=self.method, url=self.url, json=None, params=None, timeout=self.api._timeout
         )
         assert response == 'result'
 
     def test_send_request_with_params(self, mock_send_request) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'status': 'success', 'msg': 'ok', 'data': 'result'}
+        mock_response.content = dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode()
         mock_send_request.return_value = mock_response
         params = {'param1': 'value1'}
 
         response = self.api.send_request(method=self.method, path=self.path, params=params)
 
         mock_send_request.assert_called_once_with(
-            method=self.method, url=self.url, json=None, params=params, timeout=None
+            method=self.method, url=self.url, json=None, params=params, timeout=self.api._timeout
         )
         assert response == 'result'
 
     def test_send_request_with_json(self, mock_send_request) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'status': 'success', 'msg': 'ok', 'data': 'result'}
+        mock_response.content = dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode()
         mock_send_request.return_value = mock_response
         json_data = {'key': 'value'}
 
         response = self.api.send_request(method=self.method, path=self.path, json=json_data)
 
         mock_send_request.assert_called_once_with(
-            method=self.method, url=self.url, json=json_data, params=None, timeout=None
+            method=self.method, url=self.url, json=json_data, params=None, timeout=self.api._timeout
         )
         assert response == 'result'
 
     def test_send_request_with_timeout(self, mock_send_request) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {'status': 'success', 'msg': 'ok', 'data': 'result'}
+        mock_response.content = dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode()
         mock_send_request.return_value = mock_response
         timeout = 5.0
 
@@ -70,10 +94,12 @@ class TestFmdApi:
         )
         assert response == 'result'
 
-    def test_send_request_retry(self, mock_send_request) -> None:
-        mock_send_request.side_effect = [Exception('Connection error')] * 5 + [
+    def test_send_request_retry(self, mocker, mock_send_request) -> None:
+        mock_sleep = mocker.patch('time.sleep')
+        mock_send_request.side_effect = [requests.ConnectionError('Connection error')] * 5 + [
             MagicMock(
-                status_code=200, json=lambda: {'status': 'success', 'msg': 'ok', 'data': 'result'}
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
             )
         ]
 
@@ -81,12 +107,513 @@ class TestFmdApi:
 
         assert response == 'result'
         assert mock_send_request.call_count == 6
+        assert mock_sleep.call_count == 5
+
+    def test_send_request_retry_exhausted(self, mocker, mock_send_request) -> None:
+        mocker.patch('time.sleep')
+        mock_send_request.side_effect = requests.Timeout('Read timed out')
+
+        with pytest.raises(requests.Timeout):
+            self.api.send_request(method=self.method, path=self.path, max_retries=2)
+
+        assert mock_send_request.call_count == 3
+
+    def test_send_request_not_retryable_exception(self, mocker, mock_send_request) -> None:
+        mock_sleep = mocker.patch('time.sleep')
+        mock_send_request.side_effect = ValueError('Invalid URL')
+
+        with pytest.raises(ValueError):
+            self.api.send_request(method=self.method, path=self.path)
+
+        assert mock_send_request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_send_request_retry_status(self, mocker, mock_send_request) -> None:
+        mock_sleep = mocker.patch('time.sleep')
+        mock_send_request.side_effect = [
+            MagicMock(status_code=429, headers={'Retry-After': '2'}),
+            MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            ),
+        ]
+
+        response = self.api.send_request(method=self.method, path=self.path)
+
+        assert response == 'result'
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_send_request_deadline(self, mocker, mock_send_request) -> None:
+        mock_sleep = mocker.patch('time.sleep')
+        mock_send_request.return_value = MagicMock(
+            status_code=503,
+            headers={'Retry-After': '120'},
+            content=dumps({'msg': 'unavailable'}).encode(),
+        )
+
+        with pytest.raises(RequestError):
+            self.api.send_request(method=self.method, path=self.path)
+
+        assert mock_send_request.call_count == 1
+        mock_sleep.assert_not_called()
 
     def test_send_request_failure(self, mock_send_request) -> None:
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {'msg': 'error'}
+        mock_response.content = dumps({'msg': 'error'}).encode()
         mock_send_request.return_value = mock_response
 
         with pytest.raises(RequestError):
             self.api.send_request(method=self.method, path=self.path)
+
+    def test_send_request_json_decoder(self, mock_send_request) -> None:
+        decoder = MagicMock(return_value={'status': 'success', 'msg': 'ok', 'data': 'result'})
+        api = FmdApi(json_decoder=decoder)
+        mock_send_request.return_value = MagicMock(status_code=200, content=b'{}')
+
+        response = api.send_request(method=self.method, path=self.path)
+
+        decoder.assert_called_once_with(b'{}')
+        assert response == 'result'
+
+    def test_send_request_invalid_json(self, mock_send_request) -> None:
+        mock_send_request.return_value = MagicMock(
+            status_code=502, content=b'<html>Bad Gateway</html>', text='<html>Bad Gateway</html>'
+        )
+
+        with pytest.raises(RequestError) as e:
+            self.api.send_request(method=self.method, path=self.path, max_retries=0)
+
+        assert e.value.status_code == 502
+
+    def test_send_request_cached(self, mock_send_request) -> None:
+        api = FmdApi(cache=MemoryCache())
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+        )
+
+        responses = [
+            api.send_request(method=self.method, path=self.path, params={'start_date': date})
+            for date in (datetime.date(2024, 1, 1), '2024-01-01')
+        ]
+
+        assert responses == ['result', 'result']
+        assert mock_send_request.call_count == 1
+        assert (api._cache.hits, api._cache.misses) == (1, 1)
+
+    def test_send_request_range_cached(self, mock_send_request) -> None:
+        api = FmdApi(range_cache=RangeCache())
+        mock_send_request.side_effect = send_daily_request
+
+        api.send_request(
+            'get', self.path, params={'start_date': '2024-01-10', 'end_date': '2024-01-20'}
+        )
+        response = api.send_request(
+            'get', self.path, params={'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+        )
+
+        fetched = [call.kwargs['params'] for call in mock_send_request.call_args_list]
+        assert fetched[1:] == [
+            {'start_date': datetime.date(2024, 1, 1), 'end_date': datetime.date(2024, 1, 9)},
+            {'start_date': datetime.date(2024, 1, 21), 'end_date': datetime.date(2024, 1, 31)},
+        ]
+        assert [row['date'] for row in response] == [f'2024-01-{i:02}' for i in range(1, 32)]
+
+    def test_send_request_chunked(self, mock_send_request) -> None:
+        api = FmdApi(chunking=ChunkPolicy(window=10, max_workers=2))
+        mock_send_request.side_effect = send_daily_request
+
+        response = api.send_request(
+            'get', self.path, params={'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+        )
+
+        fetched = sorted(
+            call.kwargs['params']['start_date'] for call in mock_send_request.call_args_list
+        )
+        assert fetched == [datetime.date(2024, 1, d) for d in (1, 11, 21, 31)]
+        assert [row['date'] for row in response] == [f'2024-01-{i:02}' for i in range(1, 32)]
+
+    def test_send_request_chunked_empty_range(self, mock_send_request) -> None:
+        api = FmdApi(chunking=ChunkPolicy(window=10, max_workers=2))
+
+        response = api.send_request(
+            'get', self.path, params={'start_date': '2024-01-31', 'end_date': '2024-01-01'}
+        )
+
+        assert response == []
+        mock_send_request.assert_not_called()
+
+    def test_send_request_chunk_retried_alone(self, mocker, mock_send_request) -> None:
+        mocker.patch('time.sleep')
+        api = FmdApi(chunking=ChunkPolicy(window='monthly'))
+        failures = [requests.ConnectionError('Connection error')]
+
+        def send_request(method, url, json, params, timeout):
+            if params['start_date'] == datetime.date(2024, 2, 1) and failures:
+                raise failures.pop()
+            return send_daily_request(method, url, json, params, timeout)
+
+        mock_send_request.side_effect = send_request
+
+        response = api.send_request(
+            'get', self.path, params={'start_date': '2024-01-01', 'end_date': '2024-03-31'}
+        )
+
+        fetched = [call.kwargs['params']['start_date'] for call in mock_send_request.call_args_list]
+        assert sorted(fetched) == [datetime.date(2024, m, 1) for m in (1, 2, 2, 3)]
+        assert len(response) == 91
+        assert response[0]['date'] == '2024-01-01' and response[-1]['date'] == '2024-03-31'
+
+    def test_send_request_coalesced(self, mock_send_request) -> None:
+        api = FmdApi(coalesce=True)
+        started, release = threading.Event(), threading.Event()
+
+        def send_request(method, url, json, params, timeout):
+            started.set()
+            release.wait(5)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': [params]}).encode(),
+            )
+
+        mock_send_request.side_effect = send_request
+        params = {'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(api.send_request, 'get', self.path, params=params)]
+            started.wait(5)
+            futures += [
+                executor.submit(api.send_request, 'get', self.path, params=params) for _ in range(3)
+            ]
+            while api._singleflight.shared < 3:
+                time.sleep(0.001)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        assert mock_send_request.call_count == 1
+        assert responses == [[params]] * 4
+
+    def test_send_request_hedged(self, mock_send_request) -> None:
+        hedge = HedgePolicy(min_delay=0.01, max_ratio=1.0, min_samples=1)
+        hedge.record(0.01)
+        api = FmdApi(hedge=hedge)
+        release = threading.Event()
+        responses = iter(['slow', 'fast'])
+
+        def send_request(method, url, json, params, timeout):
+            data = next(responses)
+            if data == 'slow':
+                release.wait(5)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode(),
+            )
+
+        mock_send_request.side_effect = send_request
+
+        response = api.send_request('get', self.path)
+        release.set()
+
+        assert response == 'fast'
+        assert mock_send_request.call_count == 2
+        assert hedge.hedges == 1
+
+    def test_send_request_hedge_takes_token(self, mocker, mock_send_request) -> None:
+        hedge = HedgePolicy(min_delay=0.01, max_ratio=1.0, min_samples=1)
+        hedge.record(0.01)
+        limiter = TokenBucket(rate=1000, burst=10)
+        api = FmdApi(hedge=hedge, rate_limiter=limiter)
+        reserve = mocker.spy(limiter, 'reserve')
+        release = threading.Event()
+
+        def send_request(method, url, json, params, timeout):
+            if mock_send_request.call_count == 1:
+                release.wait(5)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            )
+
+        mock_send_request.side_effect = send_request
+
+        api.send_request('get', self.path)
+        release.set()
+
+        assert mock_send_request.call_count == 2
+        assert reserve.call_count == 2
+
+    def test_send_request_unhedged_on_calling_thread(self, mock_send_request) -> None:
+        hedge = HedgePolicy()
+        api = FmdApi(hedge=hedge)
+        threads = []
+
+        def send_request(method, url, json, params, timeout):
+            threads.append(threading.current_thread())
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            )
+
+        mock_send_request.side_effect = send_request
+
+        assert api.send_request('get', self.path) == 'result'
+        assert threads == [threading.current_thread()]
+        assert len(hedge._latencies) == 1
+
+    def test_send_request_hedge_capped(self, mock_send_request) -> None:
+        hedge = HedgePolicy(min_delay=0.01, max_ratio=0.0, min_samples=1)
+        hedge.record(0.01)
+        api = FmdApi(hedge=hedge)
+
+        def send_request(method, url, json, params, timeout):
+            time.sleep(0.05)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            )
+
+        mock_send_request.side_effect = send_request
+
+        assert api.send_request('get', self.path) == 'result'
+        assert mock_send_request.call_count == 1
+
+    def test_send_request_hedge_get_only(self, mock_send_request) -> None:
+        hedge = HedgePolicy(min_samples=0)
+        api = FmdApi(hedge=hedge)
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+        )
+
+        api.send_request('post', self.path, json={'a': 1})
+
+        assert hedge.requests == 0
+
+    def test_send_request_period_cached(self, mock_send_request) -> None:
+        api = FmdApi(period_cache=PeriodCache())
+        data = [{'year': 2023, 'quarter': q} for q in (1, 2, 3, 4)] + [{'year': 2024, 'quarter': 1}]
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode(),
+        )
+        params = {'start_year': 2023, 'start_quarter': 1, 'end_year': 2024, 'end_quarter': 2}
+
+        api.send_request('get', self.path, params=params)
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': data[-1:]}).encode(),
+        )
+        response = api.send_request('get', self.path, params=params)
+
+        assert mock_send_request.call_args.kwargs['params'] == {
+            **params,
+            'start_year': 2024,
+            'start_quarter': 1,
+        }
+        assert response == data
+
+    def test_send_request_rate_limited(self, mocker, mock_send_request) -> None:
+        mocker.patch('time.sleep')
+        rate_limiter = MagicMock(spec=TokenBucket)
+        rate_limiter.reserve.return_value = 0.0
+        api = FmdApi(rate_limiter=rate_limiter)
+        mock_send_request.side_effect = [
+            requests.ConnectionError('Connection error'),
+            MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            ),
+        ]
+
+        api.send_request(method=self.method, path=self.path)
+
+        assert rate_limiter.reserve.call_count == 2
+
+    def test_send_request_rate_limited_past_deadline(self, mocker, mock_send_request) -> None:
+        mock_sleep = mocker.patch('time.sleep')
+        rate_limiter = MagicMock(spec=TokenBucket)
+        rate_limiter.reserve.return_value = None
+        api = FmdApi(rate_limiter=rate_limiter, retry=RetryPolicy(deadline=60))
+
+        with pytest.raises(DeadlineExceededError):
+            api.send_request(method=self.method, path=self.path)
+
+        assert rate_limiter.reserve.call_args.kwargs['max_wait'] == pytest.approx(60, abs=1)
+        mock_send_request.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    def test_send_request_past_deadline_keeps_tokens(self, mock_send_request) -> None:
+        rate_limiter = TokenBucket(rate=2, burst=1)
+        api = FmdApi(rate_limiter=rate_limiter, retry=RetryPolicy(deadline=1.0))
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+        )
+        errors = []
+
+        def send():
+            try:
+                api.send_request(method=self.method, path=self.path)
+            except DeadlineExceededError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=send) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # NOTE: Only the requests fitting in the deadline took a token
+        assert 0 < len(errors) < 50
+        assert mock_send_request.call_count == 50 - len(errors)
+        assert rate_limiter.reserve() <= 0.5
+
+    def test_send_request_timeout_after_rate_limit(self, mocker, mock_send_request) -> None:
+        now = iter([0.0, 0.0, 50.0])
+        mocker.patch('time.monotonic', side_effect=lambda: next(now, 50.0))
+        mocker.patch('time.sleep')
+        rate_limiter = MagicMock(spec=TokenBucket)
+        rate_limiter.reserve.return_value = 50.0
+        api = FmdApi(rate_limiter=rate_limiter, retry=RetryPolicy(deadline=60))
+        mock_send_request.return_value = MagicMock(
+            status_code=200,
+            content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+        )
+
+        api.send_request(method=self.method, path=self.path)
+
+        assert mock_send_request.call_args.kwargs['timeout'] == 10.0
+
+
+class TestAsyncFmdApi:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.api = AsyncFmdApi()
+        self.method = 'get'
+        self.path = '/test'
+        self.url = self.api._get_url(self.path)
+        yield
+
+    def test_send_request_success(self, mock_async_send_request) -> None:
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode()
+        mock_async_send_request.return_value = mock_response
+
+        response = asyncio.run(self.api.send_request(method=self.method, path=self.path))
+
+        mock_async_send_request.assert_awaited_once_with(
+            method=self.method, url=self.url, json=None, params=None, timeout=self.api._timeout
+        )
+        assert response == 'result'
+
+    def test_send_request_retry(self, mocker, mock_async_send_request) -> None:
+        mocker.patch('asyncio.sleep', new_callable=mocker.AsyncMock)
+        mock_async_send_request.side_effect = [httpx.ConnectError('Connection error')] * 2 + [
+            MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': 'result'}).encode(),
+            )
+        ]
+
+        response = asyncio.run(self.api.send_request(method=self.method, path=self.path))
+
+        assert response == 'result'
+        assert mock_async_send_request.await_count == 3
+
+    def test_send_request_failure(self, mock_async_send_request) -> None:
+        mock_response = MagicMock()
+        mock_response.status_code = 400
+        mock_response.content = dumps({'msg': 'error'}).encode()
+        mock_async_send_request.return_value = mock_response
+
+        with pytest.raises(RequestError):
+            asyncio.run(self.api.send_request(method=self.method, path=self.path))
+
+    def test_send_request_chunked(self, mock_async_send_request) -> None:
+        api = AsyncFmdApi(chunking=ChunkPolicy(window='yearly'))
+        mock_async_send_request.side_effect = send_daily_request
+
+        response = asyncio.run(
+            api.send_request(
+                'get', self.path, params={'start_date': '2023-12-30', 'end_date': '2024-01-02'}
+            )
+        )
+
+        assert mock_async_send_request.await_count == 2
+        assert [row['date'] for row in response] == [
+            '2023-12-30',
+            '2023-12-31',
+            '2024-01-01',
+            '2024-01-02',
+        ]
+
+    def test_send_request_chunked_empty_range(self, mock_async_send_request) -> None:
+        api = AsyncFmdApi(chunking=ChunkPolicy(window='yearly'))
+
+        response = asyncio.run(
+            api.send_request(
+                'get', self.path, params={'start_date': '2024-01-02', 'end_date': '2023-12-30'}
+            )
+        )
+
+        assert response == []
+        mock_async_send_request.assert_not_awaited()
+
+    def test_send_request_coalesced(self, mock_async_send_request) -> None:
+        api = AsyncFmdApi(coalesce=True)
+
+        async def send_request(method, url, json, params, timeout):
+            await asyncio.sleep(0.01)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': url}).encode(),
+            )
+
+        mock_async_send_request.side_effect = send_request
+
+        async def run():
+            return await asyncio.gather(
+                *(api.send_request('get', self.path) for _ in range(5)),
+                api.send_request('get', '/other'),
+            )
+
+        responses = asyncio.run(run())
+
+        assert mock_async_send_request.await_count == 2
+        assert responses[:5] == [self.url] * 5
+
+    def test_send_request_hedged(self, mock_async_send_request) -> None:
+        hedge = HedgePolicy(min_delay=0.01, max_ratio=1.0, min_samples=1)
+        hedge.record(0.01)
+        api = AsyncFmdApi(hedge=hedge)
+        delays = iter([5, 0])
+
+        async def send_request(method, url, json, params, timeout):
+            delay = next(delays)
+            await asyncio.sleep(delay)
+            return MagicMock(
+                status_code=200,
+                content=dumps({'status': 'success', 'msg': 'ok', 'data': delay}).encode(),
+            )
+
+        mock_async_send_request.side_effect = send_request
+
+        response = asyncio.run(api.send_request('get', self.path))
+
+        assert response == 0
+        assert mock_async_send_request.await_count == 2
+
+    def test_async_context_manager(self, mocker) -> None:
+        mock_aclose = mocker.patch(
+            'fmd.backend.HttpxAsyncBackend.aclose', new_callable=mocker.AsyncMock
+        )
+
+        async def run():
+            async with self.api as fa:
+                assert fa is self.api
+
+        asyncio.run(run())
+
+        mock_aclose.assert_awaited_once()
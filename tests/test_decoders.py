@@ -0,0 +1,46 @@
+import pytest
+
+from fmd.decoders import DECODERS, get_decoder
+
+CONTENT = (
+    '{"status": "success", "msg": "ok", "data": [{"symbol": "2330", "name": "台積電"}]}'.encode()
+)
+
+
+@pytest.mark.parametrize('name', ['auto', *DECODERS])
+def test_get_decoder(name) -> None:
+    if name in ('orjson', 'msgspec'):
+        pytest.importorskip(name)
+
+    decode = get_decoder(name)
+
+    assert decode(CONTENT)['data'] == [{'symbol': '2330', 'name': '台積電'}]
+
+
+@pytest.mark.parametrize('name', ['auto', *DECODERS])
+def test_get_decoder_invalid_json(name) -> None:
+    if name in ('orjson', 'msgspec'):
+        pytest.importorskip(name)
+
+    with pytest.raises(ValueError):
+        get_decoder(name)(b'<html>Bad Gateway</html>')
+
+
+def test_get_decoder_callable() -> None:
+    def decode(content: bytes) -> str:
+        return content.decode()
+
+    assert get_decoder(decode) is decode
+
+
+def test_get_decoder_unknown() -> None:
+    with pytest.raises(ValueError):
+        get_decoder('ujson')
+
+
+def test_get_decoder_fallback(mocker) -> None:
+    mocker.patch.dict('sys.modules', {'orjson': None, 'msgspec': None})
+
+    decode = get_decoder('auto')
+
+    assert decode(CONTENT)['status'] == 'success'
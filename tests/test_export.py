@@ -0,0 +1,74 @@
+import pytest
+
+from fmd import FmdApi
+from fmd.exceptions import RequestError
+from fmd.export import export_parquet
+
+PRICES = {
+    '2330': [
+        {'date': '2023-12-29', 'symbol': '2330', 'close': '593.00'},
+        {'date': '2024-01-02', 'symbol': '2330', 'close': '593.00'},
+        {'date': '2024-01-03', 'symbol': '2330', 'close': '578.00'},
+    ],
+    '2317': [{'date': '2024-01-02', 'symbol': '2317', 'close': '104.00'}],
+    '0050': [{'date': '2024-01-02', 'symbol': '0050', 'close': '135.50'}],
+    '00878': [{'date': '2024-01-02', 'symbol': '00878', 'close': '21.00'}],
+}
+RANGE = {'start_date': '2023-01-01', 'end_date': '2024-12-31'}
+
+
+@pytest.fixture
+def mock_price_send_request(mocker):
+    def send_request(method, path, params=None, **kwargs):
+        symbol = path.split('/')[2]
+        if symbol not in PRICES:
+            raise RequestError(status_code=404, msg='Not Found')
+        start_date, end_date = str(params['start_date']), str(params['end_date'])
+        return [row for row in PRICES[symbol] if start_date <= row['date'] <= end_date]
+
+    yield mocker.patch('fmd.client.FmdApi.send_request', side_effect=send_request)
+
+
+def read_dataset(path):
+    ds = pytest.importorskip('pyarrow.dataset')
+    return ds.dataset(path, partitioning='hive').to_table().sort_by([('symbol', 'ascending')])
+
+
+def test_export_parquet(tmp_path, mock_price_send_request) -> None:
+    errors = export_parquet(
+        FmdApi().stock, ['2330', '2317', '9999'], 'get_price', tmp_path, max_workers=2, **RANGE
+    )
+
+    assert list(errors) == ['9999']
+    assert (tmp_path / 'price' / '2330' / 'year=2023').is_dir()
+    assert (tmp_path / 'price' / '2330' / 'year=2024').is_dir()
+    table = read_dataset(tmp_path / 'price')
+    assert table.num_rows == 4
+    assert sorted(table['close'].to_pylist()) == [104.0, 578.0, 593.0, 593.0]
+
+
+def test_export_parquet_overwrites(tmp_path, mock_price_send_request) -> None:
+    export_parquet(FmdApi().stock, ['2330'], 'get_price', tmp_path, **RANGE)
+    export_parquet(FmdApi().stock, ['2330'], 'get_price', tmp_path, **RANGE)
+
+    table = read_dataset(tmp_path / 'price')
+    assert table.num_rows == 3
+
+
+def test_export_parquet_appends_ranges(tmp_path, mock_price_send_request) -> None:
+    kwargs = {'start_date': '2023-12-01', 'end_date': '2024-01-02'}
+    export_parquet(FmdApi().stock, ['2330'], 'get_price', tmp_path, **kwargs)
+    kwargs = {'start_date': '2024-01-03', 'end_date': '2024-01-31'}
+    export_parquet(FmdApi().stock, ['2330'], 'get_price', tmp_path, **kwargs)
+
+    table = read_dataset(tmp_path / 'price')
+    assert table.num_rows == 3
+    assert table['close'].to_pylist() == [593.0, 593.0, 578.0]
+
+
+def test_export_parquet_keeps_leading_zeros(tmp_path, mock_price_send_request) -> None:
+    export_parquet(FmdApi().etf, ['0050', '00878'], 'get_price', tmp_path, **RANGE)
+
+    table = read_dataset(tmp_path / 'price')
+    assert table['symbol'].to_pylist() == ['0050', '00878']
+    assert table['year'].to_pylist() == [2024, 2024]
@@ -0,0 +1,251 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from fmd.formats import (
+    convert,
+    get_record_type,
+    get_schema,
+    to_arrow,
+    to_numpy,
+    to_pandas,
+    to_records,
+)
+from fmd.resources.etf.types import ETFDividend
+from fmd.resources.stock.types import (
+    BalanceSheet,
+    Revenue,
+    StockCompany,
+    StockMarginBalance,
+    StockPrice,
+)
+
+PRICES = [
+    {
+        'date': '2024-07-29',
+        'symbol': '2330',
+        'open': '942.00',
+        'high': '955.00',
+        'low': '940.00',
+        'close': '955.00',
+        'volume': '25000000.00',
+        'values': '23750000000.00',
+    },
+    {
+        'date': '2024-07-30',
+        'symbol': '2330',
+        'open': '950.00',
+        'high': '951.00',
+        'low': '931.00',
+        'close': '931.00',
+        'volume': '30000000.00',
+        'values': '28000000000.00',
+    },
+]
+
+
+def test_get_schema() -> None:
+    assert get_schema(StockPrice) == {
+        'date': 'date',
+        'symbol': 'text',
+        'open': 'number',
+        'high': 'number',
+        'low': 'number',
+        'close': 'number',
+        'volume': 'number',
+        'values': 'number',
+    }
+    assert get_schema(StockMarginBalance)['margin_buy'] == 'int'
+    assert get_schema(ETFDividend)['dividend_amount'] == 'number'
+    assert get_schema(ETFDividend)['name'] == 'text'
+    assert get_schema(ETFDividend)['ex_dividend_date'] == 'date'
+
+
+class TestToNumpy:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.np = pytest.importorskip('numpy')
+        yield
+
+    def test_to_numpy(self) -> None:
+        columns = to_numpy(PRICES, StockPrice)
+
+        assert list(columns) == list(PRICES[0])
+        assert columns['date'].dtype == self.np.dtype('datetime64[D]')
+        assert columns['close'].dtype == self.np.float64
+        assert columns['close'].tolist() == [955.0, 931.0]
+        assert columns['symbol'].tolist() == ['2330', '2330']
+
+    def test_to_numpy_int(self) -> None:
+        rows = [{'date': '2024-08-30', 'symbol': '2330', 'margin_buy': 36}]
+
+        columns = to_numpy(rows, StockMarginBalance)
+
+        assert columns['margin_buy'].dtype == self.np.int64
+
+    def test_to_numpy_missing_values(self) -> None:
+        rows = [
+            {'ex_dividend_date': '2021-01-22', 'dividend_amount': '3.05', 'name': 'A'},
+            {'ex_dividend_date': None, 'dividend_amount': None, 'name': None},
+        ]
+
+        columns = to_numpy(rows, ETFDividend)
+
+        assert self.np.isnat(columns['ex_dividend_date'][1])
+        assert self.np.isnan(columns['dividend_amount'][1])
+        assert columns['name'].tolist() == ['A', None]
+
+    def test_to_numpy_single_row(self) -> None:
+        columns = to_numpy(PRICES[0], StockPrice)
+
+        assert columns['open'].tolist() == [942.0]
+
+    def test_to_numpy_empty(self) -> None:
+        columns = to_numpy([], StockPrice)
+
+        assert set(columns) == set(get_schema(StockPrice))
+        assert all(len(column) == 0 for column in columns.values())
+
+
+def test_convert_unknown_format() -> None:
+    with pytest.raises(ValueError):
+        convert(PRICES, StockPrice, 'excel')
+
+
+def test_output_decorator(mock_fa_send_request) -> None:
+    np = pytest.importorskip('numpy')
+    from fmd import FmdApi
+
+    mock_fa_send_request.return_value = PRICES
+
+    columns = FmdApi().stock.get('2330').get_price(start_date='2024-07-29', as_='numpy')
+
+    assert columns['date'].tolist() == np.array(['2024-07-29', '2024-07-30'], 'M8[D]').tolist()
+
+
+def test_output_decorator_async(mock_async_fa_send_request) -> None:
+    pytest.importorskip('numpy')
+    from fmd import AsyncFmdApi
+
+    mock_async_fa_send_request.return_value = PRICES
+
+    columns = asyncio.run(AsyncFmdApi().index.get('LI0001').get_price(as_='numpy'))
+
+    assert columns['high'].tolist() == [955.0, 951.0]
+
+
+class TestToPandas:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.pd = pytest.importorskip('pandas')
+        yield
+
+    def test_daily(self) -> None:
+        df = to_pandas(PRICES, StockPrice)
+
+        assert isinstance(df.index, self.pd.DatetimeIndex)
+        assert df.index.name == 'date'
+        assert df['symbol'].dtype == 'category'
+        assert df['close'].dtype == 'float64'
+        assert df.loc['2024-07-30', 'close'] == 931.0
+
+    def test_quarterly(self) -> None:
+        rows = [
+            {'symbol': '2330', 'year': 2023, 'quarter': 4, 'asset': '5532371215.00'},
+            {'symbol': '2330', 'year': 2024, 'quarter': 1, 'asset': '5890596047.00'},
+        ]
+
+        df = to_pandas(rows, BalanceSheet)
+
+        assert isinstance(df.index, self.pd.PeriodIndex)
+        assert [str(period) for period in df.index] == ['2023Q4', '2024Q1']
+        assert list(df.columns) == ['symbol', 'asset']
+
+    def test_monthly(self) -> None:
+        rows = [{'year': 2024, 'month': 7, 'symbol': '2330', 'revenue': '256953058.00'}]
+
+        df = to_pandas(rows, Revenue)
+
+        assert [str(period) for period in df.index] == ['2024-07']
+        assert df['revenue'].dtype == 'float64'
+
+    def test_single_row(self) -> None:
+        df = to_pandas({'symbol': '2330', 'capital': '259303804580.00'}, StockCompany)
+
+        assert len(df) == 1
+        assert df.loc[0, 'capital'] == 259303804580.0
+
+
+class TestToArrow:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.pa = pytest.importorskip('pyarrow')
+        yield
+
+    def test_daily(self) -> None:
+        table = to_arrow(PRICES, StockPrice)
+
+        assert table.column_names == list(PRICES[0])
+        assert table.schema.field('date').type == self.pa.date32()
+        assert table.schema.field('symbol').type == self.pa.string()
+        assert table['close'].to_pylist() == [955.0, 931.0]
+
+    def test_missing_values(self) -> None:
+        rows = [
+            {'ex_dividend_date': '2021-01-22', 'dividend_amount': '3.05', 'name': 'A'},
+            {'ex_dividend_date': None, 'dividend_amount': None, 'name': None},
+        ]
+
+        table = to_arrow(rows, ETFDividend)
+
+        assert table.schema.field('ex_dividend_date').type == self.pa.date32()
+        assert table['dividend_amount'].to_pylist() == [3.05, None]
+        assert table['name'].null_count == 1
+
+    def test_int(self) -> None:
+        rows = [{'date': '2024-08-30', 'symbol': '2330', 'margin_buy': 36}]
+
+        table = to_arrow(rows, StockMarginBalance)
+
+        assert table.schema.field('margin_buy').type == self.pa.int64()
+
+    def test_empty(self) -> None:
+        table = to_arrow([], StockPrice)
+
+        assert table.num_rows == 0
+        assert table.schema.field('close').type == self.pa.float64()
+
+
+class TestToRecords:
+    def test_to_records(self) -> None:
+        records = to_records(PRICES, StockPrice)
+
+        assert records[0].date == date(2024, 7, 29)
+        assert records[0].symbol == '2330'
+        assert records[1].close == 931.0
+        assert records[1]._asdict()['volume'] == 30000000.0
+        assert not hasattr(records[0], '__dict__')
+
+    def test_record_type_is_shared(self) -> None:
+        records = to_records(PRICES, StockPrice)
+
+        assert type(records[0]) is type(records[1]) is get_record_type(StockPrice, tuple(PRICES[0]))
+        assert type(records[0]).__name__ == 'StockPrice'
+
+    def test_missing_values(self) -> None:
+        rows = [{'ex_dividend_date': None, 'dividend_amount': None, 'name': None}]
+
+        (record,) = to_records(rows, ETFDividend)
+
+        assert record == (None, None, None)
+
+    def test_single_row(self) -> None:
+        record = to_records({'symbol': '2330', 'capital': '259303804580.00'}, StockCompany)
+
+        assert record.capital == 259303804580.0
+
+    def test_int(self) -> None:
+        (record,) = to_records([{'symbol': '2330', 'margin_buy': 36}], StockMarginBalance)
+
+        assert record.margin_buy == 36
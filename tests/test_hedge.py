@@ -0,0 +1,49 @@
+import pytest
+
+from fmd.hedge import HedgePolicy
+
+
+def test_get_delay_needs_samples() -> None:
+    policy = HedgePolicy(min_samples=3)
+    policy.record(0.1)
+    policy.record(0.2)
+
+    assert policy.get_delay() is None
+
+
+def test_get_delay_percentile() -> None:
+    policy = HedgePolicy(percentile=95, min_delay=0.0, min_samples=1)
+    for i in range(1, 101):
+        policy.record(i / 100)
+
+    assert policy.get_delay() == 0.95
+
+
+def test_get_delay_min_delay() -> None:
+    policy = HedgePolicy(min_delay=0.5, min_samples=1)
+    policy.record(0.01)
+
+    assert policy.get_delay() == 0.5
+
+
+def test_window() -> None:
+    policy = HedgePolicy(percentile=50, min_delay=0.0, window=2, min_samples=1)
+    for latency in (10.0, 0.1, 0.1):
+        policy.record(latency)
+
+    assert policy.get_delay() == 0.1
+
+
+def test_allow_hedge_ratio() -> None:
+    policy = HedgePolicy(max_ratio=0.1)
+    for _ in range(20):
+        policy.get_delay()
+
+    assert [policy.allow_hedge() for _ in range(3)] == [True, True, False]
+    assert policy.hedges == 2
+
+
+@pytest.mark.parametrize('kwargs', [{'percentile': 100}, {'max_ratio': 1.5}])
+def test_invalid(kwargs) -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(**kwargs)
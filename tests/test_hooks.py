@@ -0,0 +1,161 @@
+import asyncio
+from json import dumps
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+
+from fmd import AsyncFmdApi, FmdApi
+from fmd.exceptions import RequestError
+from fmd.hooks import Hooks, RequestEvent, get_endpoint_template
+
+
+class RecordHooks(Hooks):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, int | None]] = []
+
+    def before_request(self, event: RequestEvent) -> None:
+        self.calls.append(('before_request', event.attempt, event.status_code))
+
+    def after_response(self, event: RequestEvent) -> None:
+        self.calls.append(('after_response', event.attempt, event.status_code))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.calls.append(('on_retry', event.attempt, event.status_code))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.calls.append(('on_error', event.attempt, event.status_code))
+
+
+def make_response(status_code: int = 200, data: object = 'result') -> MagicMock:
+    return MagicMock(
+        status_code=status_code,
+        headers={},
+        content=dumps({'status': 'success', 'msg': 'ok', 'data': data}).encode(),
+    )
+
+
+@pytest.mark.parametrize(
+    'path, expected',
+    [
+        ('/stock', '/stock'),
+        ('/stock/2330/price', '/stock/{symbol}/price'),
+        ('/etf/0050/profile?x=1', '/etf/{symbol}/profile'),
+        ('https://api.example.com/index/TAIEX/price', '/index/{symbol}/price'),
+    ],
+)
+def test_get_endpoint_template(path, expected) -> None:
+    assert get_endpoint_template(path) == expected
+
+
+def test_hooks_success(mock_send_request) -> None:
+    hooks = RecordHooks()
+    fa = FmdApi(hooks=[hooks])
+    mock_send_request.return_value = make_response()
+
+    fa.send_request('get', '/stock/2330/price')
+
+    assert hooks.calls == [('before_request', 0, None), ('after_response', 0, 200)]
+
+
+def test_hooks_retry(mocker, mock_send_request) -> None:
+    mocker.patch('time.sleep')
+    hooks = RecordHooks()
+    fa = FmdApi(hooks=[hooks])
+    mock_send_request.side_effect = [
+        requests.ConnectionError('Connection error'),
+        MagicMock(status_code=503, headers={}),
+        make_response(),
+    ]
+
+    fa.send_request('get', '/stock/2330/price', max_retries=3)
+
+    assert hooks.calls == [
+        ('before_request', 0, None),
+        ('on_retry', 0, None),
+        ('before_request', 1, None),
+        ('after_response', 1, 503),
+        ('on_retry', 1, 503),
+        ('before_request', 2, None),
+        ('after_response', 2, 200),
+    ]
+    endpoint = '/stock/{symbol}/price'
+    assert fa.metrics.retries == {endpoint: 2}
+    assert fa.metrics.requests == {
+        (endpoint, 'error'): 1,
+        (endpoint, '503'): 1,
+        (endpoint, '200'): 1,
+    }
+    assert fa.metrics.latency[endpoint].count == 3
+
+
+def test_hooks_error(mocker, mock_send_request) -> None:
+    mocker.patch('time.sleep')
+    hooks = RecordHooks()
+    fa = FmdApi(hooks=[hooks])
+    mock_send_request.side_effect = requests.Timeout('Read timed out')
+
+    with pytest.raises(requests.Timeout):
+        fa.send_request('get', '/stock/2330/price', max_retries=1)
+
+    assert [name for name, _, _ in hooks.calls] == [
+        'before_request',
+        'on_retry',
+        'before_request',
+        'on_error',
+    ]
+    assert fa.metrics.errors == {'/stock/{symbol}/price': 1}
+
+
+def test_hooks_error_response(mock_send_request) -> None:
+    hooks = RecordHooks()
+    fa = FmdApi(hooks=[hooks])
+    mock_send_request.return_value = MagicMock(
+        status_code=400, headers={}, content=dumps({'msg': 'error'}).encode()
+    )
+
+    with pytest.raises(RequestError):
+        fa.send_request('get', '/stock/2330/price')
+
+    assert hooks.calls == [
+        ('before_request', 0, None),
+        ('after_response', 0, 400),
+        ('on_error', 0, 400),
+    ]
+
+
+def test_hooks_timings(mock_send_request) -> None:
+    events = []
+
+    class Collect(Hooks):
+        def after_response(self, event: RequestEvent) -> None:
+            events.append(event)
+
+    fa = FmdApi(hooks=[Collect()])
+    res = make_response(data=[{'close': '1.0'}])
+    res.timings = {'connect': 0.1, 'wait': 0.2, 'download': 0.3}
+    mock_send_request.return_value = res
+
+    fa.send_request('get', '/stock/2330/price')
+
+    (event,) = events
+    assert event.timings.keys() == {'connect', 'wait', 'download', 'decode'}
+    assert event.decoded_bytes == len(res.content)
+    assert fa.metrics.phases[('/stock/{symbol}/price', 'wait')] == 0.2
+
+
+def test_hooks_async(mocker, mock_async_send_request) -> None:
+    mocker.patch('asyncio.sleep', new_callable=mocker.AsyncMock)
+    hooks = RecordHooks()
+    fa = AsyncFmdApi(hooks=[hooks])
+    mock_async_send_request.side_effect = [httpx.ConnectError('Connection error'), make_response()]
+
+    asyncio.run(fa.send_request('get', '/stock/2330/price'))
+
+    assert hooks.calls == [
+        ('before_request', 0, None),
+        ('on_retry', 0, None),
+        ('before_request', 1, None),
+        ('after_response', 1, 200),
+    ]
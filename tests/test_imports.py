@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+import fmd
+from fmd import resources
+
+HEAVY_MODULES = ['requests', 'urllib3', 'httpx', 'dateutil', 'asyncio', 'numpy', 'pandas']
+
+
+def get_imported(code: str, modules: list[str]) -> list[str]:
+    """Runs `code` in a new interpreter and returns which of `modules` it imported."""
+    check = f'import sys; print(",".join(m for m in {modules!r} if m in sys.modules))'
+    out = subprocess.run(
+        [sys.executable, '-c', f'{code}\n{check}'], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return out.split(',') if out else []
+
+
+@pytest.mark.parametrize(
+    'code',
+    [
+        pytest.param('import fmd', id='Package'),
+        pytest.param('from fmd import FmdApi; FmdApi()', id='Client'),
+        pytest.param('from fmd import FmdApi; FmdApi().stock.get("2330")', id='Resource'),
+    ],
+)
+def test_import_is_lazy(code) -> None:
+    assert get_imported(code, HEAVY_MODULES) == []
+
+
+def test_resources_are_loaded_on_access() -> None:
+    code = 'from fmd import FmdApi; FmdApi().etf'
+    modules = ['fmd.resources.stock.obj', 'fmd.resources.etf.obj', 'fmd.resources.index.obj']
+
+    assert get_imported(code, modules) == ['fmd.resources.etf.obj']
+
+
+def test_backend_is_created_on_first_use(mock_send_request) -> None:
+    from fmd.backend import RequestsBackend
+
+    fa = fmd.FmdApi()
+
+    assert '_client' not in vars(fa)
+    assert isinstance(fa._client, RequestsBackend)
+    assert fa._client is fa._client
+
+
+def test_lazy_attributes() -> None:
+    from fmd.client import AsyncFmdApi, FmdApi
+    from fmd.resources.stock.obj import StockManager
+
+    assert fmd.FmdApi is FmdApi
+    assert fmd.AsyncFmdApi is AsyncFmdApi
+    assert resources.StockManager is StockManager
+    assert {'FmdApi', 'AsyncFmdApi'} <= set(dir(fmd))
+    with pytest.raises(AttributeError):
+        fmd.Missing
+    with pytest.raises(AttributeError):
+        resources.Missing
@@ -0,0 +1,193 @@
+import gzip
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from fmd import FmdApi
+from fmd.hooks import Hooks, RequestEvent
+from fmd.metrics import ClientMetrics, Histogram, get_wire_bytes
+
+BODY = json.dumps(
+    {
+        'status': 'success',
+        'msg': 'ok',
+        'data': [{'date': '2024-01-02', 'symbol': '2330', 'close': '593.00'}] * 500,
+    }
+).encode()
+
+
+@pytest.fixture
+def gzip_server():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self) -> None:
+            gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+            body = gzip.compress(BODY) if gzipped else BODY
+            self.send_response(200)
+            if gzipped:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/stock/2330/price'
+    server.shutdown()
+
+
+def test_record_transfer() -> None:
+    metrics = ClientMetrics()
+
+    metrics.record_transfer('price', 100, 1000)
+    metrics.record_transfer('company', 50, 50)
+
+    assert (metrics.responses, metrics.wire_bytes, metrics.decoded_bytes) == (2, 150, 1050)
+    assert metrics.compression_ratio == 7.0
+    assert metrics.snapshot()['endpoints']['price'] == {
+        'responses': 1,
+        'wire_bytes': 100,
+        'decoded_bytes': 1000,
+    }
+
+
+def test_compression_ratio_empty() -> None:
+    assert ClientMetrics().compression_ratio == 1.0
+
+
+def test_get_wire_bytes() -> None:
+    assert get_wire_bytes(MagicMock(raw=MagicMock(tell=lambda: 10), content=b'x' * 20)) == 10
+    assert get_wire_bytes(MagicMock(raw=None, num_bytes_downloaded=5, content=b'x')) == 5
+    assert get_wire_bytes(MagicMock(spec=['content'], content=b'x' * 3)) == 3
+
+
+def test_compressed_response(gzip_server) -> None:
+    fa = FmdApi()
+
+    data = fa.send_request('get', gzip_server)
+
+    assert len(data) == 500
+    assert fa.metrics.decoded_bytes == len(BODY)
+    assert fa.metrics.wire_bytes == len(gzip.compress(BODY))
+    assert fa.metrics.endpoints['/stock/{symbol}/price']['responses'] == 1
+
+
+def test_compressed_response_http2_backend(gzip_server) -> None:
+    pytest.importorskip('h2')
+    from fmd.backend import HttpxBackend
+
+    fa = FmdApi(backend=HttpxBackend())
+
+    fa.send_request('get', gzip_server)
+
+    assert fa.metrics.decoded_bytes == len(BODY)
+    assert fa.metrics.wire_bytes < len(BODY) / 10
+
+
+def test_histogram() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float('inf'), 4)]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == float('inf')
+    assert Histogram().quantile(0.5) is None
+
+
+def test_cache_hit_ratio() -> None:
+    metrics = ClientMetrics()
+
+    metrics.record_cache('/stock', True)
+    metrics.record_cache('/stock', True)
+    metrics.record_cache('/etf', False)
+
+    assert metrics.cache_hit_ratio('/stock') == 1.0
+    assert metrics.cache_hit_ratio() == 2 / 3
+    assert metrics.cache_hit_ratio('/index') == 0.0
+
+
+def make_metrics() -> ClientMetrics:
+    metrics = ClientMetrics(buckets=(0.1, 1.0))
+    event = RequestEvent('get', '/stock/2330/price')
+    event.status_code, event.elapsed = 200, 0.5
+    event.timings = {'wait': 0.4}
+    event.wire_bytes, event.decoded_bytes = 10, 40
+    metrics.after_response(event)
+    metrics.record_cache('/stock/{symbol}/price', False)
+    return metrics
+
+
+def test_to_prometheus() -> None:
+    text = make_metrics().to_prometheus()
+
+    assert '# TYPE fmd_request_duration_seconds histogram' in text
+    assert (
+        'fmd_request_duration_seconds_bucket{endpoint="/stock/{symbol}/price",le="0.1"} 0' in text
+    )
+    assert (
+        'fmd_request_duration_seconds_bucket{endpoint="/stock/{symbol}/price",le="+Inf"} 1' in text
+    )
+    assert 'fmd_request_duration_seconds_count{endpoint="/stock/{symbol}/price"} 1' in text
+    assert 'fmd_requests_total{endpoint="/stock/{symbol}/price",status="200"} 1' in text
+    assert 'fmd_phase_seconds_total{endpoint="/stock/{symbol}/price",phase="wait"} 0.4' in text
+    assert 'fmd_cache_misses_total{endpoint="/stock/{symbol}/price"} 1' in text
+    assert 'fmd_response_wire_bytes_total{endpoint="/stock/{symbol}/price"} 10' in text
+    assert text.endswith('\n')
+
+
+def test_write_prometheus(tmp_path) -> None:
+    metrics = make_metrics()
+    path = tmp_path / 'fmd.prom'
+    buffer = io.StringIO()
+
+    metrics.write_prometheus(path, prefix='app')
+    metrics.write_prometheus(buffer, prefix='app')
+
+    assert path.read_text() == buffer.getvalue() == metrics.to_prometheus('app')
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_response_timings(gzip_server) -> None:
+    events = []
+
+    class Collect(Hooks):
+        def after_response(self, event: RequestEvent) -> None:
+            events.append(event)
+
+    fa = FmdApi(hooks=[Collect()])
+
+    fa.send_request('get', gzip_server)
+
+    (event,) = events
+    assert event.timings.keys() == {'connect', 'wait', 'download', 'decode'}
+    assert event.timings['connect'] > 0
+    assert fa.metrics.latency['/stock/{symbol}/price'].count == 1
+
+
+def test_response_timings_http2_backend(gzip_server) -> None:
+    pytest.importorskip('h2')
+    from fmd.backend import HttpxBackend
+
+    events = []
+
+    class Collect(Hooks):
+        def after_response(self, event: RequestEvent) -> None:
+            events.append(event)
+
+    fa = FmdApi(backend=HttpxBackend(), hooks=[Collect()])
+
+    fa.send_request('get', gzip_server)
+
+    (event,) = events
+    assert event.timings.keys() == {'connect', 'wait', 'download', 'decode'}
@@ -0,0 +1,86 @@
+import os
+import threading
+
+import pytest
+
+from fmd.ratelimit import FileTokenBucket, TokenBucket
+
+
+class TestTokenBucket:
+    def test_burst(self) -> None:
+        bucket = TokenBucket(rate=1, burst=3)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert 0.9 < delays[3] <= 1.0
+
+    def test_reservations_are_spread(self) -> None:
+        bucket = TokenBucket(rate=10, burst=1)
+
+        delays = [bucket.reserve() for _ in range(5)]
+
+        assert delays == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4], abs=0.01)
+
+    def test_max_wait(self) -> None:
+        bucket = TokenBucket(rate=10, burst=1)
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=0.05) is None
+        assert 0.09 < bucket.reserve(max_wait=0.2) <= 0.1
+        assert 0.19 < bucket.reserve() <= 0.2
+
+    def test_thread_safe(self) -> None:
+        bucket = TokenBucket(rate=100, burst=1)
+        delays = []
+
+        def reserve():
+            for _ in range(50):
+                delays.append(bucket.reserve())
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(delays) == pytest.approx(1.99, abs=0.05)
+
+    @pytest.mark.parametrize(['rate', 'burst'], [(0, 1), (1, 0)])
+    def test_invalid(self, rate, burst) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, burst=burst)
+
+
+class TestFileTokenBucket:
+    def test_shared_state(self, tmp_path) -> None:
+        path = os.fspath(tmp_path / 'fmd.bucket')
+        bucket_a = FileTokenBucket(rate=1, burst=2, path=path)
+        bucket_b = FileTokenBucket(rate=1, burst=2, path=path)
+
+        assert bucket_a.reserve() == 0.0
+        assert bucket_b.reserve() == 0.0
+        assert 0.9 < bucket_a.reserve() <= 1.0
+        assert 1.9 < bucket_b.reserve() <= 2.0
+
+    def test_max_wait(self, tmp_path) -> None:
+        path = os.fspath(tmp_path / 'fmd.bucket')
+        bucket_a = FileTokenBucket(rate=1, burst=1, path=path)
+        bucket_b = FileTokenBucket(rate=1, burst=1, path=path)
+        bucket_a.reserve()
+
+        assert bucket_b.reserve(max_wait=0.5) is None
+        assert 0.9 < bucket_a.reserve() <= 1.0
+
+    def test_shared_between_processes(self, tmp_path) -> None:
+        path = os.fspath(tmp_path / 'fmd.bucket')
+        bucket = FileTokenBucket(rate=1, burst=1, path=path)
+        bucket.reserve()
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if bucket.reserve() > 0.9 else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert bucket.reserve() > 1.9
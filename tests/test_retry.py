@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from fmd.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.policy = RetryPolicy(max_retries=3, backoff_base=1.0, backoff_max=5.0, deadline=60)
+        self.retryable_exceptions = (requests.ConnectionError,)
+        yield
+
+    @pytest.mark.parametrize('retries', [0, 1, 2, 10])
+    def test_get_delay(self, retries) -> None:
+        delay = self.policy.get_delay(retries)
+
+        assert 0 <= delay <= min(5.0, 2**retries)
+
+    def test_get_delay_retry_after(self) -> None:
+        assert self.policy.get_delay(0, retry_after=7.0) == 7.0
+
+    def test_next_delay_retryable_exception(self) -> None:
+        delay = self.policy.next_delay(
+            0,
+            3,
+            self.policy.start(),
+            exc=requests.ConnectionError(),
+            retryable_exceptions=self.retryable_exceptions,
+        )
+
+        assert delay is not None
+
+    def test_next_delay_not_retryable_exception(self) -> None:
+        delay = self.policy.next_delay(
+            0, 3, None, exc=KeyError(), retryable_exceptions=self.retryable_exceptions
+        )
+
+        assert delay is None
+
+    @pytest.mark.parametrize(
+        ['status_code', 'retryable'],
+        argvalues=[(200, False), (400, False), (404, False), (429, True), (502, True)],
+    )
+    def test_next_delay_response(self, status_code, retryable) -> None:
+        res = MagicMock(status_code=status_code, headers={})
+
+        delay = self.policy.next_delay(0, 3, None, res=res)
+
+        assert (delay is not None) is retryable
+
+    def test_next_delay_max_retries(self) -> None:
+        res = MagicMock(status_code=503, headers={})
+
+        assert self.policy.next_delay(3, 3, None, res=res) is None
+
+    def test_next_delay_past_deadline(self) -> None:
+        res = MagicMock(status_code=503, headers={'Retry-After': '61'})
+
+        assert self.policy.next_delay(0, 3, self.policy.start(), res=res) is None
+
+    def test_get_timeout(self) -> None:
+        assert self.policy.get_timeout(5.0, None) == 5.0
+        assert self.policy.get_timeout(5.0, self.policy.start()) == 5.0
+        assert 0 < self.policy.get_timeout(None, self.policy.start()) <= 60
+
+
+@pytest.mark.parametrize(
+    ['value', 'expected'],
+    argvalues=[
+        pytest.param(None, None, id='Missing'),
+        pytest.param('3', 3.0, id='Seconds'),
+        pytest.param('-1', 0.0, id='Negative seconds'),
+        pytest.param('soon', None, id='Invalid'),
+    ],
+)
+def test_parse_retry_after(value, expected) -> None:
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert 25 <= delay <= 30
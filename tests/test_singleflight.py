@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fmd.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    def test_coalesces_concurrent_calls(self) -> None:
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def func(value):
+            calls.append(value)
+            started.set()
+            release.wait(5)
+            return [value]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flight.do, 'key', func, 1)
+            started.wait(5)
+            followers = [executor.submit(flight.do, 'key', func, 2) for _ in range(3)]
+            while flight.shared < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert calls == [1]
+        assert results == [[1]] * 4
+        assert all(result is results[0] for result in results)
+
+    def test_shares_exception(self) -> None:
+        flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def func():
+            started.set()
+            release.wait(5)
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, 'key', func)
+            started.wait(5)
+            follower = executor.submit(flight.do, 'key', func)
+            while flight.shared < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_sequential_calls_are_not_shared(self) -> None:
+        flight = SingleFlight()
+
+        assert flight.do('key', lambda: 1) == 1
+        assert flight.do('key', lambda: 2) == 2
+        assert flight.shared == 0
+
+
+class TestAsyncSingleFlight:
+    def test_coalesces_concurrent_calls(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            return await asyncio.gather(
+                flight.do('a', func, 1), flight.do('a', func, 2), flight.do('b', func, 3)
+            )
+
+        assert asyncio.run(run()) == [1, 1, 3]
+        assert calls == [1, 3]
+        assert flight.shared == 1
+
+    def test_shares_exception(self) -> None:
+        flight = AsyncSingleFlight()
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        async def run():
+            return await asyncio.gather(
+                flight.do('a', func), flight.do('a', func), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight._calls == {}
+
+    def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def func():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'result'
+
+        async def run():
+            leader = asyncio.create_task(flight.do('a', func))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do('a', func))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await asyncio.gather(leader, follower, return_exceptions=True)
+
+        leader, follower = asyncio.run(run())
+
+        assert isinstance(leader, asyncio.CancelledError)
+        assert follower == 'result'
+        assert calls == [1]
+        assert flight._calls == {}
@@ -0,0 +1,135 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from fmd.store import PeriodCache, RangeCache, iter_periods, merge_intervals, to_date
+
+
+def make_rows(start: date, end: date) -> list[dict]:
+    days = (end - start).days + 1
+    return [{'date': (start + timedelta(days=i)).isoformat()} for i in range(days)]
+
+
+@pytest.mark.parametrize('value', ['2024-01-02', date(2024, 1, 2), datetime(2024, 1, 2, 15, 30)])
+def test_to_date(value) -> None:
+    assert to_date(value) == date(2024, 1, 2)
+
+
+def test_merge_intervals() -> None:
+    intervals = [
+        (date(2024, 3, 1), date(2024, 3, 31)),
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 2, 10)),
+        (date(2024, 1, 15), date(2024, 1, 20)),
+    ]
+
+    assert merge_intervals(intervals) == [
+        (date(2024, 1, 1), date(2024, 2, 10)),
+        (date(2024, 3, 1), date(2024, 3, 31)),
+    ]
+
+
+class TestRangeCache:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.cache = RangeCache()
+        self.path = '/stock/2330/price'
+        yield
+
+    def test_get_gaps_empty(self) -> None:
+        start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+        assert self.cache.get_gaps(self.path, start, end) == [(start, end)]
+
+    def test_get_gaps(self) -> None:
+        self.cache.update(self.path, date(2024, 1, 10), date(2024, 1, 20), [])
+        self.cache.update(self.path, date(2024, 2, 1), date(2024, 2, 5), [])
+
+        gaps = self.cache.get_gaps(self.path, date(2024, 1, 1), date(2024, 2, 28))
+
+        assert gaps == [
+            (date(2024, 1, 1), date(2024, 1, 9)),
+            (date(2024, 1, 21), date(2024, 1, 31)),
+            (date(2024, 2, 6), date(2024, 2, 28)),
+        ]
+
+    def test_get_gaps_covered(self) -> None:
+        self.cache.update(self.path, date(2024, 1, 1), date(2024, 1, 31), [])
+
+        assert self.cache.get_gaps(self.path, date(2024, 1, 5), date(2024, 1, 25)) == []
+
+    def test_today_is_not_covered(self) -> None:
+        today = datetime.today().date()
+        start = today - timedelta(days=5)
+        self.cache.update(self.path, start, today, make_rows(start, today))
+
+        assert self.cache.get_gaps(self.path, start, today) == [(today, today)]
+
+    def test_read(self) -> None:
+        self.cache.update(
+            self.path,
+            date(2024, 1, 5),
+            date(2024, 1, 10),
+            make_rows(date(2024, 1, 5), date(2024, 1, 10)),
+        )
+        self.cache.update(
+            self.path,
+            date(2024, 1, 1),
+            date(2024, 1, 6),
+            make_rows(date(2024, 1, 1), date(2024, 1, 6)),
+        )
+
+        rows = self.cache.read(self.path, date(2024, 1, 3), date(2024, 1, 8))
+
+        assert [row['date'] for row in rows] == [f'2024-01-0{i}' for i in range(3, 9)]
+
+    def test_maxsize(self) -> None:
+        cache = RangeCache(maxsize=2)
+        start, end = date(2024, 1, 1), date(2024, 1, 2)
+        for symbol in ['2330', '2317']:
+            cache.update(f'/stock/{symbol}/price', start, end, make_rows(start, end))
+        cache.get_gaps('/stock/2330/price', start, end)
+
+        cache.update('/stock/2454/price', start, end, make_rows(start, end))
+
+        assert len(cache) == 2
+        assert cache.get_gaps('/stock/2317/price', start, end) == [(start, end)]
+        assert cache.read('/stock/2317/price', start, end) == []
+        assert cache.get_gaps('/stock/2330/price', start, end) == []
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError):
+            RangeCache(maxsize=0)
+
+
+def test_iter_periods() -> None:
+    assert iter_periods(2023, 3, 2024, 2, 4) == [(2023, 3), (2023, 4), (2024, 1), (2024, 2)]
+    assert iter_periods(2023, 12, 2024, 1, 12) == [(2023, 12), (2024, 1)]
+
+
+class TestPeriodCache:
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        self.cache = PeriodCache()
+        self.key = 'GET /stock/2330/balance-sheet'
+        self.periods = iter_periods(2023, 1, 2023, 4, 4)
+        self.rows = [{'year': 2023, 'quarter': q, 'asset': str(q)} for q in (1, 2, 3)]
+        yield
+
+    def test_update(self) -> None:
+        fetched = self.cache.update(self.key, 'quarter', self.periods, self.rows)
+
+        assert fetched == self.rows
+        assert self.cache.get_missing(self.key, self.periods) == [(2023, 3), (2023, 4)]
+        assert self.cache.read(self.key, self.periods) == self.rows[:2]
+
+    def test_update_without_rows(self) -> None:
+        assert self.cache.update(self.key, 'quarter', self.periods, []) == []
+        assert self.cache.get_missing(self.key, self.periods) == self.periods
+
+    def test_update_ignores_other_periods(self) -> None:
+        rows = self.rows + [{'year': 2024, 'quarter': 1}]
+
+        fetched = self.cache.update(self.key, 'quarter', self.periods, rows)
+
+        assert fetched == self.rows